@@ -19,12 +19,22 @@ class Config(BaseSettings):
 
 	tmp_dir: str = "/tmp"
 
+	save_cache_max_bytes: int = 128 * 1024 * 1024
+
+	# Processes parsing unit atom files during a scan, 1 parses in the scanning process
+	unit_parser_workers: int = 1
+
 	data_archive_path: str = "{game_path}/data/data.kfs"
 	session_archives_pattern: str = "{game_path}/sessions/{session}/*.kfs"
 
 	data_path: str = "{game_path}/data"
 	session_path: str = "{game_path}/sessions/{session}"
 
+	# Serve game files straight from the archives instead of extracting them to tmp_dir
+	read_archives_in_place: bool = True
+	# Re-extract only archives and loose files changed since the previous extraction
+	incremental_extraction: bool = True
+
 	localization_config: list[LocalizationConfig] = [
 		LocalizationConfig(file="items", tag="items"),
 		LocalizationConfig(file="units", tag="units"),
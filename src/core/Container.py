@@ -10,6 +10,7 @@ from src.domain.app.interfaces.ISettingsService import ISettingsService
 from src.domain.app.interfaces.ITranslationService import ITranslationService
 from src.domain.game.interfaces.IItemRepository import IItemRepository
 from src.domain.game.interfaces.IItemSetRepository import IItemSetRepository
+from src.domain.game.interfaces.IKbIdIndex import IKbIdIndex
 from src.domain.game.interfaces.IShopFactory import IShopFactory
 from src.domain.game.interfaces.ILocalizationRepository import ILocalizationRepository
 from src.domain.game.interfaces.IProfileGameDataSyncerService import IProfileGameDataSyncerService
@@ -19,7 +20,9 @@ from src.domain.game.interfaces.ISaveFileService import ISaveFileService
 from src.domain.app.interfaces.ISchemaManagementService import ISchemaManagementService
 from src.domain.game.interfaces.IShopInventoryRepository import IShopInventoryRepository
 from src.domain.game.interfaces.IHeroInventoryRepository import IHeroInventoryRepository
+from src.domain.game.interfaces.ILocalizationCache import ILocalizationCache
 from src.domain.game.interfaces.ISpellRepository import ISpellRepository
+from src.domain.game.interfaces.ITransactionManager import ITransactionManager
 from src.domain.game.interfaces.IUnitRepository import IUnitRepository
 
 
@@ -50,6 +53,9 @@ class Container(containers.DeclarativeContainer):
 	profile_repository = providers.AbstractSingleton(IProfileRepository)
 	spell_repository = providers.AbstractSingleton(ISpellRepository)
 	unit_repository = providers.AbstractSingleton(IUnitRepository)
+	kb_id_index = providers.AbstractSingleton(IKbIdIndex)
+	localization_cache = providers.AbstractSingleton(ILocalizationCache)
+	transaction_manager = providers.AbstractSingleton(ITransactionManager)
 
 	# Services
 	game_path_service = providers.AbstractFactory(IGamePathService)
@@ -75,6 +81,7 @@ class Container(containers.DeclarativeContainer):
 	game_data_extractor = providers.AbstractSingleton()
 	kfs_extractor = providers.AbstractSingleton()
 	kfs_reader = providers.AbstractSingleton()
+	kfs_file_system = providers.AbstractSingleton()
 	kfs_items_parser = providers.AbstractSingleton()
 	kfs_localization_parser = providers.AbstractSingleton()
 	kfs_spells_parser = providers.AbstractSingleton()
@@ -20,6 +20,7 @@ from src.domain.game.repositories.mappers.AtomMapMapper import AtomMapMapper
 from src.domain.game.services.ProfileGameDataSyncerService import ProfileGameDataSyncerService
 from src.utils.parsers.game_data.GameDataExtractor import GameDataExtractor
 from src.utils.parsers.game_data.KFSExtractor import KFSExtractor
+from src.utils.parsers.game_data.KFSFileSystem import KFSFileSystem
 from src.utils.parsers.game_data.KFSReader import KFSReader
 from src.utils.parsers.game_data.KFSItemsParser import KFSItemsParser
 from src.utils.parsers.game_data.KFSLocalizationParser import KFSLocalizationParser
@@ -35,6 +36,7 @@ from src.domain.game.repositories.ShopInventoryRepository import ShopInventoryRe
 from src.domain.game.repositories.HeroInventoryRepository import HeroInventoryRepository
 from src.domain.game.repositories.UnitRepository import UnitRepository
 from src.domain.game.repositories.SpellRepository import SpellRepository
+from src.domain.game.repositories.TransactionManager import TransactionManager
 from src.domain.game.factories.LocFactory import LocFactory
 from src.domain.game.factories.SpellFactory import SpellFactory
 from src.domain.game.factories.UnitFactory import UnitFactory
@@ -45,6 +47,8 @@ from src.domain.app.services.SettingsService import SettingsService
 from src.domain.app.services.TranslationService import TranslationService
 from src.domain.game.services.ItemsAndSetsScannerService import ItemsAndSetsScannerService
 from src.domain.game.services.ItemService import ItemService
+from src.domain.game.services.KbIdIndex import KbIdIndex
+from src.domain.game.services.LocalizationCache import LocalizationCache
 from src.domain.game.services.ShopInventoryService import ShopInventoryService
 from src.domain.game.services.LocalizationScannerService import LocalizationScannerService
 from src.domain.game.services.ScannerService import ScannerService
@@ -56,6 +60,7 @@ from src.domain.game.services.ProfileService import ProfileService
 from src.domain.game.services.SaveFileService import SaveFileService
 from src.utils.db import create_db_engine, configure_game_databases
 from src.domain.base.repositories.mappers.base import Base
+from src.utils.parsers.save_data.CachingSaveFileDecompressor import CachingSaveFileDecompressor
 from src.utils.parsers.save_data.SaveDataParser import SaveDataParser
 from src.utils.parsers.save_data.SaveFileDecompressor import SaveFileDecompressor
 from src.utils.parsers.save_data.HeroSaveParser import HeroSaveParser
@@ -155,9 +160,13 @@ class DefaultInstaller:
 		self._container.kfs_extractor.override(providers.Singleton(KFSExtractor))
 		self._container.game_data_extractor.override(providers.Singleton(GameDataExtractor))
 		self._container.kfs_reader.override(providers.Singleton(KFSReader))
+		self._container.kfs_file_system.override(providers.Singleton(KFSFileSystem))
 		self._container.kfs_localization_parser.override(providers.Singleton(KFSLocalizationParser))
 		self._container.kfs_items_parser.override(providers.Singleton(KFSItemsParser))
-		self._container.kfs_unit_parser.override(providers.Singleton(KFSUnitParser))
+		self._container.kfs_unit_parser.override(providers.Singleton(
+			KFSUnitParser,
+			workers=self._container.config().unit_parser_workers
+		))
 		self._container.kfs_spells_parser.override(providers.Singleton(KFSSpellsParser))
 		self._container.loc_factory.override(providers.Singleton(LocFactory))
 		self._container.spell_factory.override(providers.Singleton(SpellFactory))
@@ -165,7 +174,11 @@ class DefaultInstaller:
 		self._container.shop_factory.override(providers.Factory(ShopFactory))
 
 	def _install_save_file_parsers(self):
-		self._container.save_file_decompressor.override(providers.Singleton(SaveFileDecompressor))
+		self._container.save_file_decompressor.override(providers.Singleton(
+			CachingSaveFileDecompressor,
+			decompressor=providers.Singleton(SaveFileDecompressor),
+			max_bytes=self._container.config().save_cache_max_bytes
+		))
 		self._container.save_data_parser.override(providers.Singleton(SaveDataParser))
 		self._container.hero_save_parser.override(providers.Singleton(HeroSaveParser))
 
@@ -180,6 +193,9 @@ class DefaultInstaller:
 		self._container.profile_repository.override(providers.Singleton(ProfileRepository))
 		self._container.spell_repository.override(providers.Singleton(SpellRepository))
 		self._container.unit_repository.override(providers.Singleton(UnitRepository))
+		self._container.kb_id_index.override(providers.Singleton(KbIdIndex))
+		self._container.localization_cache.override(providers.Singleton(LocalizationCache))
+		self._container.transaction_manager.override(providers.Singleton(TransactionManager))
 		self._container.atom_map_repository.override(providers.Singleton(
 			EntityRepository,
 			entity_type=AtomMap,
@@ -5,6 +5,8 @@ from src.domain.app.interfaces.IGameRepository import IGameRepository
 from src.domain.app.interfaces.IGameService import IGameService
 from src.domain.app.interfaces.ISchemaManagementService import ISchemaManagementService
 from src.domain.app.entities.Game import Game
+from src.domain.game.interfaces.IKbIdIndex import IKbIdIndex
+from src.domain.game.interfaces.ILocalizationCache import ILocalizationCache
 
 
 class GameService(IGameService):
@@ -12,10 +14,14 @@ class GameService(IGameService):
 	def __init__(
 		self,
 		game_repository: IGameRepository = Provide[Container.game_repository],
-		schema_mgmt: ISchemaManagementService = Provide[Container.schema_management_service]
+		schema_mgmt: ISchemaManagementService = Provide[Container.schema_management_service],
+		kb_id_index: IKbIdIndex = Provide[Container.kb_id_index],
+		localization_cache: ILocalizationCache = Provide[Container.localization_cache]
 	):
 		self._game_repository = game_repository
 		self._schema_mgmt = schema_mgmt
+		self._kb_id_index = kb_id_index
+		self._localization_cache = localization_cache
 
 	def create_game(
 		self,
@@ -99,6 +105,10 @@ class GameService(IGameService):
 		# Delete game record from public.game table
 		self._game_repository.delete(game_id)
 
+		# Game IDs may be reused, drop identifiers and texts of the deleted game
+		self._kb_id_index.invalidate(game_id)
+		self._localization_cache.invalidate(game_id)
+
 	def prepare_rescan(self, game_id: int) -> None:
 		"""
 		Prepare game for rescan by dropping all tables and recreating schema
@@ -108,3 +118,5 @@ class GameService(IGameService):
 		:return:
 		"""
 		self._schema_mgmt.recreate_game_schema(game_id)
+		self._kb_id_index.invalidate(game_id)
+		self._localization_cache.invalidate(game_id)
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from contextvars import ContextVar
-from typing import TypeVar, Generic, Optional
+from typing import TypeVar, Generic, Iterable, Optional
 from dependency_injector.wiring import Provide, inject
+from sqlalchemy import and_, bindparam, delete, false, insert, literal_column, select, update
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
@@ -11,7 +13,7 @@ from src.domain.exceptions import (
 	DuplicateEntityException,
 	DatabaseOperationException
 )
-from src.utils.db import get_game_database_registry
+from src.utils.db import build_search_match, index_search_text, search_text_table
 from src.web.dependencies.game_context import GameContext
 
 TEntity = TypeVar("TEntity")
@@ -35,15 +37,41 @@ class CrudRepository(ABC, Generic[TEntity, TMapper]):
 		Get session for the active game database if a game context is set,
 		otherwise a session on the shared application database
 
+		Within a session scope of the game context its shared session is
+		returned (and left open when the ``with`` block exits).
+
 		:return:
-			Database session
+			Database session context manager
 		"""
 		context = GAME_CONTEXT.get()
 		if context:
-			factory = get_game_database_registry().get_session_factory(context.schema_name)
-			return factory()
+			if context.session is not None:
+				return self._reuse_session(context.session)
+			return context.open_session()
 		return self._session_factory()
 
+	@staticmethod
+	@contextmanager
+	def _reuse_session(session: Session):
+		"""
+		Use a shared session like a session of its own
+
+		Errors roll back the shared session, and loaded mappers are
+		released afterwards so later calls never see stale instances.
+
+		:param session:
+			Shared session
+		:return:
+			The shared session
+		"""
+		try:
+			yield session
+		except BaseException:
+			session.rollback()
+			raise
+		finally:
+			session.expunge_all()
+
 	@abstractmethod
 	def _entity_to_mapper(self, entity: TEntity) -> TMapper:
 		"""
@@ -67,6 +95,19 @@ class CrudRepository(ABC, Generic[TEntity, TMapper]):
 		"""
 		pass
 
+	def _mappers_to_entities(self, mappers: list[TMapper]) -> list[TEntity]:
+		"""
+		Convert many mappers to entities
+
+		Override to load related data of all mappers at once.
+
+		:param mappers:
+			Mappers to convert
+		:return:
+			Entity instances in mapper order
+		"""
+		return [self._mapper_to_entity(m) for m in mappers]
+
 	@abstractmethod
 	def _get_entity_type_name(self) -> str:
 		"""
@@ -132,28 +173,51 @@ class CrudRepository(ABC, Generic[TEntity, TMapper]):
 					original_exception=e
 				)
 
-	def _create_batch(self, entities: list[TEntity]) -> list[TEntity]:
+	def _create_batch(self, entities: list[TEntity], return_entities: bool = True) -> list[TEntity] | int:
 		"""
 		Create multiple entities in a batch with error handling
 
+		Rows are written with one executemany INSERT, returning the values of
+		the table's autoincrement column, and created entities are built from
+		the inserted values and returned IDs, without reading the rows back.
+
 		:param entities:
 			List of entities to create
+		:param return_entities:
+			If False, skip building created entities and return their count
 		:return:
-			List of created entities with database IDs
+			List of created entities with database IDs, or number of created
+			entities if return_entities is False
 		:raises DuplicateEntityException:
 			When any entity with unique constraint already exists
 		:raises DatabaseOperationException:
 			When database operation fails
 		"""
-		mappers = [self._entity_to_mapper(entity) for entity in entities]
+		if not entities:
+			return [] if return_entities else 0
+
+		mapper_type = type(self._entity_to_mapper(entities[0]))
+		rows = [self._entity_to_insert_row(entity, mapper_type) for entity in entities]
+		table = mapper_type.__table__
+		id_column = table.autoincrement_column
 
 		with self._get_session() as session:
 			try:
-				session.add_all(mappers)
+				if id_column is None:
+					# Primary key values come with the rows
+					session.execute(insert(table), rows)
+				else:
+					# sort_by_parameter_order would make SQLite insert row by row
+					# instead of in batches of many rows; rows written in one
+					# transaction get ascending rowids in parameter order, so the
+					# returned IDs are sorted instead
+					statement = insert(table).returning(id_column)
+					ids = sorted(session.execute(statement, rows).scalars().all())
+					rows = [{**row, id_column.key: mapper_id} for mapper_id, row in zip(ids, rows)]
 				session.commit()
-				for mapper in mappers:
-					session.refresh(mapper)
-				return [self._mapper_to_entity(m) for m in mappers]
+				if not return_entities:
+					return len(rows)
+				return self._mappers_to_entities([mapper_type(**row) for row in rows])
 			except IntegrityError as e:
 				session.rollback()
 				error_msg = str(e.orig)
@@ -176,6 +240,192 @@ class CrudRepository(ABC, Generic[TEntity, TMapper]):
 					original_exception=e
 				)
 
+	def _get_ids_by_kb_ids(
+		self,
+		mapper_type: type[TMapper],
+		kb_ids: Iterable[str] | None = None
+	) -> dict[str, int]:
+		"""
+		Resolve game identifiers to database IDs with a single query
+
+		:param mapper_type:
+			Mapper with kb_id and id columns
+		:param kb_ids:
+			Game identifiers, or None to resolve every entity
+		:return:
+			Dictionary mapping kb_id to ID; unknown kb_ids are omitted
+		"""
+		query = select(mapper_type.kb_id, mapper_type.id)
+
+		if kb_ids is not None:
+			kb_ids = list(set(kb_ids))
+			if not kb_ids:
+				return {}
+			query = query.where(mapper_type.kb_id.in_(kb_ids))
+
+		with self._get_session() as session:
+			return dict(session.execute(query).all())
+
+	def _index_search_text(self, mapper_type: type[TMapper]) -> None:
+		"""
+		Rebuild the full-text index rows of a table
+
+		:param mapper_type:
+			Mapper whose table declares ``search_text`` info
+		:return:
+		"""
+		with self._get_session() as session:
+			try:
+				index_search_text(session.connection(), [mapper_type.__table__])
+				session.commit()
+			except SQLAlchemyError as e:
+				session.rollback()
+				raise DatabaseOperationException(
+					f"Failed to index {self._get_entity_type_name()} texts: {str(e)}"
+				) from e
+
+	def _search_text_match(self, mapper_type: type[TMapper], query: str):
+		"""
+		Build a subquery of full-text index matches
+
+		Every word of the query matches as a word prefix; ``rank`` orders
+		the best matches first.
+
+		:param mapper_type:
+			Mapper whose table declares ``search_text`` info
+		:param query:
+			User search query
+		:return:
+			Subquery with ``entity_id`` and ``rank`` columns
+		"""
+		match = build_search_match(query)
+		return select(search_text_table.c.entity_id, search_text_table.c.rank).where(
+			search_text_table.c.entity_type == mapper_type.__tablename__,
+			literal_column(search_text_table.name).op("MATCH")(match) if match else false()
+		).subquery()
+
+	def _sync_rows(
+		self,
+		mapper_type: type[TMapper],
+		scope: list,
+		entities: list[TEntity]
+	) -> tuple[int, int, int]:
+		"""
+		Make rows selected by scope equal to entities, writing only the difference
+
+		Rows are matched by primary key: missing rows are inserted, rows absent
+		from entities are deleted and rows with changed non-key columns are
+		updated, all in one transaction.
+
+		:param mapper_type:
+			Mapper of the table to sync
+		:param scope:
+			Filter clauses selecting rows owned by entities (e.g. profile_id == 1)
+		:param entities:
+			Desired rows, each matching scope and unique by primary key
+		:return:
+			Numbers of added, removed and updated rows
+		:raises DatabaseOperationException:
+			When database operation fails
+		"""
+		table = mapper_type.__table__
+		key_columns = list(table.primary_key.columns)
+		value_columns = [c for c in table.columns if not c.primary_key]
+
+		desired: dict[tuple, tuple] = {}
+		for entity in entities:
+			row = self._entity_to_row(entity, mapper_type)
+			desired[tuple(row[c.key] for c in key_columns)] = tuple(row[c.key] for c in value_columns)
+
+		key_clause = and_(*(c.is_not_distinct_from(bindparam(f"key_{c.key}")) for c in key_columns))
+		key_count = len(key_columns)
+
+		def params(key: tuple, values: tuple = ()) -> dict:
+			row = {f"key_{c.key}": v for c, v in zip(key_columns, key)}
+			row.update((f"value_{c.key}", v) for c, v in zip(value_columns, values))
+			return row
+
+		with self._get_session() as session:
+			try:
+				connection = session.connection()
+				existing = {
+					tuple(row[:key_count]): tuple(row[key_count:])
+					for row in connection.execute(select(*key_columns, *value_columns).where(*scope))
+				}
+
+				added = [key for key in desired if key not in existing]
+				removed = [key for key in existing if key not in desired]
+				updated = [key for key, values in desired.items() if key in existing and existing[key] != values]
+
+				if removed:
+					connection.execute(delete(table).where(key_clause), [params(key) for key in removed])
+				if updated:
+					connection.execute(
+						update(table).where(key_clause).values(
+							{c.key: bindparam(f"value_{c.key}") for c in value_columns}
+						),
+						[params(key, desired[key]) for key in updated]
+					)
+				if added:
+					connection.execute(insert(table), [
+						dict(zip((c.key for c in (*key_columns, *value_columns)), (*key, *desired[key])))
+						for key in added
+					])
+
+				session.commit()
+				return len(added), len(removed), len(updated)
+			except SQLAlchemyError as e:
+				session.rollback()
+				raise DatabaseOperationException(
+					operation=f"sync {self._get_entity_type_name()}",
+					details=str(e),
+					original_exception=e
+				)
+
+	def _entity_to_row(self, entity: TEntity, mapper_type: type[TMapper]) -> dict:
+		"""
+		Convert entity to column values of its table row
+
+		Builds a mapper through _entity_to_mapper; repositories whose entity
+		fields match the table columns may override it to skip the mapper.
+
+		:param entity:
+			Entity to convert
+		:param mapper_type:
+			Mapper of the table
+		:return:
+			Column values by column key
+		"""
+		mapper = self._entity_to_mapper(entity)
+		return {c.key: getattr(mapper, c.key) for c in mapper_type.__table__.columns}
+
+	def _entity_to_insert_row(self, entity: TEntity, mapper_type: type[TMapper]) -> dict:
+		"""
+		Convert new entity to column values for a Core INSERT
+
+		The autoincrement column is left to the database; missing values of
+		columns with a scalar default get the default, as with the ORM.
+
+		:param entity:
+			Entity to convert
+		:param mapper_type:
+			Mapper of the table
+		:return:
+			Column values by column key
+		"""
+		values = self._entity_to_row(entity, mapper_type)
+
+		table = mapper_type.__table__
+		row = {}
+		for column in table.columns:
+			if column is table.autoincrement_column:
+				continue
+			value = values.get(column.key)
+			if value is None and column.default is not None and column.default.is_scalar:
+				value = column.default.arg
+			row[column.key] = value
+		return row
+
 	def _delete_by_query(self, query) -> None:
 		"""
 		Delete entities by query with error handling
@@ -9,14 +9,22 @@ class ProfileSyncResult(BaseModel):
 	hero_inventory: 'ProfileSyncHeroInventoryResult'
 
 
+class InventoryChanges(BaseModel):
+	added: int = 0
+	removed: int = 0
+	updated: int = 0
+
+
 class ProfileSyncShopResult(BaseModel):
 	items: int
 	spells: int
 	units: int
 	garrison: int
 	missed_data: MissedShopsData | None = None
+	changes: InventoryChanges | None = None
 
 
 class ProfileSyncHeroInventoryResult(BaseModel):
 	items: int
 	missed_data: MissedHeroInventoryData | None = None
+	changes: InventoryChanges | None = None
@@ -9,3 +9,4 @@ class ScanResults:
 	localizations: int
 	spells: int
 	units: int
+	extraction_skipped: bool = False
@@ -2,6 +2,7 @@ from datetime import datetime
 
 from src.domain.app.entities.Game import Game
 from src.domain.base.entities.BaseEntity import BaseEntity
+from src.domain.game.dto.ProfileSyncResult import ProfileSyncResult
 from src.domain.game.entities.MissedShopsData import MissedShopsData
 
 
@@ -14,5 +15,7 @@ class ProfileEntity(BaseEntity):
 	last_scan_time: datetime | None = None
 	last_save_timestamp: int | None = None
 	last_corrupted_data: MissedShopsData | None = None
+	last_save_digest: str | None = None
+	last_sync_result: ProfileSyncResult | None = None
 	is_auto_scan_enabled: bool = True
 	game: Game | None = None
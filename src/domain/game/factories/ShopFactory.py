@@ -15,7 +15,7 @@ from src.domain.game.entities.ShopType import ShopType
 from src.domain.game.entities.ShopUnit import ShopUnit
 from src.domain.game.interfaces.IEntityRepository import IEntityRepository
 from src.domain.game.interfaces.IItemRepository import IItemRepository
-from src.domain.game.interfaces.ILocalizationRepository import ILocalizationRepository
+from src.domain.game.interfaces.ILocalizationCache import ILocalizationCache
 from src.domain.game.interfaces.IShopFactory import IShopFactory
 from src.domain.game.interfaces.ISpellRepository import ISpellRepository
 from src.domain.game.interfaces.IUnitRepository import IUnitRepository
@@ -28,7 +28,7 @@ class ShopFactory(IShopFactory):
 		products: list[ShopProduct],
 		atom_map_repository: IEntityRepository[AtomMap] = Provide[Container.atom_map_repository],
 		actor_repository: IEntityRepository[Actor] = Provide[Container.actor_repository],
-		localization_repository: ILocalizationRepository = Provide[Container.localization_repository],
+		localization_cache: ILocalizationCache = Provide[Container.localization_cache],
 		item_repository: IItemRepository = Provide[Container.item_repository],
 		spell_repository: ISpellRepository = Provide[Container.spell_repository],
 		unit_repository: IUnitRepository = Provide[Container.unit_repository]
@@ -36,7 +36,7 @@ class ShopFactory(IShopFactory):
 		self._products = products
 		self._atom_map_repository = atom_map_repository
 		self._actor_repository = actor_repository
-		self._localization_repository = localization_repository
+		self._localization_cache = localization_cache
 		self._item_repository = item_repository
 		self._spell_repository = spell_repository
 		self._unit_repository = unit_repository
@@ -81,15 +81,19 @@ class ShopFactory(IShopFactory):
 		return self._atom_map_repository.get_by_ids(atom_map_ids)
 
 	def _fetch_location_names(self, location_kb_ids: list[str]) -> dict[str, str]:
-		location_names_dict = {}
-		for loc_kb_id in location_kb_ids:
-			localization = self._localization_repository.get_by_kb_id(loc_kb_id)
-			if localization:
-				location_names_dict[loc_kb_id] = localization.text
-			else:
-				location_names_dict[loc_kb_id] = loc_kb_id
+		"""
+		Resolve location names, falling back to the location kb_id
+
+		Names come from the localization cache, so shop lists built again
+		for the same game do not query known locations.
 
-		return location_names_dict
+		:param location_kb_ids:
+			Location kb_ids, possibly repeated
+		:return:
+			Dictionary mapping location kb_id to its name
+		"""
+		location_names = self._localization_cache.get_texts(location_kb_ids)
+		return {loc_kb_id: location_names.get(loc_kb_id, loc_kb_id) for loc_kb_id in set(location_kb_ids)}
 
 	def _fetch_products(self) -> dict:
 		item_ids = [p.product_id for p in self._products if p.product_type == ShopProductType.ITEM]
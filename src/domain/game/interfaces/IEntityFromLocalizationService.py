@@ -9,5 +9,5 @@ TEntity = typing.TypeVar("TEntity", bound=GameEntity)
 class IEntityFromLocalizationService(ABC, typing.Generic[TEntity]):
 
 	@abstractmethod
-	def scan(self, game_id: int) -> list[TEntity]:
+	def scan(self, game_id: int) -> int:
 		pass
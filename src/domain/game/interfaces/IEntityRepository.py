@@ -13,7 +13,7 @@ class IEntityRepository(ABC, typing.Generic[TEntity]):
 		pass
 
 	@abstractmethod
-	def create_batch(self, atom_maps: list[TEntity]) -> list[TEntity]:
+	def create_batch(self, atom_maps: list[TEntity], return_entities: bool = True) -> list[TEntity] | int:
 		pass
 
 	@abstractmethod
@@ -24,6 +24,18 @@ class IEntityRepository(ABC, typing.Generic[TEntity]):
 	def get_by_kb_id(self, kb_id: str) -> TEntity | None:
 		pass
 
+	@abstractmethod
+	def get_ids_by_kb_ids(self, kb_ids: typing.Iterable[str] | None = None) -> dict[str, int]:
+		"""
+		Resolve game identifiers to entity IDs with a single query
+
+		:param kb_ids:
+			Game identifiers, or None to resolve every entity
+		:return:
+			Dictionary mapping kb_id to entity ID; unknown kb_ids are omitted
+		"""
+		pass
+
 	@abstractmethod
 	def list_all(self) -> list[TEntity]:
 		pass
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 
+from src.domain.game.dto.ProfileSyncResult import InventoryChanges
 from src.domain.game.entities.HeroInventoryProduct import HeroInventoryProduct
 from src.domain.game.entities.InventoryEntityType import InventoryEntityType
 
@@ -21,3 +22,7 @@ class IHeroInventoryRepository(ABC):
 	@abstractmethod
 	def delete_by_profile(self, profile_id: int) -> None:
 		pass
+
+	@abstractmethod
+	def sync_profile(self, profile_id: int, inventory: list[HeroInventoryProduct]) -> InventoryChanges:
+		pass
@@ -1,3 +1,4 @@
+import typing
 from abc import ABC, abstractmethod
 from src.domain.game.entities.Item import Item
 
@@ -53,12 +54,21 @@ class IItemRepository(ABC):
 	@abstractmethod
 	def search_by_name(self, query: str) -> list[Item]:
 		"""
-		Search items by name
+		Search items by name, every word matching as a word prefix
 
 		:param query:
 			Search query
 		:return:
-			List of matching items
+			List of matching items, best matches first
+		"""
+		pass
+
+	@abstractmethod
+	def index_search_text(self) -> None:
+		"""
+		Rebuild the full-text search index of item texts
+
+		:return:
 		"""
 		pass
 
@@ -86,6 +96,18 @@ class IItemRepository(ABC):
 		"""
 		pass
 
+	@abstractmethod
+	def get_ids_by_kb_ids(self, kb_ids: typing.Iterable[str] | None = None) -> dict[str, int]:
+		"""
+		Resolve game identifiers to item IDs with a single query
+
+		:param kb_ids:
+			Game identifiers, or None to resolve every entity
+		:return:
+			Dictionary mapping kb_id to item ID; unknown kb_ids are omitted
+		"""
+		pass
+
 	@abstractmethod
 	def list_by_item_set_id(self, item_set_id: int) -> list[Item]:
 		"""
@@ -115,11 +137,11 @@ class IItemRepository(ABC):
 		Search items with multiple filter criteria using AND logic
 
 		:param name_query:
-			Optional name search (case-insensitive LIKE)
+			Optional name search (full-text, every word matches as a word prefix)
 		:param level:
 			Optional level filter (exact match)
 		:param hint_regex:
-			Optional PostgreSQL regex pattern for hint field
+			Optional case-insensitive regex pattern for hint field
 		:param propbits:
 			Optional list of propbit values (OR logic - matches items with ANY of the specified propbits)
 		:param item_set_id:
@@ -134,6 +156,10 @@ class IItemRepository(ABC):
 			Optional profile ID filter (shows only items in shop inventory for profile)
 		:return:
 			List of items matching all provided criteria
+		:raises InvalidRegexException:
+			When hint_regex is not a valid pattern
+		:raises InvalidPropbitException:
+			When propbits contain an unknown value
 		"""
 		pass
 
@@ -0,0 +1,60 @@
+import typing
+from abc import ABC, abstractmethod
+
+from src.domain.base.entities.BaseEntity import BaseEntity
+
+
+class IKbIdIndex(ABC):
+
+	@abstractmethod
+	def get_id(self, entity_type: type[BaseEntity], kb_id: str) -> int | None:
+		"""
+		Get ID of game entity by its game identifier
+
+		:param entity_type:
+			Entity type (Item, Spell, Unit, AtomMap or Actor)
+		:param kb_id:
+			Game identifier
+		:return:
+			Entity ID or None if not found
+		"""
+		pass
+
+	@abstractmethod
+	def get_ids(self, entity_type: type[BaseEntity], kb_ids: typing.Iterable[str]) -> dict[str, int]:
+		"""
+		Get IDs of game entities by their game identifiers
+
+		:param entity_type:
+			Entity type (Item, Spell, Unit, AtomMap or Actor)
+		:param kb_ids:
+			Game identifiers
+		:return:
+			Dictionary mapping kb_id to entity ID; unknown kb_ids are omitted
+		"""
+		pass
+
+	@abstractmethod
+	def contains(self, entity_type: type[BaseEntity], kb_id: str) -> bool:
+		"""
+		Check whether game entity exists
+
+		:param entity_type:
+			Entity type (Item, Spell, Unit, AtomMap or Actor)
+		:param kb_id:
+			Game identifier
+		:return:
+			True if entity exists
+		"""
+		pass
+
+	@abstractmethod
+	def invalidate(self, game_id: int | None = None) -> None:
+		"""
+		Drop cached identifiers of a game, or of all games
+
+		:param game_id:
+			Game ID or None to drop everything
+		:return:
+		"""
+		pass
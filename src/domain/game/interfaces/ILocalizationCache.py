@@ -0,0 +1,28 @@
+import typing
+from abc import ABC, abstractmethod
+
+
+class ILocalizationCache(ABC):
+
+	@abstractmethod
+	def get_texts(self, kb_ids: typing.Iterable[str]) -> dict[str, str]:
+		"""
+		Get localized texts by their game identifiers
+
+		:param kb_ids:
+			Localization kb_ids
+		:return:
+			Dictionary mapping kb_id to text; unknown kb_ids are omitted
+		"""
+		pass
+
+	@abstractmethod
+	def invalidate(self, game_id: int | None = None) -> None:
+		"""
+		Drop cached texts of a game, or of all games
+
+		:param game_id:
+			Game ID or None to drop everything
+		:return:
+		"""
+		pass
@@ -1,3 +1,4 @@
+import typing
 from abc import ABC, abstractmethod
 
 from src.domain.game.entities.Localization import Localization
@@ -18,14 +19,20 @@ class ILocalizationRepository(ABC):
 		pass
 
 	@abstractmethod
-	def create_batch(self, localizations: list[Localization]) -> list[Localization]:
+	def create_batch(
+		self,
+		localizations: list[Localization],
+		return_entities: bool = True
+	) -> list[Localization] | int:
 		"""
 		Create multiple localization entries
 
 		:param localizations:
 			Localizations to create
+		:param return_entities:
+			If False, return only the number of created localizations
 		:return:
-			Created localizations with IDs
+			Created localizations with IDs, or their count
 		"""
 		pass
 
@@ -53,6 +60,18 @@ class ILocalizationRepository(ABC):
 		"""
 		pass
 
+	@abstractmethod
+	def get_by_kb_ids(self, kb_ids: typing.Iterable[str]) -> dict[str, Localization]:
+		"""
+		Get localizations by game identifiers with a single query
+
+		:param kb_ids:
+			Game identifiers
+		:return:
+			Dictionary mapping kb_id to Localization; unknown kb_ids are omitted
+		"""
+		pass
+
 	@abstractmethod
 	def search_by_text(self, query: str) -> list[Localization]:
 		"""
@@ -79,6 +98,29 @@ class ILocalizationRepository(ABC):
 		"""
 		pass
 
+	@abstractmethod
+	def search_by_kb_id_pattern(
+		self,
+		pattern: str,
+		kb_ids: typing.Iterable[str]
+	) -> dict[str, list[Localization]]:
+		"""
+		Search localizations of many entities sharing one LIKE pattern
+
+		Equivalent to calling search_by_kb_id(pattern.format(kb_id)) for each
+		kb_id, but issued as a single query.
+
+		:param pattern:
+			LIKE pattern with a {} placeholder for kb_id and a single trailing
+			% wildcard (e.g. 'spell\\_{}\\_%')
+		:param kb_ids:
+			Game identifiers to substitute into pattern
+		:return:
+			Dictionary mapping kb_id to its localizations; kb_ids without
+			localizations are omitted
+		"""
+		pass
+
 	@abstractmethod
 	def list_all(self, tag: str | None = None) -> list[Localization]:
 		"""
@@ -1,13 +1,11 @@
 from abc import ABC, abstractmethod
 import re
 
-from src.domain.game.entities.Localization import Localization
-
 
 class ILocalizationScannerService(ABC):
 
 	@abstractmethod
-	def scan(self, game_id: int, lang: str = 'rus') -> list[Localization]:
+	def scan(self, game_id: int, lang: str = 'rus') -> int:
 		"""
 		Scan and import localization entries from game files
 
@@ -19,6 +17,6 @@ class ILocalizationScannerService(ABC):
 		:param lang:
 			Language code (default: 'rus')
 		:return:
-			List of created Localization entities with database IDs
+			Number of created localizations
 		"""
 		pass
@@ -63,6 +63,18 @@ class ISaveFileService(ABC):
 	def scan_save_data(self, save_path: Path) -> SaveFileData:
 		...
 
+	@abstractmethod
+	def compute_save_digest(self, save_path: Path) -> str:
+		"""
+		Compute digest of save file contents
+
+		:param save_path:
+			Path to save (directory or .sav archive)
+		:return:
+			Digest as hex string
+		"""
+		...
+
 	@abstractmethod
 	def compute_hash(self, full_name: str) -> str:
 		"""
@@ -1,5 +1,6 @@
 import typing
 from abc import ABC, abstractmethod
+from src.domain.game.dto.ProfileSyncResult import InventoryChanges
 from src.domain.game.entities.ShopProduct import ShopProduct
 from src.domain.game.entities.ShopProductType import ShopProductType
 
@@ -78,3 +79,17 @@ class IShopInventoryRepository(ABC):
 		:return:
 		"""
 		pass
+
+	@abstractmethod
+	def sync_profile(self, profile_id: int, inventory: list[ShopProduct]) -> InventoryChanges:
+		"""
+		Replace all shop inventory entries of a profile, writing only changed rows
+
+		:param profile_id:
+			Profile ID
+		:param inventory:
+			Complete new inventory of the profile, unique by primary key
+		:return:
+			Numbers of added, removed and updated entries
+		"""
+		pass
@@ -1,3 +1,4 @@
+import typing
 from abc import ABC, abstractmethod
 
 from src.domain.game.entities.Spell import Spell
@@ -54,6 +55,18 @@ class ISpellRepository(ABC):
 		"""
 		pass
 
+	@abstractmethod
+	def get_ids_by_kb_ids(self, kb_ids: typing.Iterable[str] | None = None) -> dict[str, int]:
+		"""
+		Resolve game identifiers to spell IDs with a single query
+
+		:param kb_ids:
+			Game identifiers, or None to resolve every entity
+		:return:
+			Dictionary mapping kb_id to spell ID; unknown kb_ids are omitted
+		"""
+		pass
+
 	@abstractmethod
 	def list_all(
 		self,
@@ -87,9 +100,19 @@ class ISpellRepository(ABC):
 		"""
 		pass
 
+	@abstractmethod
+	def index_search_text(self) -> None:
+		"""
+		Rebuild the full-text search index of spell texts
+
+		:return:
+		"""
+		pass
+
 	@abstractmethod
 	def search_with_filters(
 		self,
+		name_query: str | None = None,
 		school: SpellSchool | None = None,
 		profit: int | None = None,
 		sort_by: str = "name",
@@ -99,6 +122,8 @@ class ISpellRepository(ABC):
 		"""
 		Search spells with filter criteria
 
+		:param name_query:
+			Optional name search, every word matching a name word prefix
 		:param school:
 			Optional spell school filter
 		:param profit:
@@ -0,0 +1,18 @@
+import typing
+from abc import ABC, abstractmethod
+
+
+class ITransactionManager(ABC):
+
+	@abstractmethod
+	def transaction(self) -> typing.ContextManager[None]:
+		"""
+		Run all repository calls made within the block in one transaction
+
+		Writes become visible when the block exits and are all rolled back
+		if it raises. Nested blocks join the outer transaction.
+
+		:return:
+			Context manager spanning the transaction
+		"""
+		pass
@@ -1,3 +1,4 @@
+import typing
 from abc import ABC, abstractmethod
 
 from src.domain.game.dto.UnitFilterDto import UnitFilterDto
@@ -55,6 +56,18 @@ class IUnitRepository(ABC):
 		"""
 		pass
 
+	@abstractmethod
+	def get_ids_by_kb_ids(self, kb_ids: typing.Iterable[str] | None = None) -> dict[str, int]:
+		"""
+		Resolve game identifiers to unit IDs with a single query
+
+		:param kb_ids:
+			Game identifiers, or None to resolve every entity
+		:return:
+			Dictionary mapping kb_id to unit ID; unknown kb_ids are omitted
+		"""
+		pass
+
 	@abstractmethod
 	def list_all(
 		self,
@@ -79,12 +92,21 @@ class IUnitRepository(ABC):
 	@abstractmethod
 	def search_by_name(self, query: str) -> list[Unit]:
 		"""
-		Search units by name (case-insensitive)
+		Search units by name (case-insensitive), every word matching as a word prefix
 
 		:param query:
 			Search query
 		:return:
-			List of matching units
+			List of matching units, best matches first
+		"""
+		pass
+
+	@abstractmethod
+	def index_search_text(self) -> None:
+		"""
+		Rebuild the full-text search index of unit texts
+
+		:return:
 		"""
 		pass
 
@@ -121,5 +143,7 @@ class IUnitRepository(ABC):
 			Sort direction (asc, desc)
 		:return:
 			List of units matching all provided criteria
+		:raises InvalidRegexException:
+			When filters.name_regex is not a valid pattern
 		"""
 		pass
@@ -40,6 +40,14 @@ class EntityRepository(CrudRepository[TEntity, TMapper], IEntityRepository[TEnti
 
 		return self._entity_type(id=mapper.id, kb_id=mapper.kb_id, loc=loc)
 
+	def _mappers_to_entities(self, mappers: list[TMapper]) -> list[TEntity]:
+		locs = self._fetch_locs([m.kb_id for m in mappers])
+
+		return [
+			self._entity_type(id=m.id, kb_id=m.kb_id, loc=locs.get(m.kb_id))
+			for m in mappers
+		]
+
 	def _get_entity_type_name(self) -> str:
 		return self._entity_type.__class__.__name__
 
@@ -49,8 +57,8 @@ class EntityRepository(CrudRepository[TEntity, TMapper], IEntityRepository[TEnti
 	def create(self, entity: TEntity) -> TEntity:
 		return self._create_single(entity)
 
-	def create_batch(self, entities: list[TEntity]) -> list[TEntity]:
-		return self._create_batch(entities)
+	def create_batch(self, entities: list[TEntity], return_entities: bool = True) -> list[TEntity] | int:
+		return self._create_batch(entities, return_entities)
 
 	def get_by_id(self, entity_id: int) -> TEntity | None:
 		with self._get_session() as session:
@@ -66,10 +74,21 @@ class EntityRepository(CrudRepository[TEntity, TMapper], IEntityRepository[TEnti
 			).first()
 			return self._mapper_to_entity(mapper) if mapper else None
 
+	def get_ids_by_kb_ids(self, kb_ids: typing.Iterable[str] | None = None) -> dict[str, int]:
+		"""
+		Resolve game identifiers to entity IDs with a single query
+
+		:param kb_ids:
+			Game identifiers, or None to resolve every entity
+		:return:
+			Dictionary mapping kb_id to entity ID; unknown kb_ids are omitted
+		"""
+		return self._get_ids_by_kb_ids(self._mapper_type, kb_ids)
+
 	def list_all(self) -> list[TEntity]:
 		with self._get_session() as session:
 			mappers = session.query(self._mapper_type).all()
-			return [self._mapper_to_entity(m) for m in mappers]
+			return self._mappers_to_entities(mappers)
 
 	def get_by_ids(self, ids: list[int]) -> dict[int, TEntity]:
 		"""
@@ -86,18 +105,15 @@ class EntityRepository(CrudRepository[TEntity, TMapper], IEntityRepository[TEnti
 		with self._get_session() as session:
 			mappers = session.query(self._mapper_type).filter(self._mapper_type.id.in_(ids)).all()
 
-			result = {}
-			for mapper in mappers:
-				entity = self._mapper_to_entity(mapper)
-				result[entity.id] = entity
-
-			return result
+			return {entity.id: entity for entity in self._mappers_to_entities(mappers)}
 
 	def _fetch_loc(self, kb_id: str) -> LocStrings | None:
-		pattern = self._loc_pattern.format(kb_id)
-		localizations = self._localization_repository.search_by_kb_id(pattern, use_regex=False)
+		return self._fetch_locs([kb_id]).get(kb_id)
 
-		if not localizations:
-			return None
+	def _fetch_locs(self, kb_ids: list[str]) -> dict[str, LocStrings]:
+		localizations = self._localization_repository.search_by_kb_id_pattern(self._loc_pattern, kb_ids)
 
-		return self._loc_factory.create_from_localizations(localizations)
+		return {
+			kb_id: self._loc_factory.create_from_localizations(locs)
+			for kb_id, locs in localizations.items()
+		}
@@ -1,5 +1,6 @@
 from src.domain.base.factories.PydanticEntityFactory import PydanticEntityFactory
 from src.domain.base.repositories.CrudRepository import CrudRepository
+from src.domain.game.dto.ProfileSyncResult import InventoryChanges
 from src.domain.exceptions import DuplicateEntityException
 from src.domain.game.entities.HeroInventoryProduct import HeroInventoryProduct
 from src.domain.game.entities.InventoryEntityType import InventoryEntityType
@@ -49,6 +50,14 @@ class HeroInventoryRepository(
 			).delete()
 			session.commit()
 
+	def sync_profile(self, profile_id: int, inventory: list[HeroInventoryProduct]) -> InventoryChanges:
+		added, removed, updated = self._sync_rows(
+			HeroInventoryMapper,
+			[HeroInventoryMapper.profile_id == profile_id],
+			inventory
+		)
+		return InventoryChanges(added=added, removed=removed, updated=updated)
+
 	def _entity_to_mapper(self, entity: HeroInventoryProduct) -> HeroInventoryMapper:
 		return HeroInventoryMapper(
 			product_id=entity.product_id,
@@ -57,6 +66,9 @@ class HeroInventoryRepository(
 			profile_id=entity.profile_id
 		)
 
+	def _entity_to_row(self, entity: HeroInventoryProduct, mapper_type: type[HeroInventoryMapper]) -> dict:
+		return entity.model_dump()
+
 	def _mapper_to_entity(self, mapper: HeroInventoryMapper) -> HeroInventoryProduct:
 		return PydanticEntityFactory.create_entity(HeroInventoryProduct, mapper)
 
@@ -1,5 +1,6 @@
-from sqlalchemy import func
-from sqlalchemy.orm import aliased
+import typing
+
+from sqlalchemy import select
 
 from src.domain.base.factories.PydanticEntityFactory import PydanticEntityFactory
 from src.domain.base.repositories.CrudRepository import CrudRepository
@@ -7,8 +8,8 @@ from src.domain.exceptions import InvalidPropbitException
 from src.domain.game.entities.Item import Item
 from src.domain.game.entities.Propbit import Propbit
 from src.domain.game.interfaces.IItemRepository import IItemRepository
-from src.domain.game.repositories.mappers.ItemMapper import ItemMapper
-from src.domain.game.repositories.mappers.LocalizationMapper import LocalizationMapper
+from src.domain.game.repositories.mappers.ItemMapper import ItemMapper, PROPBIT_BITS
+from src.utils.db import validate_regexp
 
 
 class ItemRepository(CrudRepository[Item, ItemMapper], IItemRepository):
@@ -31,8 +32,11 @@ class ItemRepository(CrudRepository[Item, ItemMapper], IItemRepository):
 			kb_id=entity.kb_id,
 			price=entity.price,
 			propbits=propbits_str,
+			propbit_mask=self._propbits_to_mask(entity.propbits or []),
 			tiers=entity.tiers,
-			level=entity.level
+			level=entity.level,
+			name=entity.name or None,
+			hint=entity.hint
 		)
 
 	def _get_entity_type_name(self) -> str:
@@ -55,45 +59,32 @@ class ItemRepository(CrudRepository[Item, ItemMapper], IItemRepository):
 		"""
 		return f"kb_id={entity.kb_id}"
 
-	def _build_query_with_localization(self, session):
+	def _build_query(self, session):
 		"""
-		Build base query with localization JOINs for name and hint
+		Build base query of items having a localized name
+
+		Name and hint are stored on the item when items are scanned, so
+		listing needs no join with localization.
 
 		:param session:
 			Database session
 		:return:
-			Tuple of (query, NameLocalization alias, HintLocalization alias)
-		"""
-		NameLocalization = aliased(LocalizationMapper)
-		HintLocalization = aliased(LocalizationMapper)
-
-		query = session.query(
-			ItemMapper,
-			NameLocalization.text.label('loc_name'),
-			HintLocalization.text.label('loc_hint')
-		).join(
-			NameLocalization,
-			NameLocalization.kb_id == func.concat('itm_', ItemMapper.kb_id, '_name')
-		).outerjoin(
-			HintLocalization,
-			HintLocalization.kb_id == func.concat('itm_', ItemMapper.kb_id, '_hint')
-		)
-
-		return query, NameLocalization, HintLocalization
+			SQLAlchemy query
+		"""
+		return session.query(ItemMapper).filter(ItemMapper.name.isnot(None))
 
-	def _row_to_entity(self, row: tuple) -> Item:
+	def _mapper_to_entity(self, mapper: ItemMapper) -> Item:
 		"""
-		Convert query row with localization to Item entity
+		Convert ItemMapper to Item entity
 
-		:param row:
-			Tuple of (ItemMapper, name_text, hint_text)
+		:param mapper:
+			ItemMapper to convert
 		:return:
 			Item entity
 		:raises LocalizationNotFoundException:
 			When name localization is missing
 		"""
-		mapper, name, hint = row
-
+		name = mapper.name
 		if not name:
 			name = mapper.kb_id
 			# raise LocalizationNotFoundException(
@@ -110,7 +101,6 @@ class ItemRepository(CrudRepository[Item, ItemMapper], IItemRepository):
 			Item,
 			mapper,
 			name=name,
-			hint=hint,
 			propbits=propbits_enum
 		)
 
@@ -127,30 +117,38 @@ class ItemRepository(CrudRepository[Item, ItemMapper], IItemRepository):
 
 	def get_by_id(self, item_id: int) -> Item | None:
 		with self._get_session() as session:
-			query, *_ = self._build_query_with_localization(session)
-			row = query.filter(ItemMapper.id == item_id).first()
-			return self._row_to_entity(row) if row else None
+			query = self._build_query(session)
+			mapper = query.filter(ItemMapper.id == item_id).first()
+			return self._mapper_to_entity(mapper) if mapper else None
 
 	def get_by_kb_id(self, kb_id: str) -> Item | None:
 		with self._get_session() as session:
-			query, *_ = self._build_query_with_localization(session)
-			row = query.filter(ItemMapper.kb_id == kb_id).first()
-			return self._row_to_entity(row) if row else None
+			query = self._build_query(session)
+			mapper = query.filter(ItemMapper.kb_id == kb_id).first()
+			return self._mapper_to_entity(mapper) if mapper else None
 
 	def list_all(self, sort_by: str = "name", sort_order: str = "asc") -> list[Item]:
 		with self._get_session() as session:
-			query, *_ = self._build_query_with_localization(session)
-			query = self._apply_sorting_with_localization(query, sort_by, sort_order)
-			rows = query.all()
-			return [self._row_to_entity(row) for row in rows]
+			query = self._build_query(session)
+			query = self._apply_sorting(query, sort_by, sort_order)
+			mappers = query.all()
+			return [self._mapper_to_entity(mapper) for mapper in mappers]
 
 	def search_by_name(self, query: str) -> list[Item]:
+		matches = self._search_text_match(ItemMapper, query)
 		with self._get_session() as session:
-			base_query, NameLocalization, *_ = self._build_query_with_localization(session)
-			rows = base_query.filter(
-				NameLocalization.text.ilike(f"%{query}%")
-			).all()
-			return [self._row_to_entity(row) for row in rows]
+			mappers = self._build_query(session).join(
+				matches, matches.c.entity_id == ItemMapper.id
+			).order_by(matches.c.rank).all()
+			return [self._mapper_to_entity(mapper) for mapper in mappers]
+
+	def index_search_text(self) -> None:
+		"""
+		Rebuild the full-text search index of item texts
+
+		:return:
+		"""
+		self._index_search_text(ItemMapper)
 
 	def create_batch(self, items: list[Item]) -> list[Item]:
 		"""
@@ -174,17 +172,28 @@ class ItemRepository(CrudRepository[Item, ItemMapper], IItemRepository):
 			Dictionary mapping kb_id to Item entity
 		"""
 		with self._get_session() as session:
-			query, *_ = self._build_query_with_localization(session)
-			rows = query.filter(ItemMapper.kb_id.in_(kb_ids)).all()
+			query = self._build_query(session)
+			mappers = query.filter(ItemMapper.kb_id.in_(kb_ids)).all()
 
 			result = {}
-			for row in rows:
-				item = self._row_to_entity(row)
+			for mapper in mappers:
+				item = self._mapper_to_entity(mapper)
 				result[item.kb_id] = item
 
 			return result
 
 
+	def get_ids_by_kb_ids(self, kb_ids: typing.Iterable[str] | None = None) -> dict[str, int]:
+		"""
+		Resolve game identifiers to item IDs with a single query
+
+		:param kb_ids:
+			Game identifiers, or None to resolve every entity
+		:return:
+			Dictionary mapping kb_id to item ID; unknown kb_ids are omitted
+		"""
+		return self._get_ids_by_kb_ids(ItemMapper, kb_ids)
+
 	def list_by_item_set_id(self, item_set_id: int) -> list[Item]:
 		"""
 		Get all items belonging to a specific item set
@@ -195,9 +204,9 @@ class ItemRepository(CrudRepository[Item, ItemMapper], IItemRepository):
 			List of items in the set
 		"""
 		with self._get_session() as session:
-			query, *_ = self._build_query_with_localization(session)
-			rows = query.filter(ItemMapper.item_set_id == item_set_id).all()
-			return [self._row_to_entity(row) for row in rows]
+			query = self._build_query(session)
+			mappers = query.filter(ItemMapper.item_set_id == item_set_id).all()
+			return [self._mapper_to_entity(mapper) for mapper in mappers]
 
 	def search_with_filters(
 		self,
@@ -215,7 +224,7 @@ class ItemRepository(CrudRepository[Item, ItemMapper], IItemRepository):
 		Search items with multiple filter criteria using AND logic
 
 		:param name_query:
-			Optional name search (case-insensitive LIKE)
+			Optional name search (full-text, every word matches as a word prefix)
 		:param level:
 			Optional level filter (exact match)
 		:param hint_regex:
@@ -234,9 +243,16 @@ class ItemRepository(CrudRepository[Item, ItemMapper], IItemRepository):
 			Optional profile ID filter (shows only items in shop inventory for profile)
 		:return:
 			List of items matching all provided criteria
+		:raises InvalidRegexException:
+			When hint_regex is not a valid pattern
+		:raises InvalidPropbitException:
+			When propbits contain an unknown value
 		"""
+		if hint_regex:
+			validate_regexp(hint_regex)
+
 		with self._get_session() as session:
-			query, NameLocalization, HintLocalization = self._build_query_with_localization(session)
+			query = self._build_query(session)
 
 			if profile_id is not None:
 				from src.domain.game.repositories.mappers.ShopInventoryMapper import ShopInventoryMapper
@@ -246,15 +262,15 @@ class ItemRepository(CrudRepository[Item, ItemMapper], IItemRepository):
 				from sqlalchemy import or_
 
 				# Create subqueries for items in shops and hero inventory
-				shop_items_subq = session.query(ShopInventoryMapper.product_id).filter(
+				shop_items_subq = select(ShopInventoryMapper.product_id).where(
 					(ShopInventoryMapper.product_type == ShopProductType.ITEM) &
 					(ShopInventoryMapper.profile_id == profile_id)
-				).distinct().subquery()
+				)
 
-				hero_items_subq = session.query(HeroInventoryMapper.product_id).filter(
+				hero_items_subq = select(HeroInventoryMapper.product_id).where(
 					(HeroInventoryMapper.product_type == InventoryEntityType.ITEM) &
 					(HeroInventoryMapper.profile_id == profile_id)
-				).distinct().subquery()
+				)
 
 				# Filter items that exist in EITHER shops OR hero inventory
 				query = query.filter(
@@ -268,33 +284,33 @@ class ItemRepository(CrudRepository[Item, ItemMapper], IItemRepository):
 				query = query.filter(ItemMapper.id == item_id)
 
 			if name_query:
-				query = query.filter(NameLocalization.text.ilike(f"%{name_query}%"))
+				matches = self._search_text_match(ItemMapper, name_query)
+				query = query.filter(ItemMapper.id.in_(select(matches.c.entity_id)))
 
 			if level is not None:
 				query = query.filter(ItemMapper.level == level)
 
 			if hint_regex:
-				query = query.filter(HintLocalization.text.op('REGEXP')(hint_regex))
+				query = query.filter(ItemMapper.hint.op('REGEXP')(hint_regex))
 
 			if propbits:
-				from sqlalchemy import or_
-				propbit_conditions = [ItemMapper.propbits.any(pb) for pb in propbits]
-				query = query.filter(or_(*propbit_conditions))
+				propbit_mask = self._propbits_to_mask(self._convert_propbits_to_enum(propbits))
+				query = query.filter(ItemMapper.propbit_mask.op('&')(propbit_mask) != 0)
 
 			if item_set_id is not None:
 				query = query.filter(ItemMapper.item_set_id == item_set_id)
 
-			query = self._apply_sorting_with_localization(query, sort_by, sort_order)
+			query = self._apply_sorting(query, sort_by, sort_order)
 
-			rows = query.all()
-			return [self._row_to_entity(row) for row in rows]
+			mappers = query.all()
+			return [self._mapper_to_entity(mapper) for mapper in mappers]
 
-	def _apply_sorting_with_localization(self, query, sort_by: str, sort_order: str):
+	def _apply_sorting(self, query, sort_by: str, sort_order: str):
 		"""
-		Apply ORDER BY clause to query with localization
+		Apply ORDER BY clause to query
 
 		:param query:
-			SQLAlchemy query with localization joins
+			SQLAlchemy query
 		:param sort_by:
 			Field to sort by (name, price, level)
 		:param sort_order:
@@ -302,16 +318,16 @@ class ItemRepository(CrudRepository[Item, ItemMapper], IItemRepository):
 		:return:
 			Query with ORDER BY applied
 		"""
-		from sqlalchemy import desc, asc, text
+		from sqlalchemy import desc, asc
 
 		if sort_by == "name":
-			sort_column = text('loc_name')
+			sort_column = ItemMapper.name
 		elif sort_by == "price":
 			sort_column = ItemMapper.price
 		elif sort_by == "level":
 			sort_column = ItemMapper.level
 		else:
-			sort_column = text('loc_name')
+			sort_column = ItemMapper.name
 
 		if sort_order.lower() == "desc":
 			return query.order_by(desc(sort_column))
@@ -342,12 +358,12 @@ class ItemRepository(CrudRepository[Item, ItemMapper], IItemRepository):
 			return {}
 
 		with self._get_session() as session:
-			query, *_ = self._build_query_with_localization(session)
-			rows = query.filter(ItemMapper.id.in_(ids)).all()
+			query = self._build_query(session)
+			mappers = query.filter(ItemMapper.id.in_(ids)).all()
 
 			result = {}
-			for row in rows:
-				item = self._row_to_entity(row)
+			for mapper in mappers:
+				item = self._mapper_to_entity(mapper)
 				result[item.id] = item
 
 			return result
@@ -378,6 +394,20 @@ class ItemRepository(CrudRepository[Item, ItemMapper], IItemRepository):
 
 		return result
 
+	def _propbits_to_mask(self, propbits: list[Propbit]) -> int:
+		"""
+		Convert list of Propbit enums to the stored bitmask
+
+		:param propbits:
+			List of Propbit enum values
+		:return:
+			Bitmask with the bit of every propbit set
+		"""
+		mask = 0
+		for propbit in propbits:
+			mask |= PROPBIT_BITS[propbit]
+		return mask
+
 	def _convert_propbits_to_strings(self, propbits: list[Propbit]) -> list[str]:
 		"""
 		Convert list of Propbit enums to strings for database
@@ -404,17 +434,4 @@ class ItemRepository(CrudRepository[Item, ItemMapper], IItemRepository):
 			).first() is not None
 			return exists
 
-	def _mapper_to_entity(self, mapper: ItemMapper) -> Item:
-		"""
-		Convert ItemMapper to Item entity
-
-		Note: This method is called after creating entities. Since name/hint
-		are stored in localization table, we fetch the full entity with localization.
-
-		:param mapper:
-			ItemMapper to convert
-		:return:
-			Item entity with localized name and hint
-		"""
-		return self.get_by_id(mapper.id)
 
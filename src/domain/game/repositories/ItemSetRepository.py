@@ -1,11 +1,7 @@
-from sqlalchemy import func
-from sqlalchemy.orm import aliased
-
 from src.domain.base.repositories.CrudRepository import CrudRepository
 from src.domain.game.entities.ItemSet import ItemSet
 from src.domain.game.interfaces.IItemSetRepository import IItemSetRepository
 from src.domain.game.repositories.mappers.ItemSetMapper import ItemSetMapper
-from src.domain.game.repositories.mappers.LocalizationMapper import LocalizationMapper
 
 
 class ItemSetRepository(CrudRepository[ItemSet, ItemSetMapper], IItemSetRepository):
@@ -19,7 +15,7 @@ class ItemSetRepository(CrudRepository[ItemSet, ItemSetMapper], IItemSetReposito
 		:return:
 			ItemSetMapper instance
 		"""
-		return ItemSetMapper(kb_id=entity.kb_id)
+		return ItemSetMapper(kb_id=entity.kb_id, name=entity.name or None, hint=entity.hint)
 
 	def _get_entity_type_name(self) -> str:
 		"""
@@ -41,43 +37,32 @@ class ItemSetRepository(CrudRepository[ItemSet, ItemSetMapper], IItemSetReposito
 		"""
 		return f"kb_id={entity.kb_id}"
 
-	def _build_query_with_localization(self, session):
+	def _build_query(self, session):
 		"""
-		Build base query with localization JOINs for name and hint
+		Build base query of item sets having a localized name
+
+		Name and hint are stored on the item set when items are scanned, so
+		listing needs no join with localization.
 
 		:param session:
 			Database session
 		:return:
-			SQLAlchemy query with localization joins
-		"""
-		NameLocalization = aliased(LocalizationMapper)
-		HintLocalization = aliased(LocalizationMapper)
-
-		return session.query(
-			ItemSetMapper,
-			NameLocalization.text.label('loc_name'),
-			HintLocalization.text.label('loc_hint')
-		).join(
-			NameLocalization,
-			NameLocalization.kb_id == func.concat('itm_', ItemSetMapper.kb_id, '_name')
-		).outerjoin(
-			HintLocalization,
-			HintLocalization.kb_id == func.concat('itm_', ItemSetMapper.kb_id, '_hint')
-		)
+			SQLAlchemy query
+		"""
+		return session.query(ItemSetMapper).filter(ItemSetMapper.name.isnot(None))
 
-	def _row_to_entity(self, row: tuple) -> ItemSet:
+	def _mapper_to_entity(self, mapper: ItemSetMapper) -> ItemSet:
 		"""
-		Convert query row with localization to ItemSet entity
+		Convert ItemSetMapper to ItemSet entity
 
-		:param row:
-			Tuple of (ItemSetMapper, name_text, hint_text)
+		:param mapper:
+			ItemSetMapper to convert
 		:return:
 			ItemSet entity
 		:raises LocalizationNotFoundException:
 			When name localization is missing
 		"""
-		mapper, name, hint = row
-
+		name = mapper.name
 		if not name:
 			name = mapper.kb_id
 			# raise LocalizationNotFoundException(
@@ -90,7 +75,7 @@ class ItemSetRepository(CrudRepository[ItemSet, ItemSetMapper], IItemSetReposito
 			id=mapper.id,
 			kb_id=mapper.kb_id,
 			name=name,
-			hint=hint
+			hint=mapper.hint
 		)
 
 	def create(self, item_set: ItemSet) -> ItemSet:
@@ -106,15 +91,15 @@ class ItemSetRepository(CrudRepository[ItemSet, ItemSetMapper], IItemSetReposito
 
 	def get_by_id(self, item_set_id: int) -> ItemSet | None:
 		with self._get_session() as session:
-			query = self._build_query_with_localization(session)
-			row = query.filter(ItemSetMapper.id == item_set_id).first()
-			return self._row_to_entity(row) if row else None
+			query = self._build_query(session)
+			mapper = query.filter(ItemSetMapper.id == item_set_id).first()
+			return self._mapper_to_entity(mapper) if mapper else None
 
 	def get_by_kb_id(self, kb_id: str) -> ItemSet | None:
 		with self._get_session() as session:
-			query = self._build_query_with_localization(session)
-			row = query.filter(ItemSetMapper.kb_id == kb_id).first()
-			return self._row_to_entity(row) if row else None
+			query = self._build_query(session)
+			mapper = query.filter(ItemSetMapper.kb_id == kb_id).first()
+			return self._mapper_to_entity(mapper) if mapper else None
 
 	def list_by_ids(self, item_set_ids: list[int]) -> list[ItemSet]:
 		"""
@@ -129,15 +114,15 @@ class ItemSetRepository(CrudRepository[ItemSet, ItemSetMapper], IItemSetReposito
 			return []
 
 		with self._get_session() as session:
-			query = self._build_query_with_localization(session)
-			rows = query.filter(ItemSetMapper.id.in_(item_set_ids)).all()
-			return [self._row_to_entity(row) for row in rows]
+			query = self._build_query(session)
+			mappers = query.filter(ItemSetMapper.id.in_(item_set_ids)).all()
+			return [self._mapper_to_entity(mapper) for mapper in mappers]
 
 	def list_all(self) -> list[ItemSet]:
 		with self._get_session() as session:
-			query = self._build_query_with_localization(session)
-			rows = query.all()
-			return [self._row_to_entity(row) for row in rows]
+			query = self._build_query(session)
+			mappers = query.all()
+			return [self._mapper_to_entity(mapper) for mapper in mappers]
 
 	def create_batch(self, item_sets: list[ItemSet]) -> list[ItemSet]:
 		"""
@@ -150,16 +135,3 @@ class ItemSetRepository(CrudRepository[ItemSet, ItemSetMapper], IItemSetReposito
 		"""
 		return self._create_batch(item_sets)
 
-	def _mapper_to_entity(self, mapper: ItemSetMapper) -> ItemSet:
-		"""
-		Convert ItemSetMapper to ItemSet entity
-
-		Note: This method is called after creating entities. Since name/hint
-		are stored in localization table, we fetch the full entity with localization.
-
-		:param mapper:
-			ItemSetMapper to convert
-		:return:
-			ItemSet entity with localized name and hint
-		"""
-		return self.get_by_id(mapper.id)
@@ -1,3 +1,8 @@
+import re
+import typing
+
+from sqlalchemy import and_, or_, select
+
 from src.domain.base.factories.PydanticEntityFactory import PydanticEntityFactory
 from src.domain.base.repositories.CrudRepository import CrudRepository
 from src.domain.game.entities.Localization import Localization
@@ -10,6 +15,14 @@ class LocalizationRepository(
 	ILocalizationRepository
 ):
 
+	# Batches larger than this scan the whole pattern prefix instead of
+	# one kb_id range per entity (also keeps bound parameters well below
+	# SQLite limits)
+	_PATTERN_RANGES_LIMIT: int = 250
+
+	# LIKE escape sequences (\_, \%, \\) stand for literal characters
+	_LIKE_ESCAPE_PATTERN: re.Pattern = re.compile(r'\\(.)')
+
 	def _entity_to_mapper(self, entity: Localization) -> LocalizationMapper:
 		"""
 		Convert Localization entity to LocalizationMapper
@@ -37,6 +50,21 @@ class LocalizationRepository(
 		"""
 		return PydanticEntityFactory.create_entity(Localization, mapper)
 
+	def _entity_to_row(self, entity: Localization, mapper_type: type[LocalizationMapper]) -> dict:
+		"""
+		Convert Localization entity to column values
+
+		Entity fields match the table columns, so no mapper is built.
+
+		:param entity:
+			Localization entity
+		:param mapper_type:
+			LocalizationMapper
+		:return:
+			Column values by column key
+		"""
+		return entity.model_dump()
+
 	def _get_entity_type_name(self) -> str:
 		"""
 		Get entity type name
@@ -70,17 +98,20 @@ class LocalizationRepository(
 
 	def create_batch(
 		self,
-		localizations: list[Localization]
-	) -> list[Localization]:
+		localizations: list[Localization],
+		return_entities: bool = True
+	) -> list[Localization] | int:
 		"""
 		Create multiple localization entries
 
 		:param localizations:
 			List of localization entities to create
+		:param return_entities:
+			If False, return only the number of created localizations
 		:return:
-			List of created localizations with database IDs
+			List of created localizations with database IDs, or their count
 		"""
-		return self._create_batch(localizations)
+		return self._create_batch(localizations, return_entities)
 
 	def get_by_id(self, localization_id: int) -> Localization | None:
 		"""
@@ -112,6 +143,26 @@ class LocalizationRepository(
 			).first()
 			return self._mapper_to_entity(mapper) if mapper else None
 
+	def get_by_kb_ids(self, kb_ids: typing.Iterable[str]) -> dict[str, Localization]:
+		"""
+		Get localizations by game identifiers with a single query
+
+		:param kb_ids:
+			Game identifiers
+		:return:
+			Dictionary mapping kb_id to Localization; unknown kb_ids are omitted
+		"""
+		kb_ids = list(set(kb_ids))
+		if not kb_ids:
+			return {}
+
+		query = select(*LocalizationMapper.__table__.columns).where(LocalizationMapper.kb_id.in_(kb_ids))
+
+		with self._get_session() as session:
+			rows = session.execute(query).all()
+
+		return {row.kb_id: self._mapper_to_entity(row) for row in rows}
+
 	def search_by_text(self, query: str) -> list[Localization]:
 		"""
 		Search localization text (case-insensitive)
@@ -155,6 +206,68 @@ class LocalizationRepository(
 				).all()
 			return [self._mapper_to_entity(m) for m in mappers]
 
+	def search_by_kb_id_pattern(
+		self,
+		pattern: str,
+		kb_ids: typing.Iterable[str]
+	) -> dict[str, list[Localization]]:
+		"""
+		Search localizations of many entities sharing one LIKE pattern
+
+		A pattern '{prefix}{}{suffix}%' matches every kb_id starting with
+		prefix + kb_id + suffix, so each entity is a contiguous range of the
+		kb_id index. Small batches query those ranges directly, large ones
+		scan the common prefix once; rows are then grouped in Python.
+
+		:param pattern:
+			LIKE pattern with a {} placeholder for kb_id and a single trailing
+			% wildcard (e.g. 'spell\\_{}\\_%')
+		:param kb_ids:
+			Game identifiers to substitute into pattern
+		:return:
+			Dictionary mapping kb_id to its localizations; kb_ids without
+			localizations are omitted
+		:raises ValueError:
+			If pattern has wildcards other than the trailing %
+		"""
+		prefix, suffix = self._split_kb_id_pattern(pattern)
+		kb_ids = set(kb_ids)
+		if not kb_ids:
+			return {}
+
+		column = LocalizationMapper.kb_id
+		if len(kb_ids) > self._PATTERN_RANGES_LIMIT:
+			condition = self._prefix_range(column, prefix)
+		else:
+			condition = or_(*(
+				self._prefix_range(column, f"{prefix}{kb_id}{suffix}")
+				for kb_id in kb_ids
+			))
+
+		# Plain rows: a prefix scan may return many rows of other entities,
+		# which are not worth building ORM instances for
+		query = select(*LocalizationMapper.__table__.columns).where(condition)
+
+		with self._get_session() as session:
+			rows = session.execute(query).all()
+
+		result: dict[str, list[Localization]] = {}
+		for row in rows:
+			# kb_id + suffix is a prefix of the remainder; try every suffix
+			# occurrence, as one row may belong to several entities
+			# (e.g. spell_empathy_2_name matches both empathy and empathy_2)
+			remainder = row.kb_id[len(prefix):]
+			end = remainder.find(suffix)
+			localization = None
+			while end != -1:
+				kb_id = remainder[:end]
+				if kb_id in kb_ids:
+					localization = localization or self._mapper_to_entity(row)
+					result.setdefault(kb_id, []).append(localization)
+				end = remainder.find(suffix, end + 1)
+
+		return result
+
 	def list_all(self, tag: str | None = None) -> list[Localization]:
 		"""
 		Get all localization entries
@@ -172,3 +285,44 @@ class LocalizationRepository(
 
 			mappers = query.all()
 			return [self._mapper_to_entity(m) for m in mappers]
+
+	@classmethod
+	def _split_kb_id_pattern(cls, pattern: str) -> tuple[str, str]:
+		"""
+		Split LIKE pattern into literal text before and after kb_id
+
+		:param pattern:
+			LIKE pattern of the form '{prefix}{}{suffix}%'
+		:return:
+			Unescaped prefix and suffix
+		:raises ValueError:
+			If pattern is not of the supported form
+		"""
+		head, placeholder, tail = pattern.partition("{}")
+		if not placeholder or not tail.endswith("%"):
+			raise ValueError(f"Unsupported localization pattern: {pattern}")
+
+		literals = []
+		for part in (head, tail[:-1]):
+			if re.search(r'[_%]', cls._LIKE_ESCAPE_PATTERN.sub('', part)):
+				raise ValueError(f"Unsupported localization pattern: {pattern}")
+			literals.append(cls._LIKE_ESCAPE_PATTERN.sub(r'\1', part))
+
+		return literals[0], literals[1]
+
+	@staticmethod
+	def _prefix_range(column, prefix: str):
+		"""
+		Build index-friendly condition matching values starting with prefix
+
+		:param column:
+			String column
+		:param prefix:
+			Literal prefix
+		:return:
+			SQLAlchemy condition
+		"""
+		if not prefix:
+			return column.isnot(None)
+		upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+		return and_(column >= prefix, column < upper)
@@ -8,6 +8,7 @@ from src.domain.base.repositories.CrudRepository import CrudRepository
 from src.domain.game.interfaces.IProfileRepository import IProfileRepository
 from src.domain.game.entities.ProfileEntity import ProfileEntity
 from src.domain.game.entities.MissedShopsData import MissedShopsData
+from src.domain.game.dto.ProfileSyncResult import ProfileSyncResult
 from src.domain.game.repositories.mappers.ProfileMapper import ProfileMapper
 
 
@@ -34,6 +35,10 @@ class ProfileRepository(CrudRepository[ProfileEntity, ProfileMapper], IProfileRe
 		if entity.last_corrupted_data:
 			corrupted_data_json = entity.last_corrupted_data.model_dump()
 
+		sync_result_json = None
+		if entity.last_sync_result:
+			sync_result_json = entity.last_sync_result.model_dump()
+
 		game_id = entity.game.id if entity.game else None
 
 		return ProfileMapper(
@@ -45,6 +50,8 @@ class ProfileRepository(CrudRepository[ProfileEntity, ProfileMapper], IProfileRe
 			last_scan_time=entity.last_scan_time,
 			last_save_timestamp=entity.last_save_timestamp,
 			last_corrupted_data=corrupted_data_json,
+			last_save_digest=entity.last_save_digest,
+			last_sync_result=sync_result_json,
 			is_auto_scan_enabled=entity.is_auto_scan_enabled,
 			game_id=game_id
 		)
@@ -103,6 +110,7 @@ class ProfileRepository(CrudRepository[ProfileEntity, ProfileMapper], IProfileRe
 			mapper.save_dir = profile.save_dir
 			mapper.last_scan_time = profile.last_scan_time
 			mapper.last_save_timestamp = profile.last_save_timestamp
+			mapper.last_save_digest = profile.last_save_digest
 			mapper.is_auto_scan_enabled = profile.is_auto_scan_enabled
 			mapper.game_id = profile.game.id if profile.game else mapper.game_id
 
@@ -111,6 +119,11 @@ class ProfileRepository(CrudRepository[ProfileEntity, ProfileMapper], IProfileRe
 			else:
 				mapper.last_corrupted_data = None
 
+			if profile.last_sync_result:
+				mapper.last_sync_result = profile.last_sync_result.model_dump()
+			else:
+				mapper.last_sync_result = None
+
 			session.commit()
 			session.refresh(mapper)
 
@@ -149,6 +162,10 @@ class ProfileRepository(CrudRepository[ProfileEntity, ProfileMapper], IProfileRe
 		if mapper.last_corrupted_data:
 			corrupted_data = MissedShopsData(**mapper.last_corrupted_data)
 
+		sync_result = None
+		if mapper.last_sync_result:
+			sync_result = ProfileSyncResult(**mapper.last_sync_result)
+
 		# Profiles live in the per-game database; the owning game is stored as a
 		# plain game_id and loaded from the shared app database (no cross-db FK).
 		game = self._game_repository.get_by_id(mapper.game_id) if mapper.game_id else None
@@ -157,5 +174,6 @@ class ProfileRepository(CrudRepository[ProfileEntity, ProfileMapper], IProfileRe
 			ProfileEntity,
 			mapper,
 			last_corrupted_data=corrupted_data,
+			last_sync_result=sync_result,
 			game=game
 		)
@@ -2,6 +2,7 @@ import typing
 
 from src.domain.base.factories.PydanticEntityFactory import PydanticEntityFactory
 from src.domain.base.repositories.CrudRepository import CrudRepository
+from src.domain.game.dto.ProfileSyncResult import InventoryChanges
 from src.domain.game.entities.ShopProduct import ShopProduct
 from src.domain.game.entities.ShopProductType import ShopProductType
 from src.domain.game.interfaces.IShopInventoryRepository import IShopInventoryRepository
@@ -29,6 +30,19 @@ class ShopInventoryRepository(CrudRepository[ShopProduct, ShopInventoryMapper],
 			profile_id=entity.profile_id
 		)
 
+	def _entity_to_row(self, entity: ShopProduct, mapper_type: type[ShopInventoryMapper]) -> dict:
+		"""
+		Convert ShopProduct entity to shop_inventory row values
+
+		:param entity:
+			ShopProduct entity to convert
+		:param mapper_type:
+			ShopInventoryMapper
+		:return:
+			Column values by column key
+		"""
+		return entity.model_dump()
+
 	def _get_entity_type_name(self) -> str:
 		"""
 		Get entity type name
@@ -140,6 +154,24 @@ class ShopInventoryRepository(CrudRepository[ShopProduct, ShopInventoryMapper],
 			).delete()
 			session.commit()
 
+	def sync_profile(self, profile_id: int, inventory: list[ShopProduct]) -> InventoryChanges:
+		"""
+		Replace all shop inventory entries of a profile, writing only changed rows
+
+		:param profile_id:
+			Profile ID
+		:param inventory:
+			Complete new inventory of the profile, unique by primary key
+		:return:
+			Numbers of added, removed and updated entries
+		"""
+		added, removed, updated = self._sync_rows(
+			ShopInventoryMapper,
+			[ShopInventoryMapper.profile_id == profile_id],
+			inventory
+		)
+		return InventoryChanges(added=added, removed=removed, updated=updated)
+
 	def _mapper_to_entity(self, mapper: ShopInventoryMapper) -> ShopProduct:
 		"""
 		Convert ShopInventoryMapper to ShopProduct entity
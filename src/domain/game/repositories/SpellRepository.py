@@ -1,4 +1,7 @@
+import typing
+
 from dependency_injector.wiring import Provide, inject
+from sqlalchemy import select
 
 from src.core.Container import Container
 from src.domain.base.factories.PydanticEntityFactory import PydanticEntityFactory
@@ -14,6 +17,9 @@ from src.domain.game.repositories.mappers.SpellMapper import SpellMapper
 
 class SpellRepository(CrudRepository[Spell, SpellMapper], ISpellRepository):
 
+	# Matches 'spell_{kb_id}_%' with escaped underscores
+	_LOC_PATTERN: str = "spell\\_{}\\_%"
+
 	@inject
 	def __init__(
 		self,
@@ -69,6 +75,24 @@ class SpellRepository(CrudRepository[Spell, SpellMapper], ISpellRepository):
 			loc=self._fetch_loc(mapper.kb_id)
 		)
 
+	def _mappers_to_entities(self, mappers: list[SpellMapper]) -> list[Spell]:
+		"""
+		Convert SpellMappers to Spell entities
+
+		Localizations of all spells are fetched with a single query
+
+		:param mappers:
+			SpellMappers to convert
+		:return:
+			Spell entities with populated loc field
+		"""
+		locs = self._fetch_locs([m.kb_id for m in mappers])
+
+		return [
+			PydanticEntityFactory.create_entity(Spell, m, loc=locs.get(m.kb_id))
+			for m in mappers
+		]
+
 	def _get_entity_type_name(self) -> str:
 		"""
 		Get entity type name
@@ -141,6 +165,17 @@ class SpellRepository(CrudRepository[Spell, SpellMapper], ISpellRepository):
 			).first()
 			return self._mapper_to_entity(mapper) if mapper else None
 
+	def get_ids_by_kb_ids(self, kb_ids: typing.Iterable[str] | None = None) -> dict[str, int]:
+		"""
+		Resolve game identifiers to spell IDs with a single query
+
+		:param kb_ids:
+			Game identifiers, or None to resolve every entity
+		:return:
+			Dictionary mapping kb_id to spell ID; unknown kb_ids are omitted
+		"""
+		return self._get_ids_by_kb_ids(SpellMapper, kb_ids)
+
 	def list_all(
 		self,
 		school: SpellSchool | None = None,
@@ -171,7 +206,7 @@ class SpellRepository(CrudRepository[Spell, SpellMapper], ISpellRepository):
 				query = self._apply_sorting(query, sort_by, sort_order)
 
 			mappers = query.all()
-			spells = [self._mapper_to_entity(m) for m in mappers]
+			spells = self._mappers_to_entities(mappers)
 
 			# Sort by localized name in Python if requested
 			if sort_by == "name":
@@ -197,15 +232,19 @@ class SpellRepository(CrudRepository[Spell, SpellMapper], ISpellRepository):
 		with self._get_session() as session:
 			mappers = session.query(SpellMapper).filter(SpellMapper.id.in_(ids)).all()
 
-			result = {}
-			for mapper in mappers:
-				spell = self._mapper_to_entity(mapper)
-				result[spell.id] = spell
+			return {spell.id: spell for spell in self._mappers_to_entities(mappers)}
+
+	def index_search_text(self) -> None:
+		"""
+		Rebuild the full-text search index of spell texts
 
-			return result
+		:return:
+		"""
+		self._index_search_text(SpellMapper)
 
 	def search_with_filters(
 		self,
+		name_query: str | None = None,
 		school: SpellSchool | None = None,
 		profit: int | None = None,
 		sort_by: str = "name",
@@ -215,6 +254,8 @@ class SpellRepository(CrudRepository[Spell, SpellMapper], ISpellRepository):
 		"""
 		Search spells with filter criteria
 
+		:param name_query:
+			Optional name search, every word matching a name word prefix
 		:param school:
 			Optional spell school filter
 		:param profit:
@@ -243,6 +284,10 @@ class SpellRepository(CrudRepository[Spell, SpellMapper], ISpellRepository):
 					(ShopInventoryMapper.profile_id == profile_id)
 				).distinct()
 
+			if name_query:
+				matches = self._search_text_match(SpellMapper, name_query)
+				query = query.filter(SpellMapper.id.in_(select(matches.c.entity_id)))
+
 			# Filter by school
 			if school:
 				query = query.filter(SpellMapper.school == school.value)
@@ -256,7 +301,7 @@ class SpellRepository(CrudRepository[Spell, SpellMapper], ISpellRepository):
 				query = self._apply_sorting(query, sort_by, sort_order)
 
 			mappers = query.all()
-			spells = [self._mapper_to_entity(m) for m in mappers]
+			spells = self._mappers_to_entities(mappers)
 
 			# Sort by localized name in Python if requested
 			if sort_by == "name":
@@ -311,10 +356,21 @@ class SpellRepository(CrudRepository[Spell, SpellMapper], ISpellRepository):
 		:return:
 			LocStrings or None if no localizations found
 		"""
-		pattern = f"spell\\_{kb_id}\\_%"
-		spell_localizations = self._localization_repository.search_by_kb_id(pattern, use_regex=False)
+		return self._fetch_locs([kb_id]).get(kb_id)
+
+	def _fetch_locs(self, kb_ids: list[str]) -> dict[str, LocStrings]:
+		"""
+		Fetch localizations for spells with a single query
 
-		if not spell_localizations:
-			return None
+		:param kb_ids:
+			Spell kb_ids
+		:return:
+			Dictionary mapping kb_id to LocStrings; spells without
+			localizations are omitted
+		"""
+		localizations = self._localization_repository.search_by_kb_id_pattern(self._LOC_PATTERN, kb_ids)
 
-		return self._loc_factory.create_from_localizations(spell_localizations)
+		return {
+			kb_id: self._loc_factory.create_from_localizations(spell_localizations)
+			for kb_id, spell_localizations in localizations.items()
+		}
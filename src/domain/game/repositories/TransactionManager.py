@@ -0,0 +1,28 @@
+import typing
+from contextlib import contextmanager
+
+from src.domain.base.repositories.CrudRepository import GAME_CONTEXT
+from src.domain.game.interfaces.ITransactionManager import ITransactionManager
+
+
+class TransactionManager(ITransactionManager):
+	"""
+	Transactions on the database of the active game (see GAME_CONTEXT)
+	"""
+
+	@contextmanager
+	def transaction(self) -> typing.Iterator[None]:
+		"""
+		Run all repository calls made within the block in one transaction
+
+		:return:
+			Context manager spanning the transaction
+		:raises RuntimeError:
+			If no game context is set
+		"""
+		context = GAME_CONTEXT.get()
+		if context is None:
+			raise RuntimeError("Transaction requires an active game context")
+
+		with context.transaction():
+			yield
@@ -1,3 +1,5 @@
+import typing
+
 from sqlalchemy import desc, asc
 
 from src.domain.base.factories.PydanticEntityFactory import PydanticEntityFactory
@@ -8,6 +10,7 @@ from src.domain.game.entities.UnitClass import UnitClass
 from src.domain.game.entities.UnitMovetype import UnitMovetype
 from src.domain.game.interfaces.IUnitRepository import IUnitRepository
 from src.domain.game.repositories.mappers.UnitMapper import UnitMapper
+from src.utils.db import validate_regexp
 
 
 class UnitRepository(CrudRepository[Unit, UnitMapper], IUnitRepository):
@@ -21,6 +24,7 @@ class UnitRepository(CrudRepository[Unit, UnitMapper], IUnitRepository):
 		:return:
 			UnitMapper instance
 		"""
+		resistance = entity.resistance or {}
 		return UnitMapper(
 			kb_id=entity.kb_id,
 			name=entity.name,
@@ -41,6 +45,12 @@ class UnitRepository(CrudRepository[Unit, UnitMapper], IUnitRepository):
 			initiative=entity.initiative,
 			leadership=entity.leadership,
 			resistance=entity.resistance,
+			resistance_physical=resistance.get('physical'),
+			resistance_poison=resistance.get('poison'),
+			resistance_magic=resistance.get('magic'),
+			resistance_fire=resistance.get('fire'),
+			resistance_glacial=resistance.get('glacial'),
+			resistance_astral=resistance.get('astral'),
 			features=entity.features,
 			attacks=entity.attacks
 		)
@@ -118,6 +128,17 @@ class UnitRepository(CrudRepository[Unit, UnitMapper], IUnitRepository):
 			mapper = session.query(UnitMapper).filter(UnitMapper.kb_id == kb_id).first()
 			return self._mapper_to_entity(mapper) if mapper else None
 
+	def get_ids_by_kb_ids(self, kb_ids: typing.Iterable[str] | None = None) -> dict[str, int]:
+		"""
+		Resolve game identifiers to unit IDs with a single query
+
+		:param kb_ids:
+			Game identifiers, or None to resolve every entity
+		:return:
+			Dictionary mapping kb_id to unit ID; unknown kb_ids are omitted
+		"""
+		return self._get_ids_by_kb_ids(UnitMapper, kb_ids)
+
 	def list_all(
 		self,
 		sort_by: str = "name",
@@ -153,14 +174,23 @@ class UnitRepository(CrudRepository[Unit, UnitMapper], IUnitRepository):
 		:param query_str:
 			Search query
 		:return:
-			List of matching units
+			List of matching units, best matches first
 		"""
+		matches = self._search_text_match(UnitMapper, query_str)
 		with self._get_session() as session:
-			mappers = session.query(UnitMapper).filter(
-				UnitMapper.name.ilike(f"%{query_str}%")
-			).all()
+			mappers = session.query(UnitMapper).join(
+				matches, matches.c.entity_id == UnitMapper.id
+			).order_by(matches.c.rank).all()
 			return [self._mapper_to_entity(mapper) for mapper in mappers]
 
+	def index_search_text(self) -> None:
+		"""
+		Rebuild the full-text search index of unit names
+
+		:return:
+		"""
+		self._index_search_text(UnitMapper)
+
 	def search_with_filters(
 		self,
 		filters: UnitFilterDto,
@@ -181,7 +211,12 @@ class UnitRepository(CrudRepository[Unit, UnitMapper], IUnitRepository):
 			Sort direction (asc, desc)
 		:return:
 			List of units matching all provided criteria
+		:raises InvalidRegexException:
+			When filters.name_regex is not a valid pattern
 		"""
+		if filters.name_regex:
+			validate_regexp(filters.name_regex)
+
 		with self._get_session() as session:
 			query = session.query(UnitMapper)
 
@@ -231,19 +266,19 @@ class UnitRepository(CrudRepository[Unit, UnitMapper], IUnitRepository):
 			if filters.min_initiative is not None:
 				query = query.filter(UnitMapper.initiative >= filters.min_initiative)
 
-			# Filter by resistance values (JSON path queries)
+			# Filter by resistance values
 			if filters.min_resistance_fire is not None:
-				query = query.filter(UnitMapper.resistance['fire'].as_float() >= filters.min_resistance_fire)
+				query = query.filter(UnitMapper.resistance_fire >= filters.min_resistance_fire)
 			if filters.min_resistance_magic is not None:
-				query = query.filter(UnitMapper.resistance['magic'].as_float() >= filters.min_resistance_magic)
+				query = query.filter(UnitMapper.resistance_magic >= filters.min_resistance_magic)
 			if filters.min_resistance_poison is not None:
-				query = query.filter(UnitMapper.resistance['poison'].as_float() >= filters.min_resistance_poison)
+				query = query.filter(UnitMapper.resistance_poison >= filters.min_resistance_poison)
 			if filters.min_resistance_glacial is not None:
-				query = query.filter(UnitMapper.resistance['glacial'].as_float() >= filters.min_resistance_glacial)
+				query = query.filter(UnitMapper.resistance_glacial >= filters.min_resistance_glacial)
 			if filters.min_resistance_physical is not None:
-				query = query.filter(UnitMapper.resistance['physical'].as_float() >= filters.min_resistance_physical)
+				query = query.filter(UnitMapper.resistance_physical >= filters.min_resistance_physical)
 			if filters.min_resistance_astral is not None:
-				query = query.filter(UnitMapper.resistance['astral'].as_float() >= filters.min_resistance_astral)
+				query = query.filter(UnitMapper.resistance_astral >= filters.min_resistance_astral)
 
 			# Filter by level (exact match)
 			if filters.level is not None:
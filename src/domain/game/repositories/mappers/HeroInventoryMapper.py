@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, Enum
+from sqlalchemy import Column, Integer, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship
 
 from src.domain.base.repositories.mappers.base import Base
@@ -7,6 +7,10 @@ from src.domain.game.entities.InventoryEntityType import InventoryEntityType
 
 class HeroInventoryMapper(Base):
 	__tablename__ = "hero_inventory"
+	__table_args__ = (
+		# Profile inventories (optionally by type); the primary key starts with product_id
+		Index("ix_hero_inventory_profile_product", "profile_id", "product_type", "product_id"),
+	)
 
 	product_id = Column(Integer, primary_key=True)
 	product_type = Column(Enum(InventoryEntityType), primary_key=True, nullable=False)
@@ -1,19 +1,40 @@
 from sqlalchemy import Column, Integer, String, JSON, ForeignKey
 from sqlalchemy.orm import relationship
 from src.domain.base.repositories.mappers.base import Base
+from src.domain.game.entities.Propbit import Propbit
 from src.domain.game.entities.ShopProductType import ShopProductType
 
+# Bit of each propbit in ItemMapper.propbit_mask, by Propbit declaration order
+# (stored in game databases, so new propbits must be appended to the enum)
+PROPBIT_BITS: dict[Propbit, int] = {propbit: 1 << i for i, propbit in enumerate(Propbit)}
+
+_PROPBIT_BIT_CASES: str = " ".join(f"WHEN '{propbit.value}' THEN {bit}" for propbit, bit in PROPBIT_BITS.items())
+
 
 class ItemMapper(Base):
 	__tablename__ = "item"
+	__table_args__ = {"info": {"search_text": {"name": "item.name"}}}
 
 	id = Column(Integer, primary_key=True, autoincrement=True)
 	kb_id = Column(String, nullable=False, unique=True)
 	price = Column(Integer, nullable=False, default=0)
 	propbits = Column(JSON, nullable=True)
 	tiers = Column(JSON, nullable=True)
-	item_set_id = Column(Integer, ForeignKey("item_set.id"), nullable=True)
-	level = Column(Integer, nullable=False, default=1)
+	item_set_id = Column(Integer, ForeignKey("item_set.id"), nullable=True, index=True)
+	level = Column(Integer, nullable=False, default=1, index=True)
+
+	# Propbits as a bitmask of PROPBIT_BITS, filtered with a bitwise AND
+	propbit_mask = Column(Integer, nullable=True, default=0, info={
+		"backfill": f"(SELECT COALESCE(SUM(DISTINCT CASE value {_PROPBIT_BIT_CASES} END), 0) FROM json_each(item.propbits))"
+	})
+
+	# Localized texts, resolved from localization when items are scanned
+	name = Column(String, nullable=True, index=True, info={
+		"backfill": "(SELECT text FROM localization WHERE kb_id = 'itm_' || item.kb_id || '_name')"
+	})
+	hint = Column(String, nullable=True, info={
+		"backfill": "(SELECT text FROM localization WHERE kb_id = 'itm_' || item.kb_id || '_hint')"
+	})
 
 	shop_inventory = relationship(
 		"ShopInventoryMapper",
@@ -7,3 +7,11 @@ class ItemSetMapper(Base):
 
 	id = Column(Integer, primary_key=True, autoincrement=True)
 	kb_id = Column(String, nullable=False, unique=True)
+
+	# Localized texts, resolved from localization when item sets are scanned
+	name = Column(String, nullable=True, index=True, info={
+		"backfill": "(SELECT text FROM localization WHERE kb_id = 'itm_' || item_set.kb_id || '_name')"
+	})
+	hint = Column(String, nullable=True, info={
+		"backfill": "(SELECT text FROM localization WHERE kb_id = 'itm_' || item_set.kb_id || '_hint')"
+	})
@@ -18,6 +18,8 @@ class ProfileMapper(Base):
 	last_scan_time = Column(DateTime, nullable=True)
 	last_save_timestamp = Column(Integer, nullable=True)
 	last_corrupted_data = Column(JSON, nullable=True)
+	last_save_digest = Column(String(32), nullable=True)
+	last_sync_result = Column(JSON, nullable=True)
 	is_auto_scan_enabled = Column(Boolean, nullable=False, default=False)
 	game_id = Column(Integer, nullable=False)
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, Enum, String
+from sqlalchemy import Column, Integer, ForeignKey, Enum, Index, String
 from sqlalchemy.orm import relationship
 from src.domain.base.repositories.mappers.base import Base
 from src.domain.game.entities.ShopProductType import ShopProductType
@@ -7,6 +7,11 @@ from src.domain.game.entities.ShopType import ShopType
 
 class ShopInventoryMapper(Base):
 	__tablename__ = "shop_inventory"
+	__table_args__ = (
+		# Profile inventories (optionally by type) and the item/unit/spell
+		# list subqueries selecting product_id; the primary key serves lookups by product
+		Index("ix_shop_inventory_profile_product", "profile_id", "product_type", "product_id"),
+	)
 
 	product_id = Column(Integer, primary_key=True)
 	product_type = Column(Enum(ShopProductType), primary_key=True, nullable=False)
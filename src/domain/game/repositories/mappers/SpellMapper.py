@@ -8,6 +8,9 @@ from src.domain.game.entities.ShopProductType import ShopProductType
 class SpellMapper(Base):
 
 	__tablename__ = "spell"
+	__table_args__ = {"info": {"search_text": {
+		"name": "(SELECT text FROM localization WHERE kb_id = 'spell_' || spell.kb_id || '_name')"
+	}}}
 
 	id = Column(Integer, primary_key=True, autoincrement=True)
 	kb_id = Column(String(255), nullable=False, unique=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, JSON
+from sqlalchemy import Column, Float, Integer, String, JSON
 from sqlalchemy.orm import relationship
 
 from src.domain.base.repositories.mappers.base import Base
@@ -7,17 +7,18 @@ from src.domain.game.entities.ShopProductType import ShopProductType
 
 class UnitMapper(Base):
 	__tablename__ = "unit"
+	__table_args__ = {"info": {"search_text": {"name": "unit.name"}}}
 
 	id = Column(Integer, primary_key=True, autoincrement=True)
 	kb_id = Column(String(255), nullable=False, unique=True)
 	name = Column(String(255), nullable=False)
-	unit_class = Column(String(50), nullable=False)
+	unit_class = Column(String(50), nullable=False, index=True)
 	params = Column(JSON, nullable=False)
 	main = Column(JSON, nullable=False)
-	cost = Column(Integer, nullable=True)
+	cost = Column(Integer, nullable=True, index=True)
 	krit = Column(Integer, nullable=True)
 	race = Column(String(100), nullable=True)
-	level = Column(Integer, nullable=True)
+	level = Column(Integer, nullable=True, index=True)
 	speed = Column(Integer, nullable=True)
 	attack = Column(Integer, nullable=True)
 	defense = Column(Integer, nullable=True)
@@ -26,8 +27,28 @@ class UnitMapper(Base):
 	movetype = Column(Integer, nullable=True)
 	defenseup = Column(Integer, nullable=True)
 	initiative = Column(Integer, nullable=True)
-	leadership = Column(Integer, nullable=True)
+	leadership = Column(Integer, nullable=True, index=True)
 	resistance = Column(JSON, nullable=True)
+
+	# Resistances copied out of the resistance JSON for indexed filtering
+	resistance_physical = Column(Float, nullable=True, index=True, info={
+		"backfill": "json_extract(unit.resistance, '$.physical')"
+	})
+	resistance_poison = Column(Float, nullable=True, index=True, info={
+		"backfill": "json_extract(unit.resistance, '$.poison')"
+	})
+	resistance_magic = Column(Float, nullable=True, index=True, info={
+		"backfill": "json_extract(unit.resistance, '$.magic')"
+	})
+	resistance_fire = Column(Float, nullable=True, index=True, info={
+		"backfill": "json_extract(unit.resistance, '$.fire')"
+	})
+	resistance_glacial = Column(Float, nullable=True, index=True, info={
+		"backfill": "json_extract(unit.resistance, '$.glacial')"
+	})
+	resistance_astral = Column(Float, nullable=True, index=True, info={
+		"backfill": "json_extract(unit.resistance, '$.astral')"
+	})
 	features = Column(JSON, nullable=True)
 	attacks = Column(JSON, nullable=True)
 
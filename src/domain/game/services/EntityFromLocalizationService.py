@@ -26,11 +26,11 @@ class EntityFromLocalizationService(IEntityFromLocalizationService):
 		self._kb_pattern = kb_pattern
 		self._localization_tag = localization_tag
 
-	def scan(self, game_id: int) -> list[TEntity]:
+	def scan(self, game_id: int) -> int:
 		entities = self._parse()
 		if not entities:
-			return []
-		return self._repository.create_batch(entities)
+			return 0
+		return self._repository.create_batch(entities, return_entities=False)
 
 	def _parse(self) -> list[TEntity]:
 		localizations = self._localization_repository.list_all(tag=self._localization_tag)
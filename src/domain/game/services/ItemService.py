@@ -6,7 +6,6 @@ from src.domain.game.entities.ItemSet import ItemSet
 from src.domain.game.entities.Propbit import Propbit
 from src.domain.game.interfaces.IItemRepository import IItemRepository
 from src.domain.game.interfaces.IItemSetRepository import IItemSetRepository
-from src.domain.exceptions import InvalidRegexException
 
 
 class ItemService:
@@ -67,6 +66,8 @@ class ItemService:
 			Optional profile ID filter (shows only items in shop inventory for profile)
 		:return:
 			List of dictionaries with item and set data
+		:raises InvalidRegexException:
+			When hint_regex is not a valid pattern
 		"""
 		# Check if any filter is provided
 		has_filters = any([
@@ -80,29 +81,23 @@ class ItemService:
 		])
 
 		# Get items - use advanced search if filters, otherwise all items
-		try:
-			if has_filters:
-				items = self._item_repository.search_with_filters(
-					name_query=name_query,
-					level=level,
-					hint_regex=hint_regex,
-					propbits=propbits,
-					item_set_id=item_set_id,
-					item_id=item_id,
-					sort_by=sort_by,
-					sort_order=sort_order,
-					profile_id=profile_id
-				)
-			else:
-				items = self._item_repository.list_all(
-					sort_by=sort_by,
-					sort_order=sort_order
-				)
-		except Exception as e:
-			# Check if it's a regex error (PostgreSQL will throw specific error)
-			if "invalid regular expression" in str(e).lower():
-				raise InvalidRegexException(hint_regex or "", e)
-			raise
+		if has_filters:
+			items = self._item_repository.search_with_filters(
+				name_query=name_query,
+				level=level,
+				hint_regex=hint_regex,
+				propbits=propbits,
+				item_set_id=item_set_id,
+				item_id=item_id,
+				sort_by=sort_by,
+				sort_order=sort_order,
+				profile_id=profile_id
+			)
+		else:
+			items = self._item_repository.list_all(
+				sort_by=sort_by,
+				sort_order=sort_order
+			)
 
 		# Collect unique item_set_ids
 		set_ids = {item.item_set_id for item in items if item.item_set_id is not None}
@@ -8,6 +8,7 @@ from src.domain.app.interfaces.IGameRepository import IGameRepository
 from src.domain.game.interfaces.IItemRepository import IItemRepository
 from src.domain.game.interfaces.IItemSetRepository import IItemSetRepository
 from src.domain.game.interfaces.IItemsAndSetsScannerService import IItemsAndSetsScannerService
+from src.domain.game.interfaces.ILocalizationRepository import ILocalizationRepository
 from src.domain.game.entities.Item import Item
 from src.domain.game.entities.ItemSet import ItemSet
 from src.utils.parsers.game_data import IKFSItemsParser
@@ -20,6 +21,7 @@ class ItemsAndSetsScannerService(IItemsAndSetsScannerService):
 		item_repository: IItemRepository = Provide[Container.item_repository],
 		item_set_repository: IItemSetRepository = Provide[Container.item_set_repository],
 		game_repository: IGameRepository = Provide[Container.game_repository],
+		localization_repository: ILocalizationRepository = Provide[Container.localization_repository],
 		parser: IKFSItemsParser = Provide[Container.kfs_items_parser],
 		config: Config = Provide[Container.config],
 		logger: Logger = Provide[Container.logger]
@@ -27,22 +29,28 @@ class ItemsAndSetsScannerService(IItemsAndSetsScannerService):
 		self._item_repository = item_repository
 		self._item_set_repository = item_set_repository
 		self._game_repository = game_repository
+		self._localization_repository = localization_repository
 		self._parser = parser
 		self._config = config
 		self._logger = logger
 
 	def scan(self, game_id: int) -> tuple[list[Item], list[ItemSet]]:
 		parse_results = self._parser.parse(game_id)
+		texts = self._fetch_texts(parse_results)
 
 		all_items = []
 		all_sets = []
 
 		for set_kb_id, items in parse_results.items():
+			for item in items:
+				item.name, item.hint = texts.get(item.kb_id, (None, None))
+
 			if set_kb_id == "setless":
 				created_items = self._item_repository.create_batch(items)
 				all_items.extend(created_items)
 			else:
-				item_set = ItemSet(id=0, kb_id=set_kb_id)
+				name, hint = texts.get(set_kb_id, (None, None))
+				item_set = ItemSet(id=0, kb_id=set_kb_id, name=name, hint=hint)
 				self._logger.debug(f"Saving item set: {item_set}")
 				created_set = self._item_set_repository.create(item_set)
 				all_sets.append(created_set)
@@ -57,4 +65,30 @@ class ItemsAndSetsScannerService(IItemsAndSetsScannerService):
 				created_items = self._item_repository.create_batch(items)
 				all_items.extend(created_items)
 
+		self._item_repository.index_search_text()
 		return all_items, all_sets
+
+	def _fetch_texts(self, parse_results: dict[str, list[Item]]) -> dict[str, tuple[str | None, str | None]]:
+		"""
+		Resolve localized names and hints of items and item sets
+
+		Localizations are scanned first, so texts are stored with the items
+		and listing them needs no join with the localization table.
+
+		:param parse_results:
+			Parsed items grouped by item set kb_id
+		:return:
+			Dictionary mapping item or item set kb_id to (name, hint)
+		"""
+		kb_ids = {item.kb_id for items in parse_results.values() for item in items}
+		kb_ids.update(set_kb_id for set_kb_id in parse_results if set_kb_id != "setless")
+
+		localizations = self._localization_repository.get_by_kb_ids(
+			f"itm_{kb_id}_{suffix}" for kb_id in kb_ids for suffix in ("name", "hint")
+		)
+
+		def text(key: str) -> str | None:
+			localization = localizations.get(key)
+			return localization.text if localization else None
+
+		return {kb_id: (text(f"itm_{kb_id}_name"), text(f"itm_{kb_id}_hint")) for kb_id in kb_ids}
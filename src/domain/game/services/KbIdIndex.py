@@ -0,0 +1,125 @@
+import threading
+import typing
+
+from dependency_injector.wiring import Provide
+
+from src.core.Container import Container
+from src.domain.base.entities.BaseEntity import BaseEntity
+from src.domain.base.repositories.CrudRepository import GAME_CONTEXT
+from src.domain.game.entities.Actor import Actor
+from src.domain.game.entities.AtomMap import AtomMap
+from src.domain.game.entities.Item import Item
+from src.domain.game.entities.Spell import Spell
+from src.domain.game.entities.Unit import Unit
+from src.domain.game.interfaces.IEntityRepository import IEntityRepository
+from src.domain.game.interfaces.IItemRepository import IItemRepository
+from src.domain.game.interfaces.IKbIdIndex import IKbIdIndex
+from src.domain.game.interfaces.ISpellRepository import ISpellRepository
+from src.domain.game.interfaces.IUnitRepository import IUnitRepository
+
+
+class KbIdIndex(IKbIdIndex):
+	"""
+	In-process kb_id -> ID index of game entities, one per game
+
+	Game data only changes when game files are rescanned, so the index of
+	the active game (see GAME_CONTEXT) is loaded on first use with one query
+	per entity type and kept until invalidate() is called.
+	"""
+
+	def __init__(
+		self,
+		item_repository: IItemRepository = Provide[Container.item_repository],
+		spell_repository: ISpellRepository = Provide[Container.spell_repository],
+		unit_repository: IUnitRepository = Provide[Container.unit_repository],
+		atom_map_repository: IEntityRepository[AtomMap] = Provide[Container.atom_map_repository],
+		actor_repository: IEntityRepository[Actor] = Provide[Container.actor_repository]
+	):
+		self._repositories = {
+			Item: item_repository,
+			Spell: spell_repository,
+			Unit: unit_repository,
+			AtomMap: atom_map_repository,
+			Actor: actor_repository
+		}
+		self._indexes: dict[int | None, dict[type[BaseEntity], dict[str, int]]] = {}
+		self._lock = threading.Lock()
+
+	def get_id(self, entity_type: type[BaseEntity], kb_id: str) -> int | None:
+		"""
+		Get ID of game entity by its game identifier
+
+		:param entity_type:
+			Entity type (Item, Spell, Unit, AtomMap or Actor)
+		:param kb_id:
+			Game identifier
+		:return:
+			Entity ID or None if not found
+		"""
+		return self._get_index(entity_type).get(kb_id)
+
+	def get_ids(self, entity_type: type[BaseEntity], kb_ids: typing.Iterable[str]) -> dict[str, int]:
+		"""
+		Get IDs of game entities by their game identifiers
+
+		:param entity_type:
+			Entity type (Item, Spell, Unit, AtomMap or Actor)
+		:param kb_ids:
+			Game identifiers
+		:return:
+			Dictionary mapping kb_id to entity ID; unknown kb_ids are omitted
+		"""
+		index = self._get_index(entity_type)
+		return {kb_id: index[kb_id] for kb_id in kb_ids if kb_id in index}
+
+	def contains(self, entity_type: type[BaseEntity], kb_id: str) -> bool:
+		"""
+		Check whether game entity exists
+
+		:param entity_type:
+			Entity type (Item, Spell, Unit, AtomMap or Actor)
+		:param kb_id:
+			Game identifier
+		:return:
+			True if entity exists
+		"""
+		return kb_id in self._get_index(entity_type)
+
+	def invalidate(self, game_id: int | None = None) -> None:
+		"""
+		Drop cached identifiers of a game, or of all games
+
+		:param game_id:
+			Game ID or None to drop everything
+		:return:
+		"""
+		with self._lock:
+			if game_id is None:
+				self._indexes.clear()
+			else:
+				self._indexes.pop(game_id, None)
+
+	def _get_index(self, entity_type: type[BaseEntity]) -> dict[str, int]:
+		"""
+		Get kb_id -> ID index of entity type for the active game
+
+		:param entity_type:
+			Entity type
+		:return:
+			Dictionary mapping kb_id to entity ID
+		"""
+		context = GAME_CONTEXT.get()
+		game_id = context.game_id if context else None
+
+		indexes = self._indexes.get(game_id)
+		if indexes is None:
+			with self._lock:
+				indexes = self._indexes.get(game_id)
+				if indexes is None:
+					indexes = {
+						t: repository.get_ids_by_kb_ids()
+						for t, repository in self._repositories.items()
+					}
+					self._indexes[game_id] = indexes
+
+		return indexes[entity_type]
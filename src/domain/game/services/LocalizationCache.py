@@ -0,0 +1,70 @@
+import threading
+import typing
+
+from dependency_injector.wiring import Provide
+
+from src.core.Container import Container
+from src.domain.base.repositories.CrudRepository import GAME_CONTEXT
+from src.domain.game.interfaces.ILocalizationCache import ILocalizationCache
+from src.domain.game.interfaces.ILocalizationRepository import ILocalizationRepository
+
+
+class LocalizationCache(ILocalizationCache):
+	"""
+	In-process cache of localized texts, one per game
+
+	Localizations only change when game files are rescanned, so texts of
+	the active game (see GAME_CONTEXT) are loaded on first request, with one
+	query for all missing kb_ids, and kept until invalidate() is called.
+	"""
+
+	def __init__(
+		self,
+		localization_repository: ILocalizationRepository = Provide[Container.localization_repository]
+	):
+		self._localization_repository = localization_repository
+		self._texts: dict[int | None, dict[str, str | None]] = {}
+		self._lock = threading.Lock()
+
+	def get_texts(self, kb_ids: typing.Iterable[str]) -> dict[str, str]:
+		"""
+		Get localized texts by their game identifiers
+
+		:param kb_ids:
+			Localization kb_ids
+		:return:
+			Dictionary mapping kb_id to text; unknown kb_ids are omitted
+		"""
+		context = GAME_CONTEXT.get()
+		game_id = context.game_id if context else None
+
+		kb_ids = set(kb_ids)
+		with self._lock:
+			texts = self._texts.setdefault(game_id, {})
+			missing = kb_ids.difference(texts)
+
+		if missing:
+			localizations = self._localization_repository.get_by_kb_ids(missing)
+			fetched = {}
+			for kb_id in missing:
+				localization = localizations.get(kb_id)
+				fetched[kb_id] = localization.text if localization else None
+			with self._lock:
+				texts = self._texts.setdefault(game_id, {})
+				texts.update(fetched)
+
+		return {kb_id: texts[kb_id] for kb_id in kb_ids if texts.get(kb_id) is not None}
+
+	def invalidate(self, game_id: int | None = None) -> None:
+		"""
+		Drop cached texts of a game, or of all games
+
+		:param game_id:
+			Game ID or None to drop everything
+		:return:
+		"""
+		with self._lock:
+			if game_id is None:
+				self._texts.clear()
+			else:
+				self._texts.pop(game_id, None)
@@ -3,7 +3,6 @@ from dependency_injector.wiring import Provide
 from src.core.Config import Config
 from src.core.Container import Container
 from src.domain.app.interfaces.IGameRepository import IGameRepository
-from src.domain.game.entities.Localization import Localization
 from src.domain.game.interfaces.ILocalizationRepository import ILocalizationRepository
 from src.domain.game.interfaces.ILocalizationScannerService import ILocalizationScannerService
 from src.utils.parsers.game_data.IKFSLocalizationParser import IKFSLocalizationParser
@@ -23,7 +22,7 @@ class LocalizationScannerService(ILocalizationScannerService):
 		self._game_repository = game_repository
 		self._config = config
 
-	def scan(self, game_id: int, lang: str = 'rus') -> list[Localization]:
+	def scan(self, game_id: int, lang: str = 'rus') -> int:
 		all_localizations = dict()
 
 		for localization_config in self._config.localization_config:
@@ -42,4 +41,4 @@ class LocalizationScannerService(ILocalizationScannerService):
 		if not all_localizations:
 			raise FileNotFoundError(f"Can't find any localizations files for game {game_id}")
 
-		return self._repository.create_batch(list(all_localizations.values()))
+		return self._repository.create_batch(list(all_localizations.values()), return_entities=False)
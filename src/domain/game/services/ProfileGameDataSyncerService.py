@@ -1,23 +1,19 @@
 import typing
-from dataclasses import dataclass
 from logging import Logger
-from typing import Any
 
 from dependency_injector.wiring import Provide
 
 from src.core.Container import Container
-from src.domain.base.entities.BaseEntity import BaseEntity
-from src.domain.exceptions import DuplicateEntityException
 from src.domain.game.entities.Actor import Actor
 from src.domain.game.entities.AtomMap import AtomMap
+from src.domain.game.entities.Item import Item
 from src.domain.game.entities.ShopType import ShopType
-from src.domain.game.interfaces.IEntityRepository import IEntityRepository
-from src.domain.game.interfaces.IItemRepository import IItemRepository
+from src.domain.game.entities.Spell import Spell
+from src.domain.game.entities.Unit import Unit
+from src.domain.game.interfaces.IKbIdIndex import IKbIdIndex
 from src.domain.game.interfaces.IProfileGameDataSyncerService import IProfileGameDataSyncerService
 from src.domain.game.interfaces.IShopInventoryRepository import IShopInventoryRepository
 from src.domain.game.interfaces.IHeroInventoryRepository import IHeroInventoryRepository
-from src.domain.game.interfaces.ISpellRepository import ISpellRepository
-from src.domain.game.interfaces.IUnitRepository import IUnitRepository
 from src.domain.game.dto.ProfileSyncResult import ProfileSyncResult, ProfileSyncShopResult, \
 	ProfileSyncHeroInventoryResult
 from src.domain.game.entities.MissedShopsData import MissedShopsData
@@ -29,30 +25,16 @@ from src.domain.game.entities.InventoryEntityType import InventoryEntityType
 from src.utils.parsers.save_data.SaveFileData import SaveFileData, HeroInventory
 
 
-@dataclass
-class _SyncItemResult:
-	count: int
-	missing_kb_ids: list[str]
-
-
 class ProfileGameDataSyncerService(IProfileGameDataSyncerService):
 
 	def __init__(
 		self,
-		item_repository: IItemRepository = Provide[Container.item_repository],
-		spell_repository: ISpellRepository = Provide[Container.spell_repository],
-		unit_repository: IUnitRepository = Provide[Container.unit_repository],
-		atom_map_repository: IEntityRepository[AtomMap] = Provide[Container.atom_map_repository],
-		actor_repository: IEntityRepository[Actor] = Provide[Container.actor_repository],
+		kb_id_index: IKbIdIndex = Provide[Container.kb_id_index],
 		shop_inventory_repository: IShopInventoryRepository = Provide[Container.shop_inventory_repository],
 		hero_inventory_repository: IHeroInventoryRepository = Provide[Container.hero_inventory_repository],
 		logger: Logger = Provide[Container.logger]
 	):
-		self._item_repository = item_repository
-		self._spell_repository = spell_repository
-		self._unit_repository = unit_repository
-		self._atom_map_repository = atom_map_repository
-		self._actor_repository = actor_repository
+		self._kb_id_index = kb_id_index
 		self._shop_inventory_repository = shop_inventory_repository
 		self._hero_inventory_repository = hero_inventory_repository
 		self._looger = logger
@@ -87,96 +69,122 @@ class ProfileGameDataSyncerService(IProfileGameDataSyncerService):
 		"""
 		Sync hero inventory items to database
 
+		Only the difference with the inventory stored for the profile is written.
+
 		:param data:
 			Hero inventory data from save file
 		:param profile_id:
 			Profile ID to associate inventory with
 		:return:
-			ProfileSyncHeroInventoryResult with item count and missed data
+			ProfileSyncHeroInventoryResult with item count, missed data and changes
 		"""
-		if not data or not data.items:
-			return ProfileSyncHeroInventoryResult(items=0, missed_data=None)
+		game_objects = data.items if data else []
+		item_ids = self._kb_id_index.get_ids(Item, (o.kb_id for o in game_objects))
 
-		count = 0
+		inventory: dict[int, HeroInventoryProduct] = {}
 		missing_kb_ids: list[str] = []
 
-		for game_object in data.items:
+		for game_object in game_objects:
 			kb_id = game_object.kb_id
-			item = self._item_repository.get_by_kb_id(kb_id)
+			item_id = item_ids.get(kb_id)
 
-			if not item:
+			if item_id is None:
 				missing_kb_ids.append(kb_id)
 				self._looger.warning(f"Item not found in database: {kb_id}")
 				continue
 
-			inventory = HeroInventoryProduct(
-				product_id=item.id,
+			# Same item in several slots is stored as one entry with summed count
+			if item_id in inventory:
+				inventory[item_id].count += game_object.quantity
+				continue
+
+			inventory[item_id] = HeroInventoryProduct(
+				product_id=item_id,
 				product_type=InventoryEntityType.ITEM,
 				count=game_object.quantity,
 				profile_id=profile_id
 			)
 
-			self._hero_inventory_repository.create(inventory)
-			count += 1
+		changes = self._hero_inventory_repository.sync_profile(profile_id, list(inventory.values()))
 
 		missed_data = None
 		if missing_kb_ids:
 			missed_data = MissedHeroInventoryData(items=list(set(missing_kb_ids)))
 
-		return ProfileSyncHeroInventoryResult(items=count, missed_data=missed_data)
+		return ProfileSyncHeroInventoryResult(items=len(inventory), missed_data=missed_data, changes=changes)
 
 	def _sync_shops(self, data: list[dict[str, typing.Any]], profile_id: int) -> ProfileSyncShopResult:
+		"""
+		Sync shop inventories to database
+
+		Shop and product kb_ids are resolved through the game entity index,
+		then only the difference with the inventory stored for the profile
+		is written.
 
+		:param data:
+			Parsed shops
+		:param profile_id:
+			Profile ID to associate inventories with
+		:return:
+			ProfileSyncShopResult with counts, missed data and changes
+		"""
 		counts = {"items": 0, "spells": 0, "units": 0, "garrison": 0}
 		missing_data = {"items": [], "spells": [], "units": [], "garrison": [], "shops": []}
+		products: dict[tuple, ShopProduct] = {}
+
+		shops = [shop_data for shop_data in data if any(shop_data['inventory'][key] for key in counts)]
+		sources = (
+			("items", None, ShopProductType.ITEM, Item),
+			("spells", lambda n: n[6:], ShopProductType.SPELL, Spell),    # spell_
+			("units", None, ShopProductType.UNIT, Unit),
+			("garrison", None, ShopProductType.GARRISON, Unit),
+		)
 
-		for shop_data in data:
+		for shop_data in shops:
 			inventory = shop_data['inventory']
 
-			if not inventory['items'] and not inventory['spells'] and not inventory['units'] and not inventory['garrison']:
-				continue
-
-			params: dict[str, int | None | ShopType | str] = dict(
-				shop_id=None,
-				profile_id=profile_id,
-				location=shop_data.get('location')
-			)
 			if shop_data['itext']:
 				kb_id = shop_data['itext']
-				shop = self._atom_map_repository.get_by_kb_id(kb_id)
-				params['shop_type'] = ShopType.ATOM
+				shop_id = self._kb_id_index.get_id(AtomMap, kb_id)
+				shop_type = ShopType.ATOM
 			elif shop_data['actor']:
 				kb_id = shop_data['actor']
-				shop = self._actor_repository.get_by_kb_id(kb_id)
-				params['shop_type'] = ShopType.ACTOR
+				shop_id = self._kb_id_index.get_id(Actor, kb_id)
+				shop_type = ShopType.ACTOR
 			else:
 				raise ValueError("Invalid shop data. Either itext or actor must be present")
 
-			if not shop:
+			if shop_id is None:
 				missing_data["shops"].append(kb_id)
 				self._looger.warning(f"Shop not found: {kb_id}. Shop data: {shop_data}")
 				continue
-			params['shop_id'] = shop.id
-
-			for (key, kb_id_fn, product_type, repository) in (
-				("items", None, ShopProductType.ITEM, self._item_repository),
-				("spells", lambda n: n[6:], ShopProductType.SPELL, self._spell_repository),    # spell_
-				("units", None, ShopProductType.UNIT, self._unit_repository),
-				("garrison", None, ShopProductType.GARRISON, self._unit_repository),
-			):
-				try:
-					result = self._sync(
-						inventory[key],
-						kb_id_fn=kb_id_fn,
+
+			for (key, kb_id_fn, product_type, entity_type) in sources:
+				for raw_data in inventory[key]:
+					product_kb_id = kb_id_fn(raw_data['name']) if kb_id_fn else raw_data['name']
+					product_id = self._kb_id_index.get_id(entity_type, product_kb_id)
+
+					if product_id is None:
+						missing_data[key].append(product_kb_id)
+						continue
+
+					product = ShopProduct(
+						product_id=product_id,
+						shop_id=shop_id,
+						shop_type=shop_type,
+						profile_id=profile_id,
 						product_type=product_type,
-						repository=repository,
-						**params
+						count=raw_data['quantity'],
+						location=shop_data.get('location')
 					)
-				except DuplicateEntityException as e:
-					self._looger.warning(f"Duplicate entity detected: {e}")
-					continue
-				counts[key] += result.count
-				missing_data[key].extend(result.missing_kb_ids)
+					product_key = self._shop_product_key(product)
+					if product_key in products:
+						self._looger.warning(f"Duplicate entity detected: {product}")
+						continue
+					products[product_key] = product
+					counts[key] += 1
+
+		changes = self._shop_inventory_repository.sync_profile(profile_id, list(products.values()))
 
 		missed_data = self._build_corrupted_data(
 			shops=missing_data["shops"],
@@ -190,44 +198,24 @@ class ProfileGameDataSyncerService(IProfileGameDataSyncerService):
 			spells=counts["spells"],
 			units=counts["units"],
 			garrison=counts["garrison"],
-			missed_data=missed_data
+			missed_data=missed_data,
+			changes=changes
 		)
 
-	def _sync(
-		self,
-		raw_datas: list[dict[str, Any]],
-		shop_id: int,
-		shop_type: ShopType,
-		profile_id: int,
-		location: str | None,
-		kb_id_fn: typing.Callable[[str], str],
-		product_type: ShopProductType,
-		repository
-	) -> _SyncItemResult:
-		count = 0
-		missing_kb_ids: list[str] = []
-
-		for raw_data in raw_datas:
-			kb_id = kb_id_fn(raw_data['name']) if kb_id_fn else raw_data['name']
-			product: BaseEntity = repository.get_by_kb_id(kb_id)
-
-			if not product:
-				missing_kb_ids.append(kb_id)
-				continue
-
-			inventory = ShopProduct(
-				product_id=product.id,
-				shop_id=shop_id,
-				shop_type=shop_type,
-				profile_id=profile_id,
-				product_type=product_type,
-				count=raw_data['quantity'],
-				location=location
-			)
-			self._shop_inventory_repository.create(inventory)
-			count += 1
+	@staticmethod
+	def _shop_product_key(product: ShopProduct) -> tuple:
+		"""
+		Get primary key of shop inventory entry
 
-		return _SyncItemResult(count=count, missing_kb_ids=missing_kb_ids)
+		:param product:
+			Shop inventory entry
+		:return:
+			Tuple of primary key values
+		"""
+		return (
+			product.product_id, product.product_type, product.shop_id,
+			product.shop_type, product.location, product.profile_id
+		)
 
 	@staticmethod
 	def _build_corrupted_data(
@@ -15,6 +15,7 @@ from src.domain.game.interfaces.IProfileService import IProfileService
 from src.domain.game.interfaces.ISaveFileService import ISaveFileService
 from src.domain.game.interfaces.IShopInventoryRepository import IShopInventoryRepository
 from src.domain.game.interfaces.IHeroInventoryRepository import IHeroInventoryRepository
+from src.domain.game.interfaces.ITransactionManager import ITransactionManager
 
 
 class ProfileService(IProfileService):
@@ -26,7 +27,8 @@ class ProfileService(IProfileService):
 		save_file_service: ISaveFileService = Provide[Container.save_file_service],
 		config: Config = Provide[Container.config],
 		shop_inventory_repository: IShopInventoryRepository = Provide[Container.shop_inventory_repository],
-		hero_inventory_repository: IHeroInventoryRepository = Provide[Container.hero_inventory_repository]
+		hero_inventory_repository: IHeroInventoryRepository = Provide[Container.hero_inventory_repository],
+		transaction_manager: ITransactionManager = Provide[Container.transaction_manager]
 	):
 		self._profile_repository = profile_repository
 		self._data_syncer = data_syncer
@@ -34,6 +36,7 @@ class ProfileService(IProfileService):
 		self._config = config
 		self._shop_inventory_repository = shop_inventory_repository
 		self._hero_inventory_repository = hero_inventory_repository
+		self._transaction_manager = transaction_manager
 
 	def create_profile(
 		self,
@@ -122,6 +125,11 @@ class ProfileService(IProfileService):
 		self._shop_inventory_repository.delete_by_profile(profile_id)
 		self._hero_inventory_repository.delete_by_profile(profile_id)
 
+		# Next scan of the same save must rebuild the cleared inventories
+		profile.last_save_digest = None
+		profile.last_sync_result = None
+		self._profile_repository.update(profile)
+
 	def scan_most_recent_save(self, profile_id: int) -> ProfileSyncResult:
 		"""
 		Scan most recent save file and sync shop inventories
@@ -143,16 +151,42 @@ class ProfileService(IProfileService):
 		return self.scan_save(profile, save_path)
 
 	def scan_save(self, profile: ProfileEntity, save_path: Path) -> ProfileSyncResult:
-		self.clear_profile(profile.id)
+		"""
+		Scan save file and sync shop and hero inventories
+
+		A save whose contents match the digest stored by the previous scan is
+		neither parsed nor synced again; the stored result is returned instead.
+		Otherwise only the difference with the stored inventories is written.
+		Shop and hero inventories and the profile, with the digest of the
+		synced save, are written in one transaction.
+
+		:param profile:
+			Profile to scan for
+		:param save_path:
+			Path to save file
+		:return:
+			ProfileSyncResult with counts and corrupted data
+		"""
+		save_digest = self._save_file_service.compute_save_digest(save_path)
 
-		save_data = self._save_file_service.scan_save_data(save_path)
-		result = self._data_syncer.sync(save_data, profile.id)
+		save_data = None
+		if not (profile.last_sync_result and profile.last_save_digest == save_digest):
+			save_data = self._save_file_service.scan_save_data(save_path)
 
 		save_timestamp = int(save_path.stat().st_mtime)
 
-		profile.last_scan_time = datetime.now()
-		profile.last_save_timestamp = save_timestamp
-		profile.last_corrupted_data = result.shops.missed_data
-		self._profile_repository.update(profile)
+		with self._transaction_manager.transaction():
+			if save_data is None:
+				result = profile.last_sync_result
+			else:
+				result = self._data_syncer.sync(save_data, profile.id)
+
+				profile.last_save_digest = save_digest
+				profile.last_sync_result = result
+				profile.last_corrupted_data = result.shops.missed_data
+
+			profile.last_scan_time = datetime.now()
+			profile.last_save_timestamp = save_timestamp
+			self._profile_repository.update(profile)
 
 		return result
@@ -19,6 +19,8 @@ from src.utils.parsers.save_data.SaveFileData import SaveFileData
 
 class SaveFileService(ISaveFileService):
 
+	_DIGEST_CHUNK_SIZE: int = 1024 * 1024
+
 	def __init__(
 		self,
 		config: Config = Provide[Container.config],
@@ -140,6 +142,32 @@ class SaveFileService(ISaveFileService):
 
 		raise FileNotFoundError(f"No matching save found for profile {profile.id}. Pattern: {pattern_str}")
 
+	def compute_save_digest(self, save_path: Path) -> str:
+		"""
+		Compute digest of save file contents
+
+		Hashes the raw (still compressed) bytes of the .sav archive or of
+		every file of a save directory, so it is much cheaper than parsing.
+
+		:param save_path:
+			Path to save (directory or .sav archive)
+		:return:
+			BLAKE2b-128 digest as hex string
+		"""
+		if save_path.is_dir():
+			files = sorted(p for p in save_path.iterdir() if p.is_file())
+		else:
+			files = [save_path]
+
+		digest = hashlib.blake2b(digest_size=16)
+		for file in files:
+			digest.update(file.name.encode('utf-8'))
+			with open(file, 'rb') as f:
+				for chunk in iter(lambda: f.read(self._DIGEST_CHUNK_SIZE), b''):
+					digest.update(chunk)
+
+		return digest.hexdigest()
+
 	def compute_hash(self, full_name: str) -> str:
 		"""
 		Compute hash from hero full name
@@ -10,6 +10,8 @@ from src.domain.game.entities.AtomMap import AtomMap
 from src.domain.game.interfaces.IEntityFromLocalizationService import IEntityFromLocalizationService
 from src.domain.app.interfaces.IGameRepository import IGameRepository
 from src.domain.game.interfaces.IItemsAndSetsScannerService import IItemsAndSetsScannerService
+from src.domain.game.interfaces.IKbIdIndex import IKbIdIndex
+from src.domain.game.interfaces.ILocalizationCache import ILocalizationCache
 from src.domain.game.interfaces.ILocalizationScannerService import ILocalizationScannerService
 from src.domain.game.interfaces.ISpellsScannerService import ISpellsScannerService
 from src.domain.game.interfaces.IUnitsScannerService import IUnitsScannerService
@@ -32,6 +34,8 @@ class ScannerService:
 		atom_map_scanner_service: IEntityFromLocalizationService[AtomMap] = Provide[Container.atom_map_scanner_service],
 		actor_scanner_service: IEntityFromLocalizationService[Actor] = Provide[Container.actor_scanner_service],
 		game_data_extractor: IGameDataExtractor = Provide[Container.game_data_extractor],
+		kb_id_index: IKbIdIndex = Provide[Container.kb_id_index],
+		localization_cache: ILocalizationCache = Provide[Container.localization_cache],
 		config: Config = Provide[Container.config]
 	):
 		self._game_repository = game_repository
@@ -42,6 +46,8 @@ class ScannerService:
 		self._atom_map_scanner = atom_map_scanner_service
 		self._actor_scanner = actor_scanner_service
 		self._game_data_extractor = game_data_extractor
+		self._kb_id_index = kb_id_index
+		self._localization_cache = localization_cache
 		self._config = config
 
 	def scan_game_files_stream(
@@ -78,17 +84,22 @@ class ScannerService:
 			# Update last_scan_time at start of scan
 			self._game_repository.update_last_scan_time(game_id, datetime.now())
 
-			# Extract archives and copy loose session files ONCE
+			# Extract archives and copy loose session files ONCE (skipped when unchanged)
 			yield ScanProgressEvent(
 				event_type=ScanEventType.EXTRACTION_STARTED,
 				message="Extracting game data..."
 			)
 
-			self._game_data_extractor.extract(game)
+			extraction = self._game_data_extractor.extract(game)
 
 			yield ScanProgressEvent(
 				event_type=ScanEventType.EXTRACTION_COMPLETED,
-				message="Game data extraction complete"
+				count=len(extraction.refreshed),
+				message=(
+					"Game data unchanged, extraction skipped"
+					if extraction.skipped
+					else f"Game data extraction complete: {', '.join(extraction.refreshed)}"
+				)
 			)
 
 			# Step 1: Scan localizations
@@ -98,8 +109,7 @@ class ScannerService:
 				message="Scanning localization files"
 			)
 
-			localizations = self._localization_scanner.scan(game_id, language)
-			localizations_count = len(localizations)
+			localizations_count = self._localization_scanner.scan(game_id, language)
 
 			yield ScanProgressEvent(
 				event_type=ScanEventType.RESOURCE_COMPLETED,
@@ -174,13 +184,13 @@ class ScannerService:
 				message="Parsing atoms"
 			)
 
-			atoms = self._atom_map_scanner.scan(game_id)
+			atoms_count = self._atom_map_scanner.scan(game_id)
 
 			yield ScanProgressEvent(
 				event_type=ScanEventType.RESOURCE_COMPLETED,
 				resource_type=ResourceType.ATOMS,
-				count=len(atoms),
-				message=f"Created {len(atoms)} atoms"
+				count=atoms_count,
+				message=f"Created {atoms_count} atoms"
 			)
 
 			# Step 6: Parse and create actors
@@ -190,23 +200,28 @@ class ScannerService:
 				message="Parsing actors"
 			)
 
-			actors = self._actor_scanner.scan(game_id)
+			actors_count = self._actor_scanner.scan(game_id)
+
+			# Game entities were recreated, cached identifiers and texts are stale
+			self._kb_id_index.invalidate(game_id)
+			self._localization_cache.invalidate(game_id)
 
 			yield ScanProgressEvent(
 				event_type=ScanEventType.RESOURCE_COMPLETED,
 				resource_type=ResourceType.ACTORS,
-				count=len(actors),
-				message=f"Created {len(actors)} actors"
+				count=actors_count,
+				message=f"Created {actors_count} actors"
 			)
 
 			# Final results
 			results = ScanResults(
 				items=total_items,
-				atoms=len(atoms),
+				atoms=atoms_count,
 				sets=total_sets,
 				localizations=localizations_count,
 				spells=total_spells,
-				units=total_units
+				units=total_units,
+				extraction_skipped=extraction.skipped
 			)
 
 			yield ScanProgressEvent(
@@ -224,6 +239,10 @@ class ScannerService:
 			# Clean up temporary extracted files on error
 			# if game:
 			# 	self._game_data_extractor.cleanup(game)
+			# Partially scanned entities may already be stored
+			self._kb_id_index.invalidate(game_id)
+			self._localization_cache.invalidate(game_id)
+
 			# Emit error event with structured error data
 			yield ScanProgressEvent(
 				event_type=ScanEventType.SCAN_ERROR,
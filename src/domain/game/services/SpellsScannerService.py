@@ -53,4 +53,5 @@ class SpellsScannerService(ISpellsScannerService):
 		raw_data_dict = self._parser.parse(game_id)
 		spells = self._spell_factory.create_batch_from_raw_data(raw_data_dict)
 		created_spells = self._spell_repository.create_batch(spells)
+		self._spell_repository.index_search_text()
 		return created_spells
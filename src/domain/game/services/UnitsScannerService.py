@@ -53,4 +53,5 @@ class UnitsScannerService(IUnitsScannerService):
 		raw_data_dict = self._parser.parse(game_id)
 		units = self._unit_factory.create_batch_from_raw_data(raw_data_dict)
 		created_units = self._unit_repository.create_batch(units)
+		self._unit_repository.index_search_text()
 		return created_units
@@ -52,16 +52,17 @@ class ProfileAutoScannerCLI(CLITool[LaunchParams]):
 			game_context = GameContext(game.id, schema_name)
 			GAME_CONTEXT.set(game_context)
 
-			all_profiles = profile_service.list_profiles()
-			auto_scan_profiles = [p for p in all_profiles if p.is_auto_scan_enabled]
+			with game_context.session_scope():
+				all_profiles = profile_service.list_profiles()
+				auto_scan_profiles = [p for p in all_profiles if p.is_auto_scan_enabled]
 
-			if not auto_scan_profiles:
-				self._log(f"No profiles with auto-scan enabled found.", game=game)
-				continue
-			self._log(f"{len(auto_scan_profiles)} profiles with auto-scan enabled found.", game=game)
+				if not auto_scan_profiles:
+					self._log(f"No profiles with auto-scan enabled found.", game=game)
+					continue
+				self._log(f"{len(auto_scan_profiles)} profiles with auto-scan enabled found.", game=game)
 
-			for profile in auto_scan_profiles:
-				self._process_profile(profile, game, profile_service, save_file_service)
+				for profile in auto_scan_profiles:
+					self._process_profile(profile, game, profile_service, save_file_service)
 
 	def _process_profile(
 		self,
@@ -1,16 +1,87 @@
+import functools
 import os
 import re
+import typing
 
-from sqlalchemy import create_engine, event
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, event, inspect, make_url, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session
 
 from src.domain.base.repositories.mappers.base import Base
+from src.domain.exceptions import InvalidRegexException
 
 # Tables that live in the shared application database (app.db).
 # Every other mapped table is game-specific and lives in a per-game database file.
 _APP_TABLE_NAMES: set[str] = {"game", "meta"}
 
+# Prepared statements cached per SQLite connection (driver default: 128)
+_SQLITE_CACHED_STATEMENTS: int = 256
+
+# Distinct REGEXP patterns kept compiled; a query uses one pattern for every row
+_REGEXP_CACHE_SIZE: int = 64
+
+# Full-text index over localized entity texts. FTS5 virtual tables cannot be
+# created by ``create_all``, so the table lives outside ``Base.metadata`` and
+# is only described here for building queries. Tables opt in with
+# ``info={"search_text": {<column>: <SQL expression>}}``; ``entity_type``
+# holds the table name. Each game database holds one language. Only names
+# are searched, so only names are indexed.
+SEARCH_TEXT_COLUMNS: tuple[str, ...] = ("name",)
+
+search_text_table = Table(
+	"search_text",
+	MetaData(),
+	Column("entity_type", String),
+	Column("entity_id", Integer),
+	*(Column(name, String) for name in SEARCH_TEXT_COLUMNS),
+	Column("rank")
+)
+
+_SEARCH_TEXT_DDL: str = (
+	'CREATE VIRTUAL TABLE IF NOT EXISTS search_text USING fts5('
+	'entity_type UNINDEXED, entity_id UNINDEXED, name, '
+	"tokenize = 'unicode61 remove_diacritics 2')"
+)
+
+# unicode61 folds case for Cyrillic but keeps ё distinct from е
+_SEARCH_FOLD_TABLE: dict[int, str] = str.maketrans("ёЁ", "еЕ")
+
+_SEARCH_TERM_PATTERN: re.Pattern = re.compile(r"\w+")
+
+
+@functools.lru_cache(maxsize=_REGEXP_CACHE_SIZE)
+def _compile_regexp(pattern: str) -> re.Pattern:
+	"""
+	Compile a REGEXP pattern, keeping recently used patterns compiled
+
+	:param pattern:
+		Regular expression pattern
+	:return:
+		Case-insensitive compiled pattern
+	:raises re.error:
+		When the pattern is invalid
+	"""
+	return re.compile(pattern, re.IGNORECASE)
+
+
+def validate_regexp(pattern: str) -> None:
+	"""
+	Check a pattern before it is used with the ``REGEXP`` operator
+
+	The SQLite callback cannot report a pattern error other than by
+	aborting the query, so patterns are validated before querying.
+
+	:param pattern:
+		Regular expression pattern
+	:return:
+	:raises InvalidRegexException:
+		When the pattern is invalid
+	"""
+	try:
+		_compile_regexp(pattern)
+	except re.error as e:
+		raise InvalidRegexException(pattern, e) from e
+
 
 def _sqlite_regexp(pattern: str, value: str | None) -> bool:
 	"""
@@ -29,19 +100,68 @@ def _sqlite_regexp(pattern: str, value: str | None) -> bool:
 	"""
 	if value is None:
 		return False
-	return re.search(pattern, value, re.IGNORECASE) is not None
+	return _compile_regexp(pattern).search(value) is not None
+
+
+def fold_search_text(value: str | None) -> str | None:
+	"""
+	Normalize text for the full-text index
+
+	Applied to indexed texts and to search queries alike.
+
+	:param value:
+		Text to normalize
+	:return:
+		Normalized text
+	"""
+	if value is None:
+		return None
+	return value.translate(_SEARCH_FOLD_TABLE)
+
+
+def build_search_match(query: str, columns: typing.Iterable[str] = SEARCH_TEXT_COLUMNS) -> str | None:
+	"""
+	Build an FTS5 MATCH expression for a user search query
+
+	Every word of the query must start a word of one of the given columns.
+	Words are quoted, so FTS5 operators in user input are matched literally.
+
+	:param query:
+		User search query
+	:param columns:
+		Indexed columns to search
+	:return:
+		MATCH expression, or None when the query has no words
+	"""
+	terms = _SEARCH_TERM_PATTERN.findall(fold_search_text(query))
+	if not terms:
+		return None
+	phrases = " AND ".join(f'"{term}"*' for term in terms)
+	return f"{{{' '.join(columns)}}} : ({phrases})"
 
 
 def create_db_engine(database_url: str) -> Engine:
 	"""
 	Create database engine
 
+	SQLite connections keep more compiled statements than the driver
+	default, since repositories issue many distinct queries, and file
+	databases hand out the most recently used pooled connection, whose
+	statement and page caches are warm.
+
 	:param database_url:
 		Database connection URL
 	:return:
 		SQLAlchemy engine
 	"""
-	engine = create_engine(database_url, echo=False)
+	url = make_url(database_url)
+	options = {}
+	if url.get_backend_name() == "sqlite":
+		options["connect_args"] = {"cached_statements": _SQLITE_CACHED_STATEMENTS}
+		if url.database and url.database != ":memory:":
+			options["pool_use_lifo"] = True
+
+	engine = create_engine(url, echo=False, **options)
 	if engine.dialect.name == "sqlite":
 		_enable_sqlite_pragmas(engine)
 	return engine
@@ -64,7 +184,8 @@ def _enable_sqlite_pragmas(engine: Engine) -> None:
 	  search uses ``ilike`` (which lowers both operands).
 
 	The ``regexp()`` function is also registered here so the ``REGEXP`` operator
-	(used for the item hint pattern search) resolves to a Python ``re`` match.
+	(used for the item hint pattern search) resolves to a Python ``re`` match,
+	as is ``search_fold()`` which normalizes texts copied into ``search_text``.
 
 	:param engine:
 		SQLite engine to attach the pragma listener to
@@ -79,7 +200,8 @@ def _enable_sqlite_pragmas(engine: Engine) -> None:
 		cursor.execute("PRAGMA busy_timeout=5000")
 		cursor.execute("PRAGMA case_sensitive_like=ON")
 		cursor.close()
-		dbapi_connection.create_function("regexp", 2, _sqlite_regexp)
+		dbapi_connection.create_function("regexp", 2, _sqlite_regexp, deterministic=True)
+		dbapi_connection.create_function("search_fold", 1, fold_search_text, deterministic=True)
 
 
 def init_db(engine: Engine) -> None:
@@ -119,6 +241,102 @@ def _game_tables() -> list:
 	]
 
 
+def _add_missing_columns(engine: Engine, tables: list) -> None:
+	"""
+	Add columns and indexes declared on mappers but missing from existing tables
+
+	``create_all`` only creates missing tables, so columns introduced after
+	a game database was created are appended with ``ALTER TABLE``. Only
+	additive changes are handled; new columns must be nullable. A column
+	may declare ``info={"backfill": <SQL expression>}`` to compute values
+	for existing rows. Missing indexes of existing tables are created.
+
+	:param engine:
+		Database engine
+	:param tables:
+		Tables to check
+	:return:
+	"""
+	inspector = inspect(engine)
+	existing_tables = set(inspector.get_table_names())
+
+	with engine.begin() as connection:
+		for table in tables:
+			if table.name not in existing_tables:
+				continue
+
+			existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+			added_columns = [column for column in table.columns if column.name not in existing_columns]
+
+			for column in added_columns:
+				column_type = column.type.compile(dialect=engine.dialect)
+				connection.exec_driver_sql(
+					f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column_type}'
+				)
+				backfill = column.info.get("backfill")
+				if backfill:
+					connection.exec_driver_sql(
+						f'UPDATE "{table.name}" SET "{column.name}" = {backfill}'
+					)
+
+			for index in table.indexes:
+				index.create(connection, checkfirst=True)
+
+
+def index_search_text(connection, tables: list) -> None:
+	"""
+	Rebuild the full-text index rows of the given tables
+
+	Texts are copied from the tables with one ``INSERT ... SELECT`` per
+	table, using the expressions declared in ``info["search_text"]``.
+
+	:param connection:
+		Connection of the game database
+	:param tables:
+		Tables to index; tables without ``search_text`` info are skipped
+	:return:
+	"""
+	for table in tables:
+		expressions = table.info.get("search_text")
+		if not expressions:
+			continue
+
+		columns = ", ".join(f'"{name}"' for name in expressions)
+		values = ", ".join(f"search_fold({expression})" for expression in expressions.values())
+		connection.execute(
+			text("DELETE FROM search_text WHERE entity_type = :entity_type"),
+			{"entity_type": table.name}
+		)
+		connection.execute(
+			text(
+				f'INSERT INTO search_text (entity_type, entity_id, {columns}) '
+				f'SELECT :entity_type, "{table.name}".id, {values} FROM "{table.name}"'
+			),
+			{"entity_type": table.name}
+		)
+
+
+def _create_search_text(engine: Engine, tables: list) -> None:
+	"""
+	Create the full-text index table
+
+	Databases created before the index existed get it filled from their
+	already scanned rows.
+
+	:param engine:
+		Database engine
+	:param tables:
+		Game tables
+	:return:
+	"""
+	if inspect(engine).has_table(search_text_table.name):
+		return
+
+	with engine.begin() as connection:
+		connection.exec_driver_sql(_SEARCH_TEXT_DDL)
+		index_search_text(connection, tables)
+
+
 class GameDatabaseRegistry:
 	"""
 	Lazily creates and caches one SQLite database (engine + session factory)
@@ -177,6 +395,8 @@ class GameDatabaseRegistry:
 		os.makedirs(self._data_dir, exist_ok=True)
 		engine = create_db_engine(f"sqlite:///{self._db_path(schema_name)}")
 		Base.metadata.create_all(bind=engine, tables=_game_tables())
+		_add_missing_columns(engine, _game_tables())
+		_create_search_text(engine, _game_tables())
 		self._engines[schema_name] = engine
 		return sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
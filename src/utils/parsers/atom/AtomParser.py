@@ -1,6 +1,22 @@
+import re
+
 from src.utils.parsers.atom.exceptions import AtomSyntaxError
 from src.utils.parsers.atom.AtomTypeConverter import AtomTypeConverter
 
+# A comment runs from the first "//" of a line to its end
+_COMMENT_PATTERN: re.Pattern = re.compile(r"//[^\n]*")
+
+# An empty match standing for the missing value of an "=" followed by
+# whitespace, a brace or the end of content, then braces, "=" and values
+_TOKEN_PATTERN: re.Pattern = re.compile(
+	r"(?<==)(?=[ \t\n\r{}]|\Z)"
+	r"|[{}=]"
+	r"|[^{}= \t\n\r]+"
+)
+
+# Whitespace that does not separate tokens but is stripped from values
+_VALUE_SPACE_PATTERN: re.Pattern = re.compile(r"[^\S \t\n\r]")
+
 
 class AtomParser:
 	"""
@@ -30,8 +46,7 @@ class AtomParser:
 		if content.startswith('\ufeff'):
 			content = content[1:]
 
-		cleaned = self._remove_comments(content)
-		self._tokens = self._tokenize(cleaned)
+		self._tokens = self._tokenize(content)
 		self._pos = 0
 
 		result = {}
@@ -50,69 +65,25 @@ class AtomParser:
 
 		return result
 
-	def _remove_comments(self, content: str) -> str:
-		"""
-		Remove line and inline comments
-
-		:param content:
-			Raw content string
-		:return:
-			Content with comments removed
-		"""
-		lines = []
-		for line in content.split('\n'):
-			if line.strip().startswith('//'):
-				continue
-			comment_pos = line.find('//')
-			if comment_pos != -1:
-				line = line[:comment_pos]
-			if line.strip():
-				lines.append(line)
-		return '\n'.join(lines)
-
 	def _tokenize(self, content: str) -> list[str]:
 		"""
-		Split content into tokens
+		Split content into tokens, skipping comments
+
+		Braces and ``=`` are tokens of their own, values are runs of any
+		other non-whitespace characters. An empty string token stands for a
+		missing value.
 
 		:param content:
-			Cleaned content string
+			Raw content string
 		:return:
 			List of tokens
 		"""
-		tokens = []
-		current = ''
-		after_equals = False
-
-		for char in content:
-			if char in '{}=':
-				if current.strip():
-					tokens.append(current.strip())
-					current = ''
-				elif after_equals and char != '=':
-					tokens.append('')
-
-				tokens.append(char)
-				after_equals = (char == '=')
-				current = ''
-
-			elif char in ' \t\n\r':
-				if current.strip():
-					tokens.append(current.strip())
-					after_equals = False
-					current = ''
-				elif after_equals:
-					tokens.append('')
-					after_equals = False
-				current = ''
-
-			else:
-				current += char
-				after_equals = False
+		content = _COMMENT_PATTERN.sub('', content)
+		tokens = _TOKEN_PATTERN.findall(content)
 
-		if current.strip():
-			tokens.append(current.strip())
-		elif after_equals:
-			tokens.append('')
+		# Rare: values holding e.g. non-breaking spaces are stripped, dropped if nothing is left
+		if _VALUE_SPACE_PATTERN.search(content):
+			tokens = [value for token in tokens if (value := token.strip()) or not token]
 
 		return tokens
 
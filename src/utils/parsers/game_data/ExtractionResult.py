@@ -0,0 +1,22 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class ExtractionResult:
+	"""
+	Outcome of preparing game data for reading
+
+	:param root:
+		Extraction root (/tmp/game_<id>/), or the game directory when archives are read in place
+	:param refreshed:
+		``<priority>-<session>`` sources that were extracted, copied or mounted again
+	"""
+	root: str
+	refreshed: list[str] = field(default_factory=list)
+
+	@property
+	def skipped(self) -> bool:
+		"""
+		True when no source changed since the previous extraction
+		"""
+		return not self.refreshed
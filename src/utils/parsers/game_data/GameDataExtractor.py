@@ -1,3 +1,4 @@
+import json
 import os
 import shutil
 
@@ -6,8 +7,11 @@ from dependency_injector.wiring import Provide
 from src.core.Config import Config
 from src.core.Container import Container
 from src.domain.app.entities.Game import Game
+from src.utils.parsers.game_data.ExtractionResult import ExtractionResult
 from src.utils.parsers.game_data.IGameDataExtractor import IGameDataExtractor
 from src.utils.parsers.game_data.IKFSExtractor import IKFSExtractor
+from src.utils.parsers.game_data.IKFSFileSystem import IKFSFileSystem
+from src.utils.parsers.game_data.IKFSReader import IKFSReader
 from src.utils.parsers.game_data.ReadPriority import ReadPriority
 
 
@@ -15,56 +19,288 @@ class GameDataExtractor(IGameDataExtractor):
 
 	_DATA_EXTENSIONS: tuple[str, ...] = ('.atom', '.txt')
 	_LOC_EXTENSION: str = '.lng'
+	_MANIFEST_VERSION: int = 1
 
 	def __init__(
 		self,
 		kfs_extractor: IKFSExtractor = Provide[Container.kfs_extractor],
+		kfs_reader: IKFSReader = Provide[Container.kfs_reader],
+		file_system: IKFSFileSystem = Provide[Container.kfs_file_system],
 		config: Config = Provide[Container.config]
 	):
 		self._kfs_extractor = kfs_extractor
+		self._kfs_reader = kfs_reader
+		self._file_system = file_system
 		self._config = config
+		# game ID -> manifest of the mounted sources
+		self._mounted_manifests: dict[int, dict[str, dict[str, list[int]]]] = {}
 
-	def extract(self, game: Game) -> str:
+	def extract(self, game: Game) -> ExtractionResult:
 		"""
-		Prepare a flat copy of all game data under /tmp/game_<game.id>/
+		Prepare all game data for reading
 
-		Archives are extracted first (this also resets the extraction root),
-		then loose files from each session are copied on top so that both
-		packed and unpacked sessions end up in the same flat structure.
+		With ``read_archives_in_place`` the archives and loose session files
+		are mounted and read without copying. Otherwise a flat copy is made
+		under /tmp/game_<game.id>/: archives are extracted first, then loose
+		files from each session are copied on top so that both packed and
+		unpacked sessions end up in the same flat structure.
+
+		Archive and loose file stats are kept in a manifest per game. Sources
+		unchanged since the previous run are neither remounted nor extracted
+		again, and with ``incremental_extraction`` only changed archives are
+		re-extracted and only changed loose files are copied. The reader's
+		file index of the game is dropped whenever a source changed.
 
 		:param game:
 			Game entity with path and sessions list
 		:return:
-			Path to extraction root (/tmp/game_<game.id>/)
+			Extraction root (/tmp/game_<game.id>/, or the game directory when
+			archives are read in place) and the sources that were refreshed
 		"""
-		extraction_root = self._kfs_extractor.extract_archives(game)
-		game_path = self._resolve_game_path(game.path)
+		archive_layers = self._kfs_extractor.list_archives(game)
+		loose_layers = self._loose_layers(game)
+		manifest = self._build_manifest(archive_layers, loose_layers)
 
-		self._copy_loose_files(
-			self._data_source(game_path),
-			extraction_root,
-			"data",
-			ReadPriority.LOOSE_DATA.as_prefix()
-		)
-		for session in game.sessions:
-			session_source = self._session_source(game_path, session)
-			self._copy_loose_files(
-				session_source,
-				extraction_root,
-				session,
-				ReadPriority.LOOSE_SESSION.as_prefix()
-			)
+		if self._config.read_archives_in_place:
+			return self._mount(game, manifest)
 
-		return extraction_root
+		self._file_system.unmount(game.id)
+		self._mounted_manifests.pop(game.id, None)
+		return self._extract_to_disk(game, archive_layers, loose_layers, manifest)
 
 	def cleanup(self, game: Game) -> None:
 		"""
-		Clean up temporary extracted files for the given game
+		Clean up temporary extracted files and close mounted archives for the given game
 
 		:param game:
 			Game entity to clean up temporary files for
 		"""
+		self._file_system.unmount(game.id)
+		self._mounted_manifests.pop(game.id, None)
 		self._kfs_extractor.cleanup_extraction(game)
+		self._kfs_reader.invalidate(game.id)
+
+		manifest_path = self._manifest_path(game.id)
+		if os.path.exists(manifest_path):
+			os.remove(manifest_path)
+
+	def _mount(self, game: Game, manifest: dict[str, dict[str, list[int]]]) -> ExtractionResult:
+		"""
+		Mount the game files unless the mounted sources are unchanged
+
+		:param game:
+			Game entity with path and sessions list
+		:param manifest:
+			Current source stats
+		:return:
+			Game directory and the changed sources
+		"""
+		game_path = self._resolve_game_path(game.path)
+		refreshed = self._changed_layers(self._mounted_manifests.get(game.id, {}), manifest)
+
+		if not refreshed and self._file_system.is_mounted(game.id):
+			return ExtractionResult(game_path)
+
+		self._file_system.mount(game)
+		self._mounted_manifests[game.id] = manifest
+		self._kfs_reader.invalidate(game.id)
+		return ExtractionResult(game_path, refreshed)
+
+	def _extract_to_disk(
+		self,
+		game: Game,
+		archive_layers: dict[str, list[str]],
+		loose_layers: dict[str, str],
+		manifest: dict[str, dict[str, list[int]]]
+	) -> ExtractionResult:
+		"""
+		Extract changed archives and copy changed loose files under /tmp/game_<game.id>/
+
+		Without a previous manifest (or with ``incremental_extraction`` off)
+		the extraction root is rebuilt from scratch. The manifest is removed
+		while extracting, so an interrupted extraction is never taken as current.
+
+		:param game:
+			Game entity with path and sessions list
+		:param archive_layers:
+			Archive paths by ``<priority>-<session>`` directory
+		:param loose_layers:
+			Loose source directory by ``<priority>-<session>`` directory
+		:param manifest:
+			Current source stats
+		:return:
+			Extraction root and the refreshed sources
+		"""
+		extraction_root = os.path.join(self._config.tmp_dir, f"game_{game.id}")
+		manifest_path = self._manifest_path(game.id)
+
+		previous = None
+		if self._config.incremental_extraction and os.path.isdir(extraction_root):
+			previous = self._load_manifest(manifest_path)
+
+		if os.path.exists(manifest_path):
+			os.remove(manifest_path)
+
+		if previous is None:
+			self._kfs_extractor.extract_archives(game)
+			for layer, source_dir in loose_layers.items():
+				prefix, session_name = layer.split('-', 1)
+				self._copy_loose_files(source_dir, extraction_root, session_name, prefix)
+			refreshed = self._changed_layers({}, manifest)
+		else:
+			refreshed = self._changed_layers(previous, manifest)
+			for layer in refreshed:
+				if layer in archive_layers:
+					self._kfs_extractor.extract_layer(game, layer, archive_layers[layer])
+				elif layer in loose_layers:
+					self._sync_loose_files(
+						loose_layers[layer],
+						extraction_root,
+						layer,
+						previous.get(layer, {}),
+						manifest[layer]
+					)
+				else:
+					# Session no longer part of the game
+					for kind in ('data', 'loc'):
+						shutil.rmtree(os.path.join(extraction_root, kind, layer), ignore_errors=True)
+
+		self._save_manifest(manifest_path, manifest)
+
+		if previous is None or refreshed:
+			self._kfs_reader.invalidate(game.id)
+
+		return ExtractionResult(extraction_root, refreshed)
+
+	def _loose_layers(self, game: Game) -> dict[str, str]:
+		"""
+		Map the loose sources of a game to the directories they are copied to
+
+		:param game:
+			Game entity with path and sessions list
+		:return:
+			Mapping of ``<priority>-<session>`` directory name to source directory
+		"""
+		game_path = self._resolve_game_path(game.path)
+
+		layers = {f"{ReadPriority.LOOSE_DATA.as_prefix()}-data": self._data_source(game_path)}
+		for session in game.sessions:
+			layers[f"{ReadPriority.LOOSE_SESSION.as_prefix()}-{session}"] = self._session_source(game_path, session)
+
+		return layers
+
+	def _build_manifest(
+		self,
+		archive_layers: dict[str, list[str]],
+		loose_layers: dict[str, str]
+	) -> dict[str, dict[str, list[int]]]:
+		"""
+		Collect size and modification time of every source file
+
+		:param archive_layers:
+			Archive paths by ``<priority>-<session>`` directory
+		:param loose_layers:
+			Loose source directory by ``<priority>-<session>`` directory
+		:return:
+			Mapping of ``<priority>-<session>`` directory name to
+			{archive path or loose file path relative to its source: [size, mtime_ns]}
+		"""
+		manifest = {
+			layer: {path: self._file_stat(path) for path in archive_paths}
+			for layer, archive_paths in archive_layers.items()
+		}
+
+		for layer, source_dir in loose_layers.items():
+			files = {}
+			if os.path.isdir(source_dir):
+				for root, _, filenames in os.walk(source_dir):
+					for filename in filenames:
+						if self._target_dir_for(os.path.splitext(filename)[1].lower(), 'data', 'loc') is None:
+							continue
+						path = os.path.join(root, filename)
+						files[os.path.relpath(path, source_dir)] = self._file_stat(path)
+			manifest[layer] = files
+
+		return manifest
+
+	@staticmethod
+	def _file_stat(path: str) -> list[int]:
+		"""
+		Read the manifest stat of a file
+
+		:param path:
+			File path
+		:return:
+			[size, mtime_ns]
+		"""
+		stat = os.stat(path)
+		return [stat.st_size, stat.st_mtime_ns]
+
+	@staticmethod
+	def _changed_layers(
+		previous: dict[str, dict[str, list[int]]],
+		current: dict[str, dict[str, list[int]]]
+	) -> list[str]:
+		"""
+		Find the sources whose files differ between two manifests
+
+		:param previous:
+			Manifest of the previous extraction
+		:param current:
+			Current manifest
+		:return:
+			Sorted ``<priority>-<session>`` directory names
+		"""
+		return sorted(
+			layer
+			for layer in previous.keys() | current.keys()
+			if previous.get(layer, {}) != current.get(layer, {})
+		)
+
+	def _manifest_path(self, game_id: int) -> str:
+		"""
+		Build the manifest path, next to the extraction root
+
+		:param game_id:
+			Game ID
+		:return:
+			Path to /tmp/game_<id>.manifest.json
+		"""
+		return os.path.join(self._config.tmp_dir, f"game_{game_id}.manifest.json")
+
+	@staticmethod
+	def _load_manifest(manifest_path: str) -> dict[str, dict[str, list[int]]] | None:
+		"""
+		Load the manifest of the previous extraction
+
+		:param manifest_path:
+			Manifest file path
+		:return:
+			Previous manifest, or None if missing or unreadable
+		"""
+		try:
+			with open(manifest_path, encoding='utf-8') as file:
+				content = json.load(file)
+		except (OSError, ValueError):
+			return None
+
+		if content.get('version') != GameDataExtractor._MANIFEST_VERSION:
+			return None
+		return content.get('layers')
+
+	@staticmethod
+	def _save_manifest(manifest_path: str, manifest: dict[str, dict[str, list[int]]]) -> None:
+		"""
+		Store the manifest of a completed extraction
+
+		:param manifest_path:
+			Manifest file path
+		:param manifest:
+			Current source stats
+		"""
+		os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+		with open(manifest_path, 'w', encoding='utf-8') as file:
+			json.dump({'version': GameDataExtractor._MANIFEST_VERSION, 'layers': manifest}, file)
 
 	def _resolve_game_path(self, game_path: str) -> str:
 		"""
@@ -139,6 +375,52 @@ class GameDataExtractor(IGameDataExtractor):
 			for filename in files:
 				self._copy_file_flat(os.path.join(root, filename), data_dir, loc_dir, session_name)
 
+	def _sync_loose_files(
+		self,
+		source_dir: str,
+		extraction_root: str,
+		layer: str,
+		previous: dict[str, list[int]],
+		current: dict[str, list[int]]
+	) -> None:
+		"""
+		Copy only the loose files that changed since the previous extraction
+
+		Files are flattened by name, so for every name only the file copied
+		last (in walk order) matters. A name is copied again when that file or
+		its stat changed, and removed when no source file provides it anymore.
+
+		:param source_dir:
+			Directory holding unpacked game files
+		:param extraction_root:
+			Root extraction directory (/tmp/game_<game.id>/)
+		:param layer:
+			``<priority>-<session>`` target directory name
+		:param previous:
+			Loose file stats of the previous extraction
+		:param current:
+			Current loose file stats
+		"""
+		data_dir = os.path.join(extraction_root, 'data', layer)
+		loc_dir = os.path.join(extraction_root, 'loc', layer)
+
+		previous_targets = {os.path.basename(path): path for path in previous}
+		current_targets = {os.path.basename(path): path for path in current}
+
+		for filename, path in current_targets.items():
+			if previous_targets.get(filename) == path and previous[path] == current[path]:
+				continue
+
+			target_dir = self._target_dir_for(os.path.splitext(filename)[1].lower(), data_dir, loc_dir)
+			os.makedirs(target_dir, exist_ok=True)
+			shutil.copyfile(os.path.join(source_dir, path), os.path.join(target_dir, filename))
+
+		for filename in previous_targets.keys() - current_targets.keys():
+			target_dir = self._target_dir_for(os.path.splitext(filename)[1].lower(), data_dir, loc_dir)
+			target_path = os.path.join(target_dir, filename)
+			if os.path.exists(target_path):
+				os.remove(target_path)
+
 	def _copy_file_flat(
 		self,
 		source_path: str,
@@ -1,23 +1,27 @@
 import abc
 
 from src.domain.app.entities.Game import Game
+from src.utils.parsers.game_data.ExtractionResult import ExtractionResult
 
 
 class IGameDataExtractor(abc.ABC):
 
 	@abc.abstractmethod
-	def extract(self, game: Game) -> str:
+	def extract(self, game: Game) -> ExtractionResult:
 		"""
-		Prepare a flat copy of all game data under /tmp/game_<game.id>/
+		Prepare all game data for reading
 
 		Combines two sources into a single flat structure:
 		archives (delegated to the KFS extractor) and loose, unpacked
-		session files copied straight from disk.
+		session files copied straight from disk. When archives are read in
+		place, both are mounted instead of copied under /tmp/game_<game.id>/.
+		Sources unchanged since the previous call are skipped.
 
 		:param game:
 			Game entity with path and sessions list
 		:return:
-			Path to extraction root (/tmp/game_<game.id>/)
+			Extraction root (/tmp/game_<game.id>/, or the game directory when
+			archives are read in place) and the sources that were refreshed
 		"""
 		...
 
@@ -29,3 +29,29 @@ class IKFSExtractor(abc.ABC):
 			Game entity to clean up temporary files for
 		"""
 		...
+
+	@abc.abstractmethod
+	def list_archives(self, game: Game) -> dict[str, list[str]]:
+		"""
+		Find the archives of a game grouped by the directory they are extracted to
+
+		:param game:
+			Game entity with path and sessions list
+		:return:
+			Mapping of ``<priority>-<session>`` directory name to sorted archive paths (may be empty)
+		"""
+		...
+
+	@abc.abstractmethod
+	def extract_layer(self, game: Game, layer: str, archive_paths: list[str]) -> None:
+		"""
+		Extract archives into one ``<priority>-<session>`` directory, replacing its previous content
+
+		:param game:
+			Game entity
+		:param layer:
+			``<priority>-<session>`` directory name returned by list_archives
+		:param archive_paths:
+			Archive paths, later archives overwrite files of earlier ones
+		"""
+		...
@@ -0,0 +1,74 @@
+import abc
+
+from src.domain.app.entities.Game import Game
+
+
+class IKFSFileSystem(abc.ABC):
+
+	@abc.abstractmethod
+	def mount(self, game: Game) -> None:
+		"""
+		Open all game archives and loose session files for reading in place
+
+		Files are laid out the same way extraction lays them out on disk:
+		``data/<priority>-<session>/<name>`` and ``loc/<priority>-<session>/<name>``.
+		Mounting a game again replaces its previous mount.
+
+		:param game:
+			Game entity with path and sessions list
+		"""
+		...
+
+	@abc.abstractmethod
+	def unmount(self, game_id: int) -> None:
+		"""
+		Close the archives of a mounted game
+
+		:param game_id:
+			Game ID
+		"""
+		...
+
+	@abc.abstractmethod
+	def is_mounted(self, game_id: int) -> bool:
+		"""
+		Check whether a game is mounted
+
+		:param game_id:
+			Game ID
+		:return:
+			True if files of the game are served from its archives
+		"""
+		...
+
+	@abc.abstractmethod
+	def list_files(self, game_id: int, kind: str) -> dict[str, list[tuple[int, str]]]:
+		"""
+		List the files of a mounted game by name
+
+		:param game_id:
+			Game ID
+		:param kind:
+			'data' for .atom/.txt files, 'loc' for .lng files
+		:return:
+			Mapping of file name to its (priority, virtual path) entries
+		:raises FileNotFoundError:
+			If the game is not mounted
+		"""
+		...
+
+	@abc.abstractmethod
+	def read_bytes(self, game_id: int, path: str) -> bytes:
+		"""
+		Read a file of a mounted game
+
+		:param game_id:
+			Game ID
+		:param path:
+			Virtual path returned by list_files
+		:return:
+			Raw file content
+		:raises FileNotFoundError:
+			If the game is not mounted or has no such file
+		"""
+		...
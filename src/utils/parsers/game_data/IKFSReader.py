@@ -52,3 +52,13 @@ class IKFSReader(abc.ABC):
 			If no files match pattern or directory not found
 		"""
 		...
+
+	@abc.abstractmethod
+	def invalidate(self, game_id: int) -> None:
+		"""
+		Forget cached file lookups of a game after its files were extracted again
+
+		:param game_id:
+			Game ID whose extraction directory changed
+		"""
+		...
@@ -34,30 +34,51 @@ class KFSExtractor(IKFSExtractor):
 
 		self._cleanup_previous_extraction(f"game_{game.id}")
 
-		game_path = self._resolve_game_path(game.path)
+		for layer, archive_paths in self.list_archives(game).items():
+			if archive_paths:
+				self.extract_layer(game, layer, archive_paths)
 
-		# Extract main data archive (highest read priority)
-		data_archive_paths = self._get_data_archive_paths(game_path)
-		if data_archive_paths:
-			self._extract_to_session(
-				data_archive_paths,
-				extraction_root,
-				"data",
-				ReadPriority.KFS_DATA.as_prefix()
-			)
+		return extraction_root
+
+	def list_archives(self, game: Game) -> dict[str, list[str]]:
+		"""
+		Find the archives of a game grouped by the directory they are extracted to
 
-		# Extract session-specific archives (all share the kfs-session priority)
+		The main data archive has the highest read priority, session-specific
+		archives all share the kfs-session priority.
+
+		:param game:
+			Game entity with path and sessions list
+		:return:
+			Mapping of ``<priority>-<session>`` directory name to sorted archive paths (may be empty)
+		"""
+		game_path = self._resolve_game_path(game.path)
+
+		layers = {f"{ReadPriority.KFS_DATA.as_prefix()}-data": sorted(self._get_data_archive_paths(game_path))}
 		for session in game.sessions:
-			session_archive_paths = self._get_session_archive_paths(game_path, session)
-			if session_archive_paths:
-				self._extract_to_session(
-					session_archive_paths,
-					extraction_root,
-					session,
-					ReadPriority.KFS_SESSION.as_prefix()
-				)
+			layer = f"{ReadPriority.KFS_SESSION.as_prefix()}-{session}"
+			layers[layer] = sorted(self._get_session_archive_paths(game_path, session))
 
-		return extraction_root
+		return layers
+
+	def extract_layer(self, game: Game, layer: str, archive_paths: list[str]) -> None:
+		"""
+		Extract archives into one ``<priority>-<session>`` directory, replacing its previous content
+
+		:param game:
+			Game entity
+		:param layer:
+			``<priority>-<session>`` directory name returned by list_archives
+		:param archive_paths:
+			Archive paths, later archives overwrite files of earlier ones
+		"""
+		extraction_root = os.path.join(self._config.tmp_dir, f"game_{game.id}")
+		prefix, session_name = layer.split('-', 1)
+
+		for kind in ('data', 'loc'):
+			shutil.rmtree(os.path.join(extraction_root, kind, layer), ignore_errors=True)
+
+		self._extract_to_session(archive_paths, extraction_root, session_name, prefix)
 
 	def cleanup_extraction(self, game: Game) -> None:
 		"""
@@ -0,0 +1,292 @@
+import glob
+import os
+import threading
+import zipfile
+from dataclasses import dataclass, field
+
+from dependency_injector.wiring import Provide
+
+from src.core.Config import Config
+from src.core.Container import Container
+from src.domain.app.entities.Game import Game
+from src.utils.parsers.game_data.IKFSFileSystem import IKFSFileSystem
+from src.utils.parsers.game_data.ReadPriority import ReadPriority
+
+
+@dataclass
+class _Mount:
+	"""
+	Open archives and file layout of one mounted game
+	"""
+
+	archives: list[zipfile.ZipFile] = field(default_factory=list)
+	# virtual path -> (archive, member name), or (None, disk path) for loose files
+	sources: dict[str, tuple[zipfile.ZipFile | None, str]] = field(default_factory=dict)
+	# kind -> file name -> [(priority, virtual path)]
+	index: dict[str, dict[str, list[tuple[int, str]]]] = field(default_factory=dict)
+
+	def close(self) -> None:
+		"""
+		Close all archives of the mount
+		"""
+		for archive in self.archives:
+			archive.close()
+
+
+class KFSFileSystem(IKFSFileSystem):
+	"""
+	Serves game files straight from the .kfs archives and loose session files
+
+	Applies the same ReadPriority overlay as extraction to /tmp, without
+	writing anything to disk: every source gets a virtual
+	``<kind>/<priority>-<session>`` directory, and within one directory a
+	later archive or loose file replaces an earlier file of the same name.
+	Archive handles stay open until the game is remounted or unmounted.
+	"""
+
+	_DATA_EXTENSIONS: tuple[str, ...] = ('.atom', '.txt')
+	_LOC_EXTENSION: str = '.lng'
+
+	def __init__(self, config: Config = Provide[Container.config]):
+		self._config = config
+		self._mounts: dict[int, _Mount] = {}
+		self._lock = threading.Lock()
+
+	def mount(self, game: Game) -> None:
+		"""
+		Open all game archives and loose session files for reading in place
+
+		Sources are layered in extraction order: main data archive, session
+		archives, loose main data, loose session files.
+
+		:param game:
+			Game entity with path and sessions list
+		:raises zipfile.BadZipFile:
+			If an archive is not a valid ZIP file
+		"""
+		game_path = self._resolve_game_path(game.path)
+		mount = _Mount()
+
+		try:
+			self._add_archives(
+				mount,
+				glob.glob(self._config.data_archive_path.format(game_path=game_path)),
+				"data",
+				ReadPriority.KFS_DATA
+			)
+			for session in game.sessions:
+				pattern = self._config.session_archives_pattern.format(game_path=game_path, session=session)
+				self._add_archives(mount, glob.glob(pattern), session, ReadPriority.KFS_SESSION)
+
+			self._add_loose_files(
+				mount,
+				self._config.data_path.format(game_path=game_path),
+				"data",
+				ReadPriority.LOOSE_DATA
+			)
+			for session in game.sessions:
+				self._add_loose_files(
+					mount,
+					self._config.session_path.format(game_path=game_path, session=session),
+					session,
+					ReadPriority.LOOSE_SESSION
+				)
+		except Exception:
+			mount.close()
+			raise
+
+		for path in mount.sources:
+			kind, directory, filename = path.split('/', 2)
+			priority = int(directory.split('-', 1)[0])
+			mount.index.setdefault(kind, {}).setdefault(filename, []).append((priority, path))
+
+		with self._lock:
+			previous = self._mounts.get(game.id)
+			self._mounts[game.id] = mount
+
+		if previous is not None:
+			previous.close()
+
+	def unmount(self, game_id: int) -> None:
+		"""
+		Close the archives of a mounted game
+
+		:param game_id:
+			Game ID
+		"""
+		with self._lock:
+			mount = self._mounts.pop(game_id, None)
+
+		if mount is not None:
+			mount.close()
+
+	def is_mounted(self, game_id: int) -> bool:
+		"""
+		Check whether a game is mounted
+
+		:param game_id:
+			Game ID
+		:return:
+			True if files of the game are served from its archives
+		"""
+		return game_id in self._mounts
+
+	def list_files(self, game_id: int, kind: str) -> dict[str, list[tuple[int, str]]]:
+		"""
+		List the files of a mounted game by name
+
+		:param game_id:
+			Game ID
+		:param kind:
+			'data' for .atom/.txt files, 'loc' for .lng files
+		:return:
+			Mapping of file name to its (priority, virtual path) entries
+		:raises FileNotFoundError:
+			If the game is not mounted
+		"""
+		return self._get_mount(game_id).index.get(kind, {})
+
+	def read_bytes(self, game_id: int, path: str) -> bytes:
+		"""
+		Read a file of a mounted game
+
+		:param game_id:
+			Game ID
+		:param path:
+			Virtual path returned by list_files
+		:return:
+			Raw file content
+		:raises FileNotFoundError:
+			If the game is not mounted or has no such file
+		"""
+		source = self._get_mount(game_id).sources.get(path)
+		if source is None:
+			raise FileNotFoundError(f"File not found in game {game_id}: {path}")
+
+		archive, name = source
+		if archive is not None:
+			return archive.read(name)
+
+		with open(name, 'rb') as file:
+			return file.read()
+
+	def _get_mount(self, game_id: int) -> _Mount:
+		"""
+		Get the mount of a game
+
+		:param game_id:
+			Game ID
+		:return:
+			Mounted game files
+		:raises FileNotFoundError:
+			If the game is not mounted
+		"""
+		mount = self._mounts.get(game_id)
+		if mount is None:
+			raise FileNotFoundError(f"Game {game_id} is not mounted")
+		return mount
+
+	def _resolve_game_path(self, game_path: str) -> str:
+		"""
+		Resolve game path based on mode
+
+		In localhost mode (game_data_path=:local), game_path is already absolute.
+		In Docker mode, game_path is relative to game_data_path.
+
+		:param game_path:
+			Game path from database
+		:return:
+			Absolute path to game directory
+		"""
+		if self._config.game_data_path == ":local":
+			return game_path
+		return os.path.join(self._config.game_data_path, game_path)
+
+	def _add_archives(
+		self,
+		mount: _Mount,
+		archive_paths: list[str],
+		session_name: str,
+		priority: ReadPriority
+	) -> None:
+		"""
+		Open archives and add their relevant members to the mount
+
+		:param mount:
+			Mount being built
+		:param archive_paths:
+			Archive paths, later archives replace files of earlier ones
+		:param session_name:
+			Session name used to namespace the virtual directory
+		:param priority:
+			Read priority of the archives
+		:raises zipfile.BadZipFile:
+			If an archive is not a valid ZIP file
+		"""
+		for archive_path in sorted(archive_paths):
+			try:
+				archive = zipfile.ZipFile(archive_path, 'r')
+			except zipfile.BadZipFile as e:
+				raise zipfile.BadZipFile(f"Invalid ZIP archive: {archive_path}") from e
+
+			mount.archives.append(archive)
+			for file_info in archive.filelist:
+				if file_info.is_dir():
+					continue
+
+				path = self._virtual_path(os.path.basename(file_info.filename), session_name, priority)
+				if path is not None:
+					mount.sources[path] = (archive, file_info.filename)
+
+	def _add_loose_files(
+		self,
+		mount: _Mount,
+		source_dir: str,
+		session_name: str,
+		priority: ReadPriority
+	) -> None:
+		"""
+		Add relevant loose files of a directory to the mount
+
+		Missing source directories (e.g. fully packed sessions) are skipped.
+
+		:param mount:
+			Mount being built
+		:param source_dir:
+			Directory holding unpacked game files
+		:param session_name:
+			Session name used to namespace the virtual directory
+		:param priority:
+			Read priority of the files
+		"""
+		if not os.path.isdir(source_dir):
+			return
+
+		for root, _, files in os.walk(source_dir):
+			for filename in files:
+				path = self._virtual_path(filename, session_name, priority)
+				if path is not None:
+					mount.sources[path] = (None, os.path.join(root, filename))
+
+	def _virtual_path(self, filename: str, session_name: str, priority: ReadPriority) -> str | None:
+		"""
+		Build the virtual path of a file, mirroring the extraction layout
+
+		:param filename:
+			File name without directories
+		:param session_name:
+			Session name
+		:param priority:
+			Read priority of the source
+		:return:
+			``<kind>/<priority>-<session>/<filename>``, or None if the extension is not relevant
+		"""
+		ext = os.path.splitext(filename)[1].lower()
+		if ext == self._LOC_EXTENSION:
+			kind = 'loc'
+		elif ext in self._DATA_EXTENSIONS:
+			kind = 'data'
+		else:
+			return None
+
+		return f"{kind}/{priority.as_prefix()}-{session_name}/{filename}"
@@ -1,18 +1,34 @@
+import fnmatch
+import functools
 import os
-import glob
+from typing import Iterator
+
 import chardet
 
 from dependency_injector.wiring import Provide
 
 from src.core.Config import Config
 from src.core.Container import Container
+from src.utils.parsers.game_data.IKFSFileSystem import IKFSFileSystem
 from src.utils.parsers.game_data.IKFSReader import IKFSReader
 
 
 class KFSReader(IKFSReader):
+	"""
+	Reads game files of a mounted game from its archives, otherwise from /tmp/game_<id>
+	"""
+
+	_WILDCARD_CHARS: str = '*?['
 
-	def __init__(self, config: Config = Provide[Container.config]):
+	def __init__(
+		self,
+		config: Config = Provide[Container.config],
+		file_system: IKFSFileSystem = Provide[Container.kfs_file_system]
+	):
 		self._config = config
+		self._file_system = file_system
+		# directory -> basename -> [(priority, path)], built on first read after each extraction
+		self._indexes: dict[str, dict[str, list[tuple[int, str]]]] = {}
 
 	def read_data_files(
 		self,
@@ -21,7 +37,7 @@ class KFSReader(IKFSReader):
 		encoding: str | None = None
 	) -> list[str]:
 		"""
-		Read data files from extracted data directory (searches recursively in all session subdirectories)
+		Read data files of a mounted game, or from extracted data directory (searches recursively in all session subdirectories)
 
 		Supports glob patterns for dynamic file discovery.
 
@@ -36,8 +52,7 @@ class KFSReader(IKFSReader):
 		:raises FileNotFoundError:
 			If no files match pattern or directory not found
 		"""
-		data_dir = os.path.join(self._config.tmp_dir, f'game_{game_id}', 'data')
-		return self._read_files_from_dir(data_dir, patterns, encoding)
+		return self._read_files(game_id, 'data', patterns, encoding)
 
 	def read_loc_files(
 		self,
@@ -46,7 +61,7 @@ class KFSReader(IKFSReader):
 		encoding: str = 'utf-16-le'
 	) -> list[str]:
 		"""
-		Read localization files from extracted loc directory (searches recursively in all session subdirectories)
+		Read localization files of a mounted game, or from extracted loc directory (searches recursively in all session subdirectories)
 
 		Supports glob patterns for dynamic file discovery.
 
@@ -61,22 +76,47 @@ class KFSReader(IKFSReader):
 		:raises FileNotFoundError:
 			If no files match pattern or directory not found
 		"""
-		loc_dir = os.path.join(self._config.tmp_dir, f'game_{game_id}', 'loc')
-		return self._read_files_from_dir(loc_dir, patterns, encoding)
+		return self._read_files(game_id, 'loc', patterns, encoding)
+
+	def invalidate(self, game_id: int) -> None:
+		"""
+		Forget the file index of a game so the next read walks the extracted files again
+
+		:param game_id:
+			Game ID whose extraction directory changed
+		"""
+		self._indexes.pop(self._extracted_dir(game_id, 'data'), None)
+		self._indexes.pop(self._extracted_dir(game_id, 'loc'), None)
+
+	def _extracted_dir(self, game_id: int, kind: str) -> str:
+		"""
+		Build the extracted data or localization directory of a game
+
+		:param game_id:
+			Game ID
+		:param kind:
+			'data' or 'loc'
+		:return:
+			Path to /tmp/game_<id>/<kind>
+		"""
+		return os.path.join(self._config.tmp_dir, f'game_{game_id}', kind)
 
-	def _read_files_from_dir(
+	def _read_files(
 		self,
-		directory: str,
+		game_id: int,
+		kind: str,
 		patterns: list[str],
 		encoding: str | None
 	) -> list[str]:
 		"""
-		Read files from specified directory
+		Read files of a game, from its archives when mounted
 
 		Supports glob patterns for dynamic file discovery.
 
-		:param directory:
-			Directory path
+		:param game_id:
+			Game ID
+		:param kind:
+			'data' or 'loc'
 		:param patterns:
 			List of filenames or glob patterns
 		:param encoding:
@@ -90,78 +130,118 @@ class KFSReader(IKFSReader):
 		if not patterns:
 			return []
 
-		if not os.path.exists(directory):
-			raise FileNotFoundError(f"Directory not found: {directory}")
+		if self._file_system.is_mounted(game_id):
+			directory = f"game {game_id} archives ({kind})"
+			index = self._file_system.list_files(game_id, kind)
+			read_bytes = functools.partial(self._file_system.read_bytes, game_id)
+		else:
+			directory = self._extracted_dir(game_id, kind)
+			index = self._get_index(directory)
+			read_bytes = self._read_bytes
 
-		# Expand glob patterns to actual file paths across all priority directories
-		paths = self._expand_patterns(directory, patterns)
+		# Match patterns against the file index across all priority directories
+		matches = self._match_patterns(index, patterns)
 
-		if not paths:
+		if not matches:
 			raise FileNotFoundError(
 				f"No files found matching patterns {patterns} in directory '{directory}'"
 			)
 
 		# Order by ascending read priority: loose-session files first, kfs data last.
-		ordered_paths = self._order_by_priority(directory, paths)
+		ordered_paths = [path for _, _, path in sorted(matches)]
 
 		results = []
 		for path in ordered_paths:
-			content = self._read_file(path, encoding)
+			content = self._decode_file(path, read_bytes(path), encoding)
 			results.append(content)
 
 		return results
 
+	def _get_index(self, directory: str) -> dict[str, list[tuple[int, str]]]:
+		"""
+		Get the file index of a directory, walking it on first use
+
+		:param directory:
+			Extracted data or localization directory
+		:return:
+			Mapping of file name to its (priority, path) entries
+		:raises FileNotFoundError:
+			If directory doesn't exist
+		"""
+		index = self._indexes.get(directory)
+		if index is not None:
+			return index
+
+		if not os.path.exists(directory):
+			raise FileNotFoundError(f"Directory not found: {directory}")
+
+		index = self._build_index(directory)
+		self._indexes[directory] = index
+		return index
+
 	@staticmethod
-	def _expand_patterns(directory: str, patterns: list[str]) -> list[str]:
+	def _build_index(directory: str) -> dict[str, list[tuple[int, str]]]:
 		"""
-		Expand glob patterns to matching file paths (searches all priority subdirectories)
+		Walk a directory once and group its files by name
 
 		:param directory:
 			Directory path
-		:param patterns:
-			List of filenames or glob patterns
 		:return:
-			List of unique matching file paths
+			Mapping of file name to its (priority, path) entries
 		"""
-		all_files = []
+		index: dict[str, list[tuple[int, str]]] = {}
 
-		for pattern in patterns:
-			# Build recursive pattern to search all subdirectories
-			full_pattern = os.path.join(directory, '**', pattern)
-			all_files += glob.glob(full_pattern, recursive=True)
+		for root, _, files in os.walk(directory):
+			for filename in files:
+				path = os.path.join(root, filename)
+				index.setdefault(filename, []).append((KFSReader._priority_of(directory, path), path))
 
-		return list(set(all_files))
+		return index
 
 	@staticmethod
-	def _order_by_priority(directory: str, paths: list[str]) -> list[str]:
+	def _match_patterns(
+		index: dict[str, list[tuple[int, str]]],
+		patterns: list[str]
+	) -> set[tuple[int, str, str]]:
 		"""
-		Order matched files by ascending read priority
+		Match file names or fnmatch patterns against a file index
 
-		Files are extracted into ``<priority>-<session>`` subdirectories. Sorting by
-		ascending priority puts the lowest-priority source (loose session) first and
-		the highest-priority source (kfs data) last. Consumers that take the first
-		match therefore get the loose-session override, while consumers that merge
-		several files let the later (kfs data) file overwrite the earlier ones.
+		Plain file names are looked up directly, only patterns with wildcards
+		are tested against every indexed name.
 
-		:param directory:
-			Root directory the paths were matched under
-		:param paths:
-			Matching file paths to order
+		:param index:
+			Mapping of file name to its (priority, path) entries
+		:param patterns:
+			List of filenames or fnmatch patterns
 		:return:
-			Paths ordered by ascending priority, then file name
+			Unique (priority, file name, path) entries of all matching files
 		"""
-		return sorted(
-			paths,
-			key=lambda path: (KFSReader._priority_of(directory, path), os.path.basename(path))
-		)
+		matches = set()
+
+		for pattern in patterns:
+			if any(char in pattern for char in KFSReader._WILDCARD_CHARS):
+				filenames = fnmatch.filter(index, pattern)
+			else:
+				filenames = [pattern] if pattern in index else []
+
+			for filename in filenames:
+				matches.update((priority, filename, path) for priority, path in index[filename])
+
+		return matches
 
 	@staticmethod
 	def _priority_of(directory: str, path: str) -> int:
 		"""
 		Read the numeric read-priority encoded in a file's ``<priority>-<session>`` directory
 
+		Files are extracted into ``<priority>-<session>`` subdirectories. Sorting by
+		ascending priority puts the lowest-priority source (loose session) first and
+		the highest-priority source (kfs data) last. Consumers that take the first
+		match therefore get the loose-session override, while consumers that merge
+		several files let the later (kfs data) file overwrite the earlier ones.
+
 		:param directory:
-			Root directory the path was matched under
+			Root directory the path was found under
 		:param path:
 			File path inside a priority subdirectory
 		:return:
@@ -172,28 +252,41 @@ class KFSReader(IKFSReader):
 		prefix = top_component.split('-', 1)[0]
 		return int(prefix) if prefix.isdigit() else 0
 
-	def _read_file(
-		self,
+	@staticmethod
+	def _read_bytes(path: str) -> bytes:
+		"""
+		Read an extracted file
+
+		:param path:
+			File path
+		:return:
+			Raw file content
+		"""
+		with open(path, 'rb') as file:
+			return file.read()
+
+	@staticmethod
+	def _decode_file(
 		path: str,
+		content_bytes: bytes,
 		encoding: str | None
 	) -> str:
 		"""
-		Read single file from directory (searches recursively if not found at root)
+		Decode the content of a single file
 
+		:param path:
+			File path, used in error messages
+		:param content_bytes:
+			Raw file content
 		:param encoding:
 			Text encoding (None for auto-detection)
 		:return:
 			File content as string
-		:raises FileNotFoundError:
-			If file not found
+		:raises UnicodeDecodeError:
+			If content cannot be decoded
 		"""
-		# Try direct path first
-
-		with open(path, 'rb') as file:
-			content_bytes = file.read()
-
 		try:
-			return self._decode_content(content_bytes, encoding)
+			return KFSReader._decode_content(content_bytes, encoding)
 		except UnicodeDecodeError as e:
 			raise UnicodeDecodeError(
 				e.encoding,
@@ -221,30 +314,9 @@ class KFSReader(IKFSReader):
 		"""
 		encodings_to_try = []
 
-		if encoding is None:
-			encodings_to_try.extend(['utf-16-le', 'utf-8'])
-
-			detected = chardet.detect(content)
-			detected_encoding = detected.get('encoding')
-			confidence = detected.get('confidence', 0)
-
-			if detected_encoding and confidence > 0.7:
-				detected_lower = detected_encoding.lower()
-				if detected_lower not in encodings_to_try:
-					encodings_to_try.append(detected_lower)
-
-			encodings_to_try.append('iso-8859-1')
-		else:
-			encodings_to_try.append(encoding)
-			if 'utf-16-le' not in encodings_to_try:
-				encodings_to_try.append('utf-16-le')
-			if 'utf-8' not in encodings_to_try:
-				encodings_to_try.append('utf-8')
-			if 'iso-8859-1' not in encodings_to_try:
-				encodings_to_try.append('iso-8859-1')
-
 		last_error = None
-		for enc in encodings_to_try:
+		for enc in KFSReader._candidate_encodings(content, encoding):
+			encodings_to_try.append(enc)
 			try:
 				decoded = content.decode(enc)
 				if decoded.startswith('\ufeff'):
@@ -266,6 +338,42 @@ class KFSReader(IKFSReader):
 			f"Failed to decode content with any of: {', '.join(encodings_to_try)}"
 		) from last_error
 
+	@staticmethod
+	def _candidate_encodings(content: bytes, encoding: str | None) -> Iterator[str]:
+		"""
+		Yield the encodings to try, in order
+
+		With auto-detection, chardet is only run once UTF-16 LE and UTF-8
+		both failed; game files are nearly always one of them.
+
+		:param content:
+			Raw file content as bytes
+		:param encoding:
+			Primary encoding to try (None for auto-detection using chardet)
+		:return:
+			Encoding names
+		"""
+		if encoding is not None:
+			yield encoding
+			for fallback in ('utf-16-le', 'utf-8', 'iso-8859-1'):
+				if fallback != encoding:
+					yield fallback
+			return
+
+		yield 'utf-16-le'
+		yield 'utf-8'
+
+		detected = chardet.detect(content)
+		detected_encoding = detected.get('encoding')
+		confidence = detected.get('confidence', 0)
+
+		if detected_encoding and confidence > 0.7:
+			detected_lower = detected_encoding.lower()
+			if detected_lower not in ('utf-16-le', 'utf-8'):
+				yield detected_lower
+
+		yield 'iso-8859-1'
+
 	@staticmethod
 	def _is_valid_decoded_content(decoded: str) -> bool:
 		"""
@@ -1,27 +1,44 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from logging import Logger
 
 from dependency_injector.wiring import Provide
 
 from src.core.Container import Container
-from src.domain.game.entities.UnitClass import UnitClass
 from src.domain.game.interfaces.ILocalizationRepository import ILocalizationRepository
-from src.utils.parsers import atom
-from src.utils.parsers.atom import AtomSyntaxError
 from src.utils.parsers.game_data.IKFSReader import IKFSReader
 from src.utils.parsers.game_data.IKFSUnitParser import IKFSUnitParser
+from src.utils.parsers.game_data.UnitAtomParser import UnitAtomParser
 
 
 class KFSUnitParser(IKFSUnitParser):
 
+	# Work units handed to each worker process, so that slow files even out
+	_CHUNKS_PER_WORKER: int = 4
+
 	def __init__(
 		self,
 		reader: IKFSReader = Provide[Container.kfs_reader],
 		localization_repository: ILocalizationRepository = Provide[Container.localization_repository],
-		logger: Logger = Provide[Container.logger]
+		logger: Logger = Provide[Container.logger],
+		workers: int = 1
 	):
+		"""
+		Initialize unit parser
+
+		:param reader:
+			Game file reader
+		:param localization_repository:
+			Localization repository listing unit kb_ids
+		:param logger:
+			Logger
+		:param workers:
+			Number of processes parsing unit files, 1 parses in the calling process
+		"""
 		self._reader = reader
 		self._localization_repository = localization_repository
 		self._logger = logger
+		self._workers = workers
 
 	def parse(
 		self,
@@ -35,6 +52,10 @@ class KFSUnitParser(IKFSUnitParser):
 		Where params contains raw arena_params data (features_hints as list, etc.)
 		Skips units with class='spirit'. Raises exception for invalid atom files.
 
+		Unit files are read in the calling process; with several workers they
+		are parsed by a process pool, in chunks. The result is ordered by
+		kb_id in localization order either way.
+
 		:param game_id:
 			Game ID
 		:param allowed_kb_ids:
@@ -51,13 +72,39 @@ class KFSUnitParser(IKFSUnitParser):
 		if allowed_kb_ids:
 			unit_kb_ids = [kb_id for kb_id in unit_kb_ids if kb_id in allowed_kb_ids]
 
-		result = {}
+		unit_files = []
 		for kb_id in unit_kb_ids:
-			unit_data = self._parse_unit_file(game_id, kb_id)
-			if unit_data is not None:
-				result[kb_id] = unit_data
+			content = self._read_unit_file(game_id, kb_id)
+			if content is not None:
+				unit_files.append((kb_id, content))
+
+		if self._workers > 1 and len(unit_files) > 1:
+			parsed = self._parse_parallel(unit_files)
+		else:
+			parsed = UnitAtomParser.parse_chunk(unit_files)
 
-		return result
+		return {kb_id: unit_data for kb_id, unit_data in parsed if unit_data is not None}
+
+	def _parse_parallel(self, unit_files: list[tuple[str, str]]) -> list[tuple[str, dict[str, any] | None]]:
+		"""
+		Parse unit files in a pool of worker processes
+
+		Workers are spawned rather than forked, so they do not inherit the
+		scanning process' threads, database connections or open archives.
+
+		:param unit_files:
+			(kb_id, atom file content) pairs
+		:return:
+			(kb_id, unit data or None) pairs in the order of unit_files
+		:raises ValueError:
+			When an atom file has invalid structure
+		"""
+		workers = min(self._workers, len(unit_files))
+		chunk_size = -(-len(unit_files) // (workers * self._CHUNKS_PER_WORKER))
+		chunks = [unit_files[i:i + chunk_size] for i in range(0, len(unit_files), chunk_size)]
+
+		with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+			return [unit for chunk in executor.map(UnitAtomParser.parse_chunk, chunks) for unit in chunk]
 
 	def _get_unit_kb_ids(self) -> list[str]:
 		"""
@@ -93,20 +140,18 @@ class KFSUnitParser(IKFSUnitParser):
 			return False
 		return True
 
-	def _parse_unit_file(self, game_id: int, kb_id: str) -> dict[str, any] | None:
+	def _read_unit_file(self, game_id: int, kb_id: str) -> str | None:
 		"""
-		Parse single unit atom file
+		Read single unit atom file
 
 		:param game_id:
 			Game ID
 		:param kb_id:
 			Unit kb_id (e.g., 'bowman')
 		:return:
-			Dictionary {kb_id, unit_class, main, params} or None if spirit
-		:raises FileNotFoundError:
-			When atom file not found
+			Atom file content, or None when the file is not found
 		:raises ValueError:
-			When atom file has invalid structure (missing sections, wrong types, etc.)
+			When the atom file is empty
 		"""
 		atom_filename = f"{kb_id}.atom"
 
@@ -122,83 +167,4 @@ class KFSUnitParser(IKFSUnitParser):
 		if not contents:
 			raise ValueError(f"Unit atom file '{atom_filename}' returned empty content")
 
-		content = contents[0]
-		try:
-			parsed = atom.loads(content)
-		except AtomSyntaxError as e:
-			self._logger.info(content)
-			raise ValueError(f"Unit '{kb_id}': atom syntax error: {e}. Atom file name: {atom_filename}")
-
-		if 'main' not in parsed:
-			self._logger.error(f"Unit '{kb_id}': Parsed keys: {list(parsed.keys())}")
-			self._logger.error(f"Unit '{kb_id}': First 200 chars of content: {repr(content[:200])}")
-			raise ValueError(f"Unit '{kb_id}': atom file missing 'main' section")
-
-		main_section = parsed['main']
-		if not main_section:
-			raise ValueError(f"Unit '{kb_id}': 'main' section is not a dict")
-
-		unit_class_str = main_section.get('class', 'chesspiece')
-
-		if unit_class_str == 'spirit':
-			return None
-
-		if 'arena_params' not in parsed:
-			raise ValueError(f"Unit '{kb_id}': atom file missing 'arena_params' section")
-
-		arena_params = parsed['arena_params']
-		if not isinstance(arena_params, dict):
-			raise ValueError(f"Unit '{kb_id}': 'arena_params' section is not a dict")
-
-		try:
-			unit_class = UnitClass(unit_class_str)
-		except ValueError:
-			unit_class = UnitClass.CHESSPIECE
-
-		processed_params = self._process_arena_params(arena_params)
-
-		return {
-			'kb_id': kb_id,
-			'unit_class': unit_class,
-			'main': main_section,
-			'params': processed_params
-		}
-
-	def _process_arena_params(self, arena_params: dict) -> dict:
-		"""
-		Process arena_params dictionary
-
-		Splits features_hints and attacks into lists
-
-		:param arena_params:
-			Raw arena_params from atom file
-		:return:
-			Processed params with lists for specific fields
-		"""
-		processed = dict(arena_params)
-
-		if 'features_hints' in processed and isinstance(processed['features_hints'], str):
-			processed['features_hints'] = self._split_comma_separated(
-				processed['features_hints']
-			)
-
-		if 'attacks' in processed and isinstance(processed['attacks'], str):
-			processed['attacks'] = self._split_comma_separated(
-				processed['attacks']
-			)
-
-		return processed
-
-	@staticmethod
-	def _split_comma_separated(value: str) -> list[str]:
-		"""
-		Split comma-separated string into list
-
-		:param value:
-			Comma-separated string
-		:return:
-			List of trimmed strings
-		"""
-		if not value:
-			return []
-		return [item.strip() for item in value.split(',')]
+		return contents[0]
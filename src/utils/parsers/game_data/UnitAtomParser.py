@@ -0,0 +1,123 @@
+from src.domain.game.entities.UnitClass import UnitClass
+from src.utils.parsers import atom
+from src.utils.parsers.atom import AtomSyntaxError
+
+
+class UnitAtomParser:
+	"""
+	Parses the content of unit atom files
+
+	Kept apart from KFSUnitParser and free of container dependencies, so
+	that worker processes parsing units only import what parsing needs.
+	"""
+
+	@staticmethod
+	def parse_chunk(unit_files: list[tuple[str, str]]) -> list[tuple[str, dict[str, any] | None]]:
+		"""
+		Parse a chunk of unit files
+
+		:param unit_files:
+			(kb_id, atom file content) pairs
+		:return:
+			(kb_id, unit data or None) pairs in the same order
+		:raises ValueError:
+			When an atom file has invalid structure
+		"""
+		return [(kb_id, UnitAtomParser.parse(kb_id, content)) for kb_id, content in unit_files]
+
+	@staticmethod
+	def parse(kb_id: str, content: str) -> dict[str, any] | None:
+		"""
+		Parse single unit atom file content
+
+		:param kb_id:
+			Unit kb_id (e.g., 'bowman')
+		:param content:
+			Atom file content
+		:return:
+			Dictionary {kb_id, unit_class, main, params} or None if spirit
+		:raises ValueError:
+			When atom file has invalid structure (missing sections, wrong types, etc.)
+		"""
+		atom_filename = f"{kb_id}.atom"
+
+		try:
+			parsed = atom.loads(content)
+		except AtomSyntaxError as e:
+			raise ValueError(f"Unit '{kb_id}': atom syntax error: {e}. Atom file name: {atom_filename}")
+
+		if 'main' not in parsed:
+			raise ValueError(
+				f"Unit '{kb_id}': atom file missing 'main' section. "
+				f"Parsed keys: {list(parsed.keys())}. First 200 chars of content: {repr(content[:200])}"
+			)
+
+		main_section = parsed['main']
+		if not main_section:
+			raise ValueError(f"Unit '{kb_id}': 'main' section is not a dict")
+
+		unit_class_str = main_section.get('class', 'chesspiece')
+
+		if unit_class_str == 'spirit':
+			return None
+
+		if 'arena_params' not in parsed:
+			raise ValueError(f"Unit '{kb_id}': atom file missing 'arena_params' section")
+
+		arena_params = parsed['arena_params']
+		if not isinstance(arena_params, dict):
+			raise ValueError(f"Unit '{kb_id}': 'arena_params' section is not a dict")
+
+		try:
+			unit_class = UnitClass(unit_class_str)
+		except ValueError:
+			unit_class = UnitClass.CHESSPIECE
+
+		processed_params = UnitAtomParser._process_arena_params(arena_params)
+
+		return {
+			'kb_id': kb_id,
+			'unit_class': unit_class,
+			'main': main_section,
+			'params': processed_params
+		}
+
+	@staticmethod
+	def _process_arena_params(arena_params: dict) -> dict:
+		"""
+		Process arena_params dictionary
+
+		Splits features_hints and attacks into lists
+
+		:param arena_params:
+			Raw arena_params from atom file
+		:return:
+			Processed params with lists for specific fields
+		"""
+		processed = dict(arena_params)
+
+		if 'features_hints' in processed and isinstance(processed['features_hints'], str):
+			processed['features_hints'] = UnitAtomParser._split_comma_separated(
+				processed['features_hints']
+			)
+
+		if 'attacks' in processed and isinstance(processed['attacks'], str):
+			processed['attacks'] = UnitAtomParser._split_comma_separated(
+				processed['attacks']
+			)
+
+		return processed
+
+	@staticmethod
+	def _split_comma_separated(value: str) -> list[str]:
+		"""
+		Split comma-separated string into list
+
+		:param value:
+			Comma-separated string
+		:return:
+			List of trimmed strings
+		"""
+		if not value:
+			return []
+		return [item.strip() for item in value.split(',')]
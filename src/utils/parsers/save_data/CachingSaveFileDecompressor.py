@@ -0,0 +1,149 @@
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from src.utils.parsers.save_data.DataFileType import DataFileType
+from src.utils.parsers.save_data.ISaveFileDecompressor import ISaveFileDecompressor
+
+
+class CachingSaveFileDecompressor(ISaveFileDecompressor):
+	"""
+	LRU cache of decompressed save data, bounded by total size in bytes
+
+	Entries are keyed by save path, its modification time and size, and the
+	requested data file type, so an unchanged save is decompressed once no
+	matter how many times it is scanned. Rewriting the save changes its key;
+	stale entries are evicted as the cache fills up.
+
+	Data is cached as immutable bytes, so every caller can share it safely.
+	"""
+
+	def __init__(self, decompressor: ISaveFileDecompressor, max_bytes: int):
+		"""
+		Initialize caching decompressor
+
+		:param decompressor:
+			Decompressor performing actual reads
+		:param max_bytes:
+			Maximum total size of cached data
+		"""
+		self._decompressor = decompressor
+		self._max_bytes = max_bytes
+		self._entries: OrderedDict[tuple, bytes] = OrderedDict()
+		self._size = 0
+		self._hits = 0
+		self._misses = 0
+		self._lock = threading.Lock()
+
+	@property
+	def hits(self) -> int:
+		"""
+		Number of requests served from cache
+		"""
+		return self._hits
+
+	@property
+	def misses(self) -> int:
+		"""
+		Number of requests that had to decompress the save
+		"""
+		return self._misses
+
+	@property
+	def size(self) -> int:
+		"""
+		Total size of cached data in bytes
+		"""
+		return self._size
+
+	def decompress(self, save_path: Path, data_type: DataFileType = DataFileType.DATA) -> bytes:
+		"""
+		Decompress save data file, reusing the result for an unchanged save
+
+		:param save_path:
+			Path to save (directory containing 'data' file or .sav archive)
+		:param data_type:
+			File type to extract
+		:return:
+			Decompressed binary data
+		:raises ValueError:
+			If save file format is invalid
+		:raises FileNotFoundError:
+			If save file doesn't exist
+		"""
+		if not save_path.exists():
+			return self._decompressor.decompress(save_path, data_type)
+
+		key = (str(save_path), self._fingerprint(save_path), data_type)
+
+		with self._lock:
+			data = self._entries.get(key)
+			if data is not None:
+				self._entries.move_to_end(key)
+				self._hits += 1
+				return data
+			self._misses += 1
+
+		# No copy for bytes; mutable buffers of other decompressors are frozen
+		data = bytes(self._decompressor.decompress(save_path, data_type))
+		self._store(key, data)
+
+		return data
+
+	def clear(self) -> None:
+		"""
+		Drop all cached data and reset hit/miss counters
+		"""
+		with self._lock:
+			self._entries.clear()
+			self._size = 0
+			self._hits = 0
+			self._misses = 0
+
+	def _store(self, key: tuple, data: bytes) -> None:
+		"""
+		Cache data, evicting least recently used entries to fit max size
+
+		:param key:
+			Cache key
+		:param data:
+			Decompressed data
+		"""
+		if len(data) > self._max_bytes:
+			return
+
+		with self._lock:
+			if key in self._entries:
+				return
+
+			self._entries[key] = data
+			self._size += len(data)
+
+			while self._size > self._max_bytes:
+				_, evicted = self._entries.popitem(last=False)
+				self._size -= len(evicted)
+
+	@staticmethod
+	def _fingerprint(save_path: Path) -> tuple:
+		"""
+		Get modification time and size of save
+
+		Save directories are fingerprinted by their files, as rewriting a
+		file in place does not touch the directory itself.
+
+		:param save_path:
+			Path to save (directory or .sav archive)
+		:return:
+			Modification times (ns) and sizes of save file(s)
+		"""
+		if not save_path.is_dir():
+			stat = save_path.stat()
+			return (stat.st_mtime_ns, stat.st_size),
+
+		with os.scandir(save_path) as entries:
+			return tuple(sorted(
+				(entry.name, entry.stat().st_mtime_ns, entry.stat().st_size)
+				for entry in entries
+				if entry.is_file()
+			))
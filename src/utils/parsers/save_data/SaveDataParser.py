@@ -1,15 +1,17 @@
 import re
-import struct
 from pathlib import Path
 from typing import Any, Optional
 
 from dependency_injector.wiring import inject, Provide
 
 from src.core.Container import Container
-from src.domain.game.interfaces.IItemRepository import IItemRepository
+from src.domain.game.entities.Item import Item
+from src.domain.game.interfaces.IKbIdIndex import IKbIdIndex
 from src.utils.parsers.save_data.ISaveFileDecompressor import ISaveFileDecompressor
 from src.utils.parsers.save_data.ISaveDataParser import ISaveDataParser
 from src.utils.parsers.save_data.SaveFileData import SaveFileData, HeroInventory, GameObjectData
+from src.utils.parsers.save_data.SaveRecordScanner import SaveRecordScanner
+from src.utils.parsers.save_data.SaveSectionIndex import SaveSectionIndex
 
 
 class SaveDataParser(ISaveDataParser):
@@ -24,22 +26,31 @@ class SaveDataParser(ISaveDataParser):
 		b'.items', b'.spells', b'.shopunits', b'.garrison', b'.temp'
 	}
 
+	ID_PATTERN: re.Pattern = re.compile(r'[a-z][a-z0-9_]*')
+
+	BUILDING_TRADER_PATTERN: re.Pattern = re.compile(rb'building_trader@(\d+)')
+
+	# UTF-16-LE encoded itext_{location}_{id}
+	SHOP_ID_PATTERN: re.Pattern = re.compile(
+		rb'i\x00t\x00e\x00x\x00t\x00_\x00((?:[-\w]\x00)+)_\x00((?:\d\x00)+)'
+	)
+
 	@inject
 	def __init__(
 		self,
 		decompressor: ISaveFileDecompressor = Provide[Container.save_file_decompressor],
-		item_repository: IItemRepository = Provide[Container.item_repository]
+		kb_id_index: IKbIdIndex = Provide[Container.kb_id_index]
 	):
 		"""
 		Initialize save data parser
 
 		:param decompressor:
 			Save file decompressor
-		:param item_repository:
-			Item repository for validating kb_ids
+		:param kb_id_index:
+			Game entity index for validating kb_ids
 		"""
 		self._decompressor = decompressor
-		self._item_repository = item_repository
+		self._kb_id_index = kb_id_index
 
 	def parse(self, save_path: Path) -> SaveFileData:
 		"""
@@ -102,9 +113,11 @@ class SaveDataParser(ISaveDataParser):
 			If save file doesn't exist
 		"""
 		data = self._decompressor.decompress(save_path)
+		index = SaveSectionIndex(data)
+		scanner = SaveRecordScanner(data)
 
 		itext_shops = self._find_all_shop_ids(data)
-		building_shops = self._find_building_trader_shops(data)
+		building_shops = self._find_building_trader_shops(data, scanner, index)
 
 		all_shops = itext_shops + building_shops
 		all_shops = sorted(all_shops, key=lambda x: x[1])
@@ -112,25 +125,18 @@ class SaveDataParser(ISaveDataParser):
 		shops_by_inventory = {}
 
 		for shop_id, shop_pos in all_shops:
-			shop_data = self._parse_shop(data, shop_id, shop_pos)
+			sections = self._find_shop_sections(index, shop_pos)
 
-			inventory_key = None
-			for section_marker in [b'.garrison', b'.items', b'.shopunits', b'.spells']:
-				section_pos = self._find_preceding_section(data, section_marker, shop_pos, 5000)
-				if section_pos and self._section_belongs_to_shop(data, section_pos, shop_pos):
-					if inventory_key is None:
-						inventory_key = section_pos
-					break
-
-			if inventory_key is None:
-				inventory_key = shop_pos
+			inventory_key = shop_pos
+			if sections:
+				inventory_key = next(iter(sections.values()))['pos']
 
 			if inventory_key not in shops_by_inventory:
 				shops_by_inventory[inventory_key] = {
 					'itext': '',
 					'actor': '',
 					'location': '',
-					'shop_data': shop_data
+					'shop_data': self._parse_shop(scanner, index, shop_id, shop_pos, sections)
 				}
 
 			shop_entry = shops_by_inventory[inventory_key]
@@ -162,7 +168,7 @@ class SaveDataParser(ISaveDataParser):
 			}
 			result.append(shop_entry)
 
-		hero_items = self._parse_hero_inventory(data)
+		hero_items = self._parse_hero_inventory(data, scanner, index)
 		hero_inventory = HeroInventory(items=hero_items) if hero_items else None
 
 		return SaveFileData(shops=result, hero_inventory=hero_inventory)
@@ -176,14 +182,11 @@ class SaveDataParser(ISaveDataParser):
 		  Examples: "m_portland", "aralan", "some-location"
 		- id: numeric shop identifier
 
-		Uses overlapping chunks to prevent shop IDs from being split
-		across chunk boundaries. Deduplicates using both position and
-		shop_id to prevent multiple occurrences of the same shop.
-
-		UTF-16-LE Alignment Fix:
-		Decodes each chunk at both even and odd byte offsets to handle
-		UTF-16-LE alignment issues. Shop text at odd offsets would be
-		missed by single-pass decoding due to misaligned byte pairs.
+		Shop IDs are stored as UTF-16-LE text. SHOP_ID_PATTERN matches the
+		encoded bytes directly, so shops at both even and odd byte offsets
+		are found in a single pass with exact positions and no
+		decode/encode round trip. Deduplicates by shop_id, keeping the
+		first occurrence.
 
 		:param data:
 			Decompressed save file data
@@ -191,47 +194,22 @@ class SaveDataParser(ISaveDataParser):
 			List of (shop_id, position) tuples sorted by position
 		"""
 		shops = []
-		seen_positions = set()
 		seen_shop_ids = set()
-		pos = 0
-		chunk_size = 10000
-		overlap = 200
-
-		while pos < len(data):
-			current_chunk_size = min(chunk_size, len(data) - pos)
-
-			for alignment_offset in [0, 1]:
-				decode_start = pos + alignment_offset
-				decode_end = min(decode_start + current_chunk_size, len(data))
 
-				if decode_start >= len(data):
-					continue
+		for match in self.SHOP_ID_PATTERN.finditer(data):
+			location = match.group(1).decode('utf-16-le')
+			shop_num = match.group(2).decode('utf-16-le')
+			shop_id = location + '_' + shop_num
+			if shop_id not in seen_shop_ids:
+				shops.append((shop_id, match.start()))
+				seen_shop_ids.add(shop_id)
 
-				try:
-					text = data[decode_start:decode_end].decode('utf-16-le', errors='ignore')
-					matches = re.finditer(r'itext_([-\w]+)_(\d+)', text)
-
-					for match in matches:
-						shop_id_full = match.group(0)
-						location = match.group(1)
-						shop_num = match.group(2)
-						shop_id = location + '_' + shop_num
-						shop_bytes = shop_id_full.encode('utf-16-le')
-						actual_pos = data.find(shop_bytes, pos, pos+current_chunk_size)
-						if actual_pos != -1 and actual_pos not in seen_positions and shop_id not in seen_shop_ids:
-							shops.append((shop_id, actual_pos))
-							seen_positions.add(actual_pos)
-							seen_shop_ids.add(shop_id)
-				except:
-					pass
-
-			pos += chunk_size - overlap
-
-		return sorted(shops, key=lambda x: x[1])
+		return shops
 
 	def _extract_actor_id_from_actors_section(
 		self,
-		data: bytes,
+		scanner: SaveRecordScanner,
+		index: SaveSectionIndex,
 		building_pos: int
 	) -> Optional[int]:
 		"""
@@ -247,50 +225,41 @@ class SaveDataParser(ISaveDataParser):
 		actor_id:   0x3028fabc (bytes: bc fa 28 30)
 		Difference: Last byte 0xb0 → 0x30 (bit 7 cleared)
 
-		:param data:
-			Decompressed save file data
+		:param scanner:
+			Save record scanner
+		:param index:
+			Section index of save data
 		:param building_pos:
 			Position of building_trader@ marker
 		:return:
 			Actor ID or None if not found or inactive shop
 		"""
-		search_start = max(0, building_pos - 3000)
-		search_chunk = data[search_start:building_pos]
-
-		actors_pos = search_chunk.rfind(b'.actors')
-		if actors_pos == -1:
+		abs_actors_pos = index.find_preceding(index.ACTORS, building_pos, 3000)
+		if abs_actors_pos is None:
 			return None
 
-		abs_actors_pos = search_start + actors_pos
-		chunk = data[abs_actors_pos:abs_actors_pos + 100]
-
-		strg_pos = chunk.find(b'strg')
-		if strg_pos == -1:
+		search_end = abs_actors_pos + 100
+		value_pos = scanner.find_field(b'strg', abs_actors_pos, search_end)
+		if value_pos is None:
 			return None
 
-		value_offset = strg_pos + 8
-		if value_offset + 4 > len(chunk):
+		# Value follows its uint32 length and must lie within the search range
+		value_offset = value_pos + 4
+		if value_offset + 4 > search_end:
 			return None
 
-		try:
-			strg_value = struct.unpack('<I', chunk[value_offset:value_offset + 4])[0]
-
-			strg_bytes = struct.unpack('4B', struct.pack('<I', strg_value))
-
-			if (strg_bytes[3] & 0x80) == 0:
-				return None
-
-			actor_bytes = list(strg_bytes)
-			actor_bytes[3] = actor_bytes[3] & 0x7F
-
-			actor_id = struct.unpack('<I', bytes(actor_bytes))[0]
-
-			return actor_id
-
-		except:
+		strg_value = scanner.read_u32(value_offset)
+		if strg_value is None or (strg_value & 0x80000000) == 0:
 			return None
 
-	def _find_building_trader_shops(self, data: bytes) -> list[tuple[str, int]]:
+		return strg_value & 0x7FFFFFFF
+
+	def _find_building_trader_shops(
+		self,
+		data: bytes,
+		scanner: SaveRecordScanner,
+		index: SaveSectionIndex
+	) -> list[tuple[str, int]]:
 		"""
 		Find all building_trader@ shops with actor IDs
 
@@ -306,49 +275,42 @@ class SaveDataParser(ISaveDataParser):
 
 		:param data:
 			Decompressed save file data
+		:param scanner:
+			Save record scanner
+		:param index:
+			Section index of save data
 		:return:
 			List of (shop_id, position) tuples for shops with actor IDs
 		"""
 		shops = []
 		seen_inventory_positions = set()
-		pos = 0
 
-		while pos < len(data):
-			pos = data.find(b'building_trader@', pos)
-			if pos == -1:
-				break
+		for pos in index.positions(index.BUILDING_TRADER):
+			if not self.BUILDING_TRADER_PATTERN.match(data, pos):
+				continue
 
-			segment = data[pos:pos+30]
-			try:
-				text = segment.decode('ascii', errors='ignore')
-				match = re.match(r'building_trader@(\d+)', text)
-				if match:
-					building_num = match.group(1)
-
-					location = self._extract_location_from_lt_tag(data, pos)
-
-					if location:
-						shopunits_pos = self._find_preceding_section(data, b'.shopunits', pos, 2000)
-
-						if shopunits_pos and self._section_belongs_to_building_trader(
-							data, shopunits_pos, pos
-						):
-							if shopunits_pos not in seen_inventory_positions:
-								actor_id = self._extract_actor_id_from_actors_section(data, pos)
-								if actor_id:
-									shop_id = f'{location}_actor_{actor_id}'
-									shops.append((shop_id, pos))
-									seen_inventory_positions.add(shopunits_pos)
-			except:
-				pass
-
-			pos += 1
+			location = self._extract_location_from_lt_tag(scanner, index, pos)
+			if not location:
+				continue
+
+			shopunits_pos = index.find_preceding(index.SHOPUNITS, pos, 2000)
+
+			if shopunits_pos and self._section_belongs_to_building_trader(
+				index, shopunits_pos, pos
+			):
+				if shopunits_pos not in seen_inventory_positions:
+					actor_id = self._extract_actor_id_from_actors_section(scanner, index, pos)
+					if actor_id:
+						shop_id = f'{location}_actor_{actor_id}'
+						shops.append((shop_id, pos))
+						seen_inventory_positions.add(shopunits_pos)
 
 		return shops
 
 	def _extract_location_from_lt_tag(
 		self,
-		data: bytes,
+		scanner: SaveRecordScanner,
+		index: SaveSectionIndex,
 		building_pos: int
 	) -> Optional[str]:
 		"""
@@ -357,47 +319,32 @@ class SaveDataParser(ISaveDataParser):
 		Structure: lt [4-byte length] [location_name]
 		Typically appears ~29 bytes before building_trader@
 
-		:param data:
-			Save file data
+		:param scanner:
+			Save record scanner
+		:param index:
+			Section index of save data
 		:param building_pos:
 			Position of building_trader@
 		:return:
 			Location name or None if not found
 		"""
-		search_start = max(0, building_pos - 500)
-		chunk = data[search_start:building_pos]
-
-		lt_pos = chunk.rfind(b'lt')
-
-		if lt_pos != -1:
-			abs_lt_pos = search_start + lt_pos
-
-			if abs_lt_pos + 6 < len(data):
-				try:
-					length_bytes = data[abs_lt_pos + 2:abs_lt_pos + 6]
-					location_length = struct.unpack('<I', length_bytes)[0]
+		abs_lt_pos = index.find_preceding(index.LT, building_pos, 500)
+		if abs_lt_pos is None:
+			return None
 
-					if 0 < location_length < 100:
-						location_start = abs_lt_pos + 6
-						location_bytes = data[location_start:location_start + location_length]
-						location = location_bytes.decode('ascii')
-						return location
-				except:
-					pass
-
-		return None
+		return scanner.read_string(abs_lt_pos + len(index.LT), 1, 99)
 
+	@staticmethod
 	def _section_belongs_to_building_trader(
-		self,
-		data: bytes,
+		index: SaveSectionIndex,
 		section_pos: int,
 		building_pos: int
 	) -> bool:
 		"""
 		Verify that no other shop ID exists between section and building_trader@
 
-		:param data:
-			Save file data
+		:param index:
+			Section index of save data
 		:param section_pos:
 			Section position
 		:param building_pos:
@@ -405,48 +352,17 @@ class SaveDataParser(ISaveDataParser):
 		:return:
 			True if section belongs to this building_trader
 		"""
-		chunk = data[section_pos:building_pos]
-
-		if b'itext_' in chunk:
+		if index.contains(index.ITEXT, section_pos, building_pos):
 			return False
 
-		if b'building_trader@' in chunk:
+		if index.contains(index.BUILDING_TRADER, section_pos, building_pos):
 			return False
 
 		return True
 
-	def _find_preceding_section(
-		self,
-		data: bytes,
-		marker: bytes,
-		shop_pos: int,
-		max_distance: int = 5000
-	) -> Optional[int]:
-		"""
-		Find section marker immediately before shop ID
-
-		:param data:
-			Save file data
-		:param marker:
-			Section marker
-		:param shop_pos:
-			Shop ID position
-		:param max_distance:
-			Maximum distance to search backwards
-		:return:
-			Section position or None if not found
-		"""
-		search_start = max(0, shop_pos - max_distance)
-		chunk = data[search_start:shop_pos]
-		last_pos = chunk.rfind(marker)
-
-		if last_pos != -1:
-			return search_start + last_pos
-		return None
-
 	def _find_section_end(
 		self,
-		data: bytes,
+		index: SaveSectionIndex,
 		section_start: int,
 		max_end: int
 	) -> int:
@@ -457,8 +373,8 @@ class SaveDataParser(ISaveDataParser):
 		like .temp, which can contain data that matches entry patterns
 		but isn't part of the current section.
 
-		:param data:
-			Save file data
+		:param index:
+			Section index of save data
 		:param section_start:
 			Starting position of current section
 		:param max_end:
@@ -466,28 +382,28 @@ class SaveDataParser(ISaveDataParser):
 		:return:
 			Actual end position of section
 		"""
-		search_area = data[section_start:max_end]
 		earliest_marker_pos = max_end
 
 		for marker in self.SECTION_MARKERS:
-			pos = search_area.find(marker, 1)
-			if pos != -1:
-				absolute_pos = section_start + pos
-				earliest_marker_pos = min(earliest_marker_pos, absolute_pos)
+			pos = index.find_next(marker, section_start + 1, max_end)
+			if pos is not None:
+				earliest_marker_pos = min(earliest_marker_pos, pos)
 
 		return earliest_marker_pos
 
 	def _parse_slash_separated(
 		self,
-		data: bytes,
+		scanner: SaveRecordScanner,
 		section_pos: int,
 		next_pos: int
 	) -> list[tuple[str, int]]:
 		"""
 		Parse slash-separated format
 
-		:param data:
-			Save file data
+		Section payload is a 'strg' field holding "name/quantity/name/quantity/..."
+
+		:param scanner:
+			Save record scanner
 		:param section_pos:
 			Section start position
 		:param next_pos:
@@ -495,58 +411,44 @@ class SaveDataParser(ISaveDataParser):
 		:return:
 			List of (name, quantity) tuples
 		"""
-		pos = section_pos
-
-		strg_pos = data.find(b'strg', pos, next_pos)
-		if strg_pos == -1:
+		value_pos = scanner.find_field(b'strg', section_pos, next_pos)
+		if value_pos is None:
 			return []
 
-		pos = strg_pos + 4
-
-		if pos + 4 > len(data):
+		content_str = scanner.read_string(value_pos, 1, 5000)
+		if content_str is None:
 			return []
 
-		str_length = struct.unpack('<I', data[pos:pos+4])[0]
-		pos += 4
+		parts = content_str.split('/')
 
-		if str_length <= 0 or str_length > 5000:
-			return []
-
-		if pos + str_length > len(data):
-			return []
+		items = []
+		i = 0
+		while i < len(parts) - 1:
+			name = parts[i]
+			try:
+				quantity = int(parts[i + 1])
+				if self._is_valid_id(name):
+					items.append((name, quantity))
+				i += 2
+			except ValueError:
+				i += 1
 
-		try:
-			content_str = data[pos:pos+str_length].decode('ascii')
-			parts = content_str.split('/')
-
-			items = []
-			i = 0
-			while i < len(parts) - 1:
-				name = parts[i]
-				try:
-					quantity = int(parts[i + 1])
-					if self._is_valid_id(name):
-						items.append((name, quantity))
-					i += 2
-				except:
-					i += 1
-
-			return items
-
-		except:
-			return []
+		return items
 
 	def _parse_items_section(
 		self,
-		data: bytes,
+		scanner: SaveRecordScanner,
 		section_pos: int,
 		next_pos: int
 	) -> list[tuple[str, int]]:
 		"""
 		Parse items section
 
-		:param data:
-			Save file data
+		Each item is a record keyed by its kb_id. Quantity is taken from the
+		record's 'slruck' field ("slot,quantity"), defaulting to 1.
+
+		:param scanner:
+			Save record scanner
 		:param section_pos:
 			Section start position
 		:param next_pos:
@@ -555,71 +457,64 @@ class SaveDataParser(ISaveDataParser):
 			List of (name, quantity) tuples
 		"""
 		items = []
-		pos = section_pos + len(b'.items')
-		search_end = next_pos
 
-		while pos < search_end - 20:
-			if pos + 4 > len(data):
-				break
+		for record in scanner.scan_records(section_pos + len(b'.items'), next_pos, self._is_valid_id):
+			quantity = self._read_item_quantity(scanner, record.end, next_pos)
+			items.append((record.key, quantity))
 
-			try:
-				name_length = struct.unpack('<I', data[pos:pos+4])[0]
+		return sorted(items)
+
+	@staticmethod
+	def _read_item_quantity(scanner: SaveRecordScanner, record_end: int, section_end: int) -> int:
+		"""
+		Read item quantity from 'slruck' field following item record
 
-				if 3 <= name_length <= 100:
-					if pos + 4 + name_length > len(data):
-						pos += 1
-						continue
+		The field must start within 125 bytes after the item kb_id.
 
+		:param scanner:
+			Save record scanner
+		:param record_end:
+			Position right after item kb_id
+		:param section_end:
+			End of items section
+		:return:
+			Item quantity or 1 if not found
+		"""
+		marker = b'slruck'
+		last_start = min(record_end + 124, section_end - 10)
+		pos = record_end
+
+		while pos <= last_start:
+			value_pos = scanner.find_field(marker, pos, last_start + len(marker))
+			if value_pos is None:
+				break
+
+			val_str = scanner.read_string(value_pos, 1, 20)
+			if val_str is not None and ',' in val_str:
+				parts = val_str.split(',')
+				if len(parts) == 2:
 					try:
-						name = data[pos+4:pos+4+name_length].decode('ascii', errors='strict')
-
-						if self._is_valid_id(name):
-							scan_pos = pos + 4 + name_length
-							quantity = 1
-
-							for _ in range(125):
-								if scan_pos + 10 > search_end:
-									break
-
-								if data[scan_pos:scan_pos+6] == b'slruck':
-									try:
-										val_len = struct.unpack('<I', data[scan_pos+6:scan_pos+10])[0]
-										if 1 <= val_len <= 20:
-											val_str = data[scan_pos+10:scan_pos+10+val_len].decode('ascii', errors='strict')
-											if ',' in val_str:
-												parts = val_str.split(',')
-												if len(parts) == 2:
-													quantity = int(parts[1])
-													break
-									except:
-										pass
-
-								scan_pos += 1
-
-							items.append((name, quantity))
-							pos += 4 + name_length
-							continue
-
-					except:
+						return int(parts[1])
+					except ValueError:
 						pass
-			except:
-				pass
 
-			pos += 1
+			pos = value_pos - len(marker) + 1
 
-		return sorted(items)
+		return 1
 
 	def _parse_spells_section(
 		self,
-		data: bytes,
+		scanner: SaveRecordScanner,
 		section_pos: int,
 		next_pos: int
 	) -> list[tuple[str, int]]:
 		"""
 		Parse spells section
 
-		:param data:
-			Save file data
+		Each spell is a record keyed by its kb_id followed by a uint32 quantity.
+
+		:param scanner:
+			Save record scanner
 		:param section_pos:
 			Section start position
 		:param next_pos:
@@ -628,46 +523,22 @@ class SaveDataParser(ISaveDataParser):
 			List of (name, quantity) tuples
 		"""
 		spells_dict = {}
-		pos = section_pos + len(b'.spells')
-		search_end = next_pos
-
-		while pos < search_end - 20:
-			if pos + 4 > len(data):
-				break
-
-			try:
-				name_length = struct.unpack('<I', data[pos:pos+4])[0]
-
-				if 3 <= name_length <= 100:
-					if pos + 4 + name_length + 4 > len(data):
-						pos += 1
-						continue
-
-					try:
-						name = data[pos+4:pos+4+name_length].decode('ascii', errors='strict')
-
-						if self._is_valid_id(name):
-							quantity = struct.unpack('<I', data[pos+4+name_length:pos+4+name_length+4])[0]
 
-							if 0 < quantity < 10000:
-								if name not in spells_dict or spells_dict[name] < quantity:
-									spells_dict[name] = quantity
-
-								pos += 4 + name_length + 4
-								continue
-
-					except:
-						pass
-			except:
-				pass
-
-			pos += 1
+		for record in scanner.scan_records(
+			section_pos + len(b'.spells'),
+			next_pos,
+			self._is_valid_id,
+			value=scanner.U32,
+			is_valid_value=lambda quantity: 0 < quantity < 10000
+		):
+			if record.key not in spells_dict or spells_dict[record.key] < record.value:
+				spells_dict[record.key] = record.value
 
 		return sorted(spells_dict.items())
 
+	@staticmethod
 	def _section_belongs_to_shop(
-		self,
-		data: bytes,
+		index: SaveSectionIndex,
 		section_pos: int,
 		shop_pos: int
 	) -> bool:
@@ -677,12 +548,11 @@ class SaveDataParser(ISaveDataParser):
 		Prevents attributing sections to wrong shop when searching backwards
 		across shop boundaries.
 
-		UTF-16-LE Alignment Fix:
-		Checks both even and odd byte offsets to detect shops that may be
-		at odd positions within the chunk due to UTF-16-LE alignment.
+		UTF-16-LE shop IDs are indexed at both even and odd byte offsets,
+		so shops at odd positions are detected as well.
 
-		:param data:
-			Save file data
+		:param index:
+			Section index of save data
 		:param section_pos:
 			Section position
 		:param shop_pos:
@@ -690,34 +560,60 @@ class SaveDataParser(ISaveDataParser):
 		:return:
 			True if section belongs to this shop
 		"""
-		chunk = data[section_pos:shop_pos]
+		if index.contains(index.BUILDING_TRADER, section_pos, shop_pos):
+			return False
 
-		if b'building_trader@' in chunk:
+		if index.contains_shop_itext(section_pos, shop_pos):
 			return False
 
-		for alignment_offset in [0, 1]:
-			if alignment_offset >= len(chunk):
-				continue
+		return True
 
-			try:
-				text = chunk[alignment_offset:].decode('utf-16-le', errors='ignore')
-				if re.search(r'itext_[-\w]+_\d+', text):
-					return False
-			except:
-				pass
+	def _find_shop_sections(self, index: SaveSectionIndex, shop_pos: int) -> dict[str, dict]:
+		"""
+		Find inventory sections belonging to shop
 
-		return True
+		:param index:
+			Section index of save data
+		:param shop_pos:
+			Shop ID position
+		:return:
+			Dictionary of section key to marker and position, in
+			garrison, items, units, spells order
+		"""
+		sections = {}
+		for marker, key in [
+			(index.GARRISON, 'garrison'),
+			(index.ITEMS, 'items'),
+			(index.SHOPUNITS, 'units'),
+			(index.SPELLS, 'spells')
+		]:
+			pos = index.find_preceding(marker, shop_pos, 5000)
+			if pos and self._section_belongs_to_shop(index, pos, shop_pos):
+				sections[key] = {'marker': marker, 'pos': pos}
 
-	def _parse_shop(self, data: bytes, shop_id: str, shop_pos: int) -> dict:
+		return sections
+
+	def _parse_shop(
+		self,
+		scanner: SaveRecordScanner,
+		index: SaveSectionIndex,
+		shop_id: str,
+		shop_pos: int,
+		sections: dict[str, dict]
+	) -> dict:
 		"""
 		Parse complete shop with all 4 sections
 
-		:param data:
-			Save file data
+		:param scanner:
+			Save record scanner
+		:param index:
+			Section index of save data
 		:param shop_id:
 			Shop identifier
 		:param shop_pos:
 			Shop ID position
+		:param sections:
+			Shop sections from _find_shop_sections
 		:return:
 			Dictionary with shop data
 		"""
@@ -729,17 +625,6 @@ class SaveDataParser(ISaveDataParser):
 			'spells': []
 		}
 
-		sections = {}
-		for marker, key in [
-			(b'.garrison', 'garrison'),
-			(b'.items', 'items'),
-			(b'.shopunits', 'units'),
-			(b'.spells', 'spells')
-		]:
-			pos = self._find_preceding_section(data, marker, shop_pos, 5000)
-			if pos and self._section_belongs_to_shop(data, pos, shop_pos):
-				sections[key] = {'marker': marker, 'pos': pos}
-
 		sorted_sections = sorted(sections.items(), key=lambda x: x[1]['pos'])
 
 		for i, (key, section_info) in enumerate(sorted_sections):
@@ -751,26 +636,26 @@ class SaveDataParser(ISaveDataParser):
 			else:
 				next_boundary = shop_pos
 
-			actual_end = self._find_section_end(data, section_pos, next_boundary)
+			actual_end = self._find_section_end(index, section_pos, next_boundary)
 
 			if marker == b'.garrison':
 				if i + 1 < len(sorted_sections):
 					next_section_pos = sorted_sections[i + 1][1]['pos']
 					result['garrison'] = self._parse_slash_separated(
-						data,
+						scanner,
 						section_pos,
 						next_section_pos
 					)
 			elif marker == b'.items':
-				result['items'] = self._parse_items_section(data, section_pos, actual_end)
+				result['items'] = self._parse_items_section(scanner, section_pos, actual_end)
 			elif marker == b'.shopunits':
-				result['units'] = self._parse_slash_separated(data, section_pos, actual_end)
+				result['units'] = self._parse_slash_separated(scanner, section_pos, actual_end)
 			elif marker == b'.spells':
-				result['spells'] = self._parse_spells_section(data, section_pos, actual_end)
+				result['spells'] = self._parse_spells_section(scanner, section_pos, actual_end)
 
 		return result
 
-	def _find_hero_inventory_items_section(self, data: bytes) -> Optional[int]:
+	def _find_hero_inventory_items_section(self, data: bytes, index: SaveSectionIndex) -> Optional[int]:
 		"""
 		Find .items section containing hero inventory
 
@@ -779,6 +664,8 @@ class SaveDataParser(ISaveDataParser):
 
 		:param data:
 			Decompressed save data
+		:param index:
+			Section index of save data
 		:return:
 			Position of .items section or None
 		"""
@@ -789,9 +676,9 @@ class SaveDataParser(ISaveDataParser):
 				break
 
 			search_end = min(len(data), hero_pos + 5000)
-			items_pos = data.find(b'.items', hero_pos, search_end)
+			items_pos = index.find_next(index.ITEMS, hero_pos, search_end)
 
-			if items_pos != -1:
+			if items_pos is not None:
 				return items_pos
 
 			pos = hero_pos + 1
@@ -822,14 +709,19 @@ class SaveDataParser(ISaveDataParser):
 			if kb_id in self.METADATA_KEYWORDS:
 				continue
 
-			if not self._item_repository.is_item_exists(kb_id):
+			if not self._kb_id_index.contains(Item, kb_id):
 				continue
 
 			hero_items.append(GameObjectData(kb_id=kb_id, quantity=quantity))
 
 		return hero_items
 
-	def _parse_hero_inventory(self, data: bytes) -> list[GameObjectData]:
+	def _parse_hero_inventory(
+		self,
+		data: bytes,
+		scanner: SaveRecordScanner,
+		index: SaveSectionIndex
+	) -> list[GameObjectData]:
 		"""
 		Parse hero inventory from save data
 
@@ -838,16 +730,20 @@ class SaveDataParser(ISaveDataParser):
 
 		:param data:
 			Decompressed save data
+		:param scanner:
+			Save record scanner
+		:param index:
+			Section index of save data
 		:return:
 			List of GameObjectData with kb_id and quantity
 		"""
-		items_pos = self._find_hero_inventory_items_section(data)
+		items_pos = self._find_hero_inventory_items_section(data, index)
 		if not items_pos:
 			return []
 
-		section_end = self._find_section_end(data, items_pos, items_pos + 200000)
+		section_end = self._find_section_end(index, items_pos, items_pos + 200000)
 
-		all_items = self._parse_items_section(data, items_pos, section_end)
+		all_items = self._parse_items_section(scanner, items_pos, section_end)
 
 		return self._filter_hero_items(all_items)
 
@@ -862,4 +758,4 @@ class SaveDataParser(ISaveDataParser):
 		"""
 		if not item_id or item_id in self.METADATA_KEYWORDS or len(item_id) < 3:
 			return False
-		return bool(re.match(r'^[a-z][a-z0-9_]*$', item_id))
+		return self.ID_PATTERN.fullmatch(item_id) is not None
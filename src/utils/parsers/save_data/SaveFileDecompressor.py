@@ -1,10 +1,10 @@
+import contextlib
+import io
 import typing
 from pathlib import Path
 import struct
 import zlib
 import zipfile
-import tempfile
-import shutil
 
 from src.utils.parsers.save_data.DataFileType import DataFileType
 from src.utils.parsers.save_data.ISaveFileDecompressor import ISaveFileDecompressor
@@ -14,6 +14,11 @@ class SaveFileDecompressor(ISaveFileDecompressor):
 
 	MAGIC_HEADER: bytes = b'slcb'
 	HEADER_SIZE: int = 12
+	HEADER: struct.Struct = struct.Struct('<4sII')
+
+	MAX_ARCHIVE_SIZE: int = 10 * 1024 * 1024
+	MAX_DECOMPRESSED_SIZE: int = 100 * 1024 * 1024
+	READ_CHUNK_SIZE: int = 64 * 1024
 
 	_DATA_FILE_NAMES = ("data", "savedata")
 	_INFO_FILE_NAMES = ("info", "saveinfo")
@@ -31,6 +36,10 @@ class SaveFileDecompressor(ISaveFileDecompressor):
 		Info file format (NOT compressed):
 		- Raw binary data (no compression)
 
+		The file is streamed straight from the save directory or the .sav
+		archive member; nothing is extracted to disk. Data files are
+		decompressed into a buffer preallocated from the header size.
+
 		:param save_path:
 			Path to save
 		:param data_type:
@@ -38,7 +47,7 @@ class SaveFileDecompressor(ISaveFileDecompressor):
 		:return:
 			Decompressed/extracted binary data
 		:raises ValueError:
-			If magic header invalid or size mismatch
+			If magic header invalid, declared size too large or size mismatch
 		:raises FileNotFoundError:
 			If save file doesn't exist
 		"""
@@ -46,34 +55,126 @@ class SaveFileDecompressor(ISaveFileDecompressor):
 			names = self._INFO_FILE_NAMES[:]
 		else:
 			names = self._DATA_FILE_NAMES[:]
-		data = self._extract_data_file(save_path, names)
 
-		# Info files are not compressed, return raw data
-		if data_type == DataFileType.INFO:
-			return data
+		with self._open_data_file(save_path, names) as stream:
+			# Info files are not compressed, return raw data
+			if data_type == DataFileType.INFO:
+				return stream.read()
+
+			# Data files are compressed with slcb format
+			return self._decompress_stream(stream)
+
+	def _decompress_stream(self, stream: typing.BinaryIO) -> bytes:
+		"""
+		Decompress slcb stream into a buffer sized from its header
+
+		:param stream:
+			Binary stream positioned at the slcb header
+		:return:
+			Decompressed binary data
+		:raises ValueError:
+			If magic header invalid, declared size too large, stream truncated or size mismatch
+		"""
+		header = stream.read(self.HEADER_SIZE)
+		self._validate_magic_header(header[0:4])
+		if len(header) < self.HEADER_SIZE:
+			raise ValueError(f"Invalid save file format. Truncated header: {len(header)} bytes")
 
-		# Data files are compressed with slcb format
-		magic = data[0:4]
-		self._validate_magic_header(magic)
+		_, decompressed_size, compressed_size = self.HEADER.unpack(header)
+		if decompressed_size > self.MAX_DECOMPRESSED_SIZE:
+			raise ValueError(
+				f"Decompressed data too large: {decompressed_size} bytes (max {self.MAX_DECOMPRESSED_SIZE})"
+			)
+
+		output = self._preallocate(decompressed_size)
+		decompressor = zlib.decompressobj()
+		written = 0
+		remaining = compressed_size
+
+		while remaining > 0 and not decompressor.eof:
+			chunk = stream.read(min(self.READ_CHUNK_SIZE, remaining))
+			if not chunk:
+				break
+			remaining -= len(chunk)
+
+			# Bound each step, save padding compresses far better than 1:READ_CHUNK_SIZE
+			while chunk and not decompressor.eof:
+				written = self._write_chunk(
+					output, written, decompressor.decompress(chunk, self.READ_CHUNK_SIZE), decompressed_size
+				)
+				chunk = decompressor.unconsumed_tail
 
-		decompressed_size = struct.unpack('<I', data[4:8])[0]
-		compressed_size = struct.unpack('<I', data[8:12])[0]
+		written = self._write_chunk(output, written, decompressor.flush(), decompressed_size)
 
-		compressed_data = data[12:12 + compressed_size]
-		decompressed_data = zlib.decompress(compressed_data)
+		if not decompressor.eof:
+			raise ValueError("Invalid save file format. Compressed data is truncated")
 
-		self._validate_decompressed_size(decompressed_data, decompressed_size)
+		self._validate_decompressed_size(written, decompressed_size)
 
-		return decompressed_data
+		# The buffer is filled exactly, so getvalue() hands it out without a copy
+		return output.getvalue()
 
-	def _extract_data_file(self, save_path: Path, file_names: typing.Iterable[str]) -> bytes:
+	@staticmethod
+	def _preallocate(size: int) -> io.BytesIO:
+		"""
+		Create output buffer of given size, positioned at its start
+
+		Unlike a bytearray, the filled buffer is returned as immutable bytes
+		without doubling the peak memory.
+
+		:param size:
+			Buffer size
+		:return:
+			Output buffer
 		"""
-		Extract 'data' file from save (directory or .sav archive)
+		output = io.BytesIO()
+		if size > 0:
+			output.seek(size - 1)
+			output.write(b'\x00')
+			output.seek(0)
+		return output
+
+	@staticmethod
+	def _write_chunk(output: io.BytesIO, written: int, chunk: bytes, size: int) -> int:
+		"""
+		Copy decompressed chunk into preallocated output buffer
+
+		:param output:
+			Output buffer
+		:param written:
+			Number of bytes already written
+		:param chunk:
+			Decompressed chunk
+		:param size:
+			Output size declared in the header
+		:return:
+			Number of bytes written after this chunk
+		:raises ValueError:
+			If chunk overflows the size declared in the header
+		"""
+		end = written + len(chunk)
+		if end > size:
+			raise ValueError(
+				f"Size mismatch after decompression. "
+				f"Expected {size}, got more than {size}"
+			)
+		output.write(chunk)
+		return end
+
+	def _open_data_file(
+		self,
+		save_path: Path,
+		file_names: typing.Iterable[str]
+	) -> typing.ContextManager[typing.BinaryIO]:
+		"""
+		Open 'data' file of save (directory or .sav archive) for reading
 
 		:param save_path:
 			Path to save (directory or .sav file)
+		:param file_names:
+			Candidate file names, first existing one is opened
 		:return:
-			Raw bytes of 'data' file
+			Context manager yielding binary stream of 'data' file
 		:raises FileNotFoundError:
 			If save path or 'data' file doesn't exist
 		:raises ValueError:
@@ -83,19 +184,19 @@ class SaveFileDecompressor(ISaveFileDecompressor):
 			raise FileNotFoundError(f"Save path not found: {save_path}")
 
 		if save_path.suffix == '.sav':
-			return self._extract_from_archive(save_path, file_names)
+			return self._open_from_archive(save_path, file_names)
 		else:
-			return self._extract_from_directory(save_path, file_names)
+			return self._open_from_directory(save_path, file_names)
 
 	@staticmethod
-	def _extract_from_directory(save_dir: Path, file_names: typing.Iterable[str]) -> bytes:
+	def _open_from_directory(save_dir: Path, file_names: typing.Iterable[str]) -> typing.BinaryIO:
 		"""
-		Extract 'data' file from save directory
+		Open 'data' file from save directory
 
 		:param save_dir:
 			Path to directory containing 'data' file
 		:return:
-			Raw bytes of 'data' file
+			Binary stream of 'data' file
 		:raises FileNotFoundError:
 			If 'data' file doesn't exist
 		"""
@@ -103,52 +204,47 @@ class SaveFileDecompressor(ISaveFileDecompressor):
 		for data_file in data_files:
 			if not data_file.exists():
 				continue
-			with open(data_file, 'rb') as f:
-				return f.read()
+			return open(data_file, 'rb')
 		raise FileNotFoundError(f"Data file not found in save directory: {save_dir}")
 
-	@staticmethod
-	def _extract_from_archive(archive_path: Path, file_names: typing.Iterable[str]) -> bytes:
+	@classmethod
+	@contextlib.contextmanager
+	def _open_from_archive(
+		cls,
+		archive_path: Path,
+		file_names: typing.Iterable[str]
+	) -> typing.Iterator[typing.BinaryIO]:
 		"""
-		Extract 'data' file from .sav ZIP archive
+		Open 'data' member of .sav ZIP archive without extracting it
 
 		:param archive_path:
 			Path to .sav archive file
 		:return:
-			Raw bytes of 'data' file
+			Binary stream of 'data' member
 		:raises FileNotFoundError:
 			If 'data' file not found in archive
 		:raises ValueError:
 			If archive is invalid or too large
 		"""
-		temp_dir = None
 		try:
-			if not zipfile.is_zipfile(archive_path):
-				raise ValueError(f"Invalid ZIP archive: {archive_path}")
-
-			temp_dir = tempfile.mkdtemp(prefix='kbsave_')
-			temp_path = Path(temp_dir)
-
-			with zipfile.ZipFile(archive_path, 'r') as zip_file:
-				total_size = sum(info.file_size for info in zip_file.infolist())
-				max_size = 10 * 1024 * 1024
-
-				if total_size > max_size:
-					raise ValueError(f"Archive too large: {total_size} bytes (max {max_size})")
-
-				zip_file.extractall(temp_path)
-
-			data_files = [temp_path / n for n in file_names]
-			for data_file in data_files:
-				if not data_file.exists():
+			zip_file = zipfile.ZipFile(archive_path, 'r')
+		except zipfile.BadZipFile:
+			raise ValueError(f"Invalid ZIP archive: {archive_path}")
+
+		with zip_file:
+			total_size = sum(info.file_size for info in zip_file.infolist())
+			if total_size > cls.MAX_ARCHIVE_SIZE:
+				raise ValueError(f"Archive too large: {total_size} bytes (max {cls.MAX_ARCHIVE_SIZE})")
+
+			members = set(zip_file.namelist())
+			for name in file_names:
+				if name not in members:
 					continue
-				with open(data_file, 'rb') as f:
-					return f.read()
-			raise FileNotFoundError(f"'data' file not found in archive: {archive_path}")
+				with zip_file.open(name) as stream:
+					yield stream
+				return
 
-		finally:
-			if temp_dir and Path(temp_dir).exists():
-				shutil.rmtree(temp_dir, ignore_errors=True)
+			raise FileNotFoundError(f"'data' file not found in archive: {archive_path}")
 
 	@staticmethod
 	def _validate_file_exists(save_path: Path) -> None:
@@ -180,19 +276,19 @@ class SaveFileDecompressor(ISaveFileDecompressor):
 			)
 
 	@staticmethod
-	def _validate_decompressed_size(data: bytes, expected_size: int) -> None:
+	def _validate_decompressed_size(actual_size: int, expected_size: int) -> None:
 		"""
 		Validate decompressed data size
 
-		:param data:
-			Decompressed data
+		:param actual_size:
+			Number of decompressed bytes
 		:param expected_size:
 			Expected size from header
 		:raises ValueError:
 			If size mismatch
 		"""
-		if len(data) != expected_size:
+		if actual_size != expected_size:
 			raise ValueError(
 				f"Size mismatch after decompression. "
-				f"Expected {expected_size}, got {len(data)}"
+				f"Expected {expected_size}, got {actual_size}"
 			)
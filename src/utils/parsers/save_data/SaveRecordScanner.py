@@ -0,0 +1,183 @@
+import re
+import struct
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional
+
+
+@dataclass
+class SaveRecord:
+	key: str
+	pos: int
+	end: int
+	value: Optional[int] = None
+
+
+class SaveRecordScanner:
+	"""
+	Heuristic scanner for length-prefixed keys in decompressed save data
+
+	Records start with [length: uint32][key: ASCII], but item payloads hold
+	a variable run of metadata fields (count, id, slruck, ...) with no
+	record length or field count, and nested keyed fields look like items
+	(see "Metadata Keywords Filtered" in docs/save-extractor/README.md).
+	Nothing tells where one record ends, so sections cannot be read
+	record by record from their start.
+
+	Keys are therefore searched for: any 'length 0 0 0 identifier' byte
+	sequence is a candidate, and callers reject false positives with key
+	and value validators. Named payload fields are found the same way, by
+	searching for their name.
+	"""
+
+	U32: struct.Struct = struct.Struct('<I')
+
+	MIN_KEY_LENGTH: int = 3
+	MAX_KEY_LENGTH: int = 100
+
+	# uint32 length in [MIN_KEY_LENGTH, MAX_KEY_LENGTH] followed by an identifier
+	_KEY_PATTERN: re.Pattern = re.compile(
+		rb'([\x03-\x64])\x00\x00\x00([a-z][a-z0-9_]{0,%d})' % (MAX_KEY_LENGTH - 1)
+	)
+
+	# Records must start at least this many bytes before the end of a section
+	_RECORD_TAIL: int = 20
+
+	def __init__(self, data: bytes):
+		"""
+		Initialize record scanner
+
+		:param data:
+			Decompressed save file data
+		"""
+		self._data = data
+		self._view = memoryview(data)
+
+	def read_u32(self, pos: int) -> Optional[int]:
+		"""
+		Read little-endian uint32
+
+		:param pos:
+			Position of value
+		:return:
+			Value or None if out of bounds
+		"""
+		if pos < 0 or pos + self.U32.size > len(self._data):
+			return None
+		return self.U32.unpack_from(self._data, pos)[0]
+
+	def read_ascii(self, pos: int, length: int) -> Optional[str]:
+		"""
+		Decode ASCII string
+
+		:param pos:
+			Position of string
+		:param length:
+			String length in bytes
+		:return:
+			Decoded string or None if out of bounds or not ASCII
+		"""
+		if pos < 0 or pos + length > len(self._data):
+			return None
+		try:
+			return str(self._view[pos:pos + length], 'ascii')
+		except UnicodeDecodeError:
+			return None
+
+	def read_string(self, pos: int, min_length: int, max_length: int) -> Optional[str]:
+		"""
+		Read length-prefixed ASCII string
+
+		:param pos:
+			Position of uint32 length
+		:param min_length:
+			Minimum accepted length
+		:param max_length:
+			Maximum accepted length
+		:return:
+			Decoded string or None if length is out of range or string is invalid
+		"""
+		length = self.read_u32(pos)
+		if length is None or not min_length <= length <= max_length:
+			return None
+		return self.read_ascii(pos + self.U32.size, length)
+
+	def find_field(self, name: bytes, start: int, end: int) -> Optional[int]:
+		"""
+		Find first payload field lying entirely within [start, end)
+
+		:param name:
+			Field name (e.g. b'strg', b'slruck')
+		:param start:
+			Inclusive start of search range
+		:param end:
+			Exclusive end of search range
+		:return:
+			Position right after field name (its value length) or None if not found
+		"""
+		pos = self._data.find(name, start, end)
+		if pos == -1:
+			return None
+		return pos + len(name)
+
+	def scan_records(
+		self,
+		start: int,
+		end: int,
+		is_valid_key: Callable[[str], bool],
+		value: Optional[struct.Struct] = None,
+		is_valid_value: Optional[Callable[[int], bool]] = None
+	) -> Iterator[SaveRecord]:
+		"""
+		Lazily scan a section for records
+
+		Candidates are located with a compiled pattern instead of probing
+		struct.unpack at every byte offset. A candidate is accepted when its key passes is_valid_key and, if value
+		is given, the fixed-size value right after the key passes
+		is_valid_value. Iteration resumes after an accepted record, or one
+		byte after a rejected candidate.
+
+		:param start:
+			Section payload start
+		:param end:
+			Section end; records must start before end - 20
+		:param is_valid_key:
+			Key validator
+		:param value:
+			Struct of a fixed-size value following the key
+		:param is_valid_value:
+			Value validator
+		:return:
+			Iterator of accepted records
+		"""
+		data = self._data
+		limit = end - self._RECORD_TAIL
+		search_end = min(len(data), limit + self.U32.size + self.MAX_KEY_LENGTH)
+		pos = start
+
+		while pos < limit:
+			match = self._KEY_PATTERN.search(data, pos, search_end)
+			if match is None or match.start() >= limit:
+				return
+
+			pos = match.start()
+			key_length = match.group(1)[0]
+			key = match.group(2)
+
+			if len(key) >= key_length:
+				key = key[:key_length].decode('ascii')
+				key_end = pos + self.U32.size + key_length
+
+				if is_valid_key(key):
+					if value is None:
+						yield SaveRecord(key=key, pos=pos, end=key_end)
+						pos = key_end
+						continue
+
+					if key_end + value.size <= len(data):
+						record_value = value.unpack_from(data, key_end)[0]
+						if is_valid_value is None or is_valid_value(record_value):
+							yield SaveRecord(key=key, pos=pos, end=key_end + value.size, value=record_value)
+							pos = key_end + value.size
+							continue
+
+			pos += 1
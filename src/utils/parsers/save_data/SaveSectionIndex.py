@@ -0,0 +1,150 @@
+import bisect
+import re
+from typing import Optional
+
+
+class SaveSectionIndex:
+	"""
+	Offsets of every structural marker in a decompressed save
+
+	Built with a single pass over the buffer. Answers "nearest marker
+	before/after position X" queries with bisect instead of slicing and
+	re-scanning the buffer for every shop.
+	"""
+
+	ITEMS: bytes = b'.items'
+	SPELLS: bytes = b'.spells'
+	SHOPUNITS: bytes = b'.shopunits'
+	GARRISON: bytes = b'.garrison'
+	TEMP: bytes = b'.temp'
+	ACTORS: bytes = b'.actors'
+	ITEXT: bytes = b'itext_'
+	BUILDING_TRADER: bytes = b'building_trader@'
+	LT: bytes = b'lt'
+	SHOP_ITEXT: bytes = 'itext_'.encode('utf-16-le')
+
+	MARKERS: tuple[bytes, ...] = (
+		ITEMS, SPELLS, SHOPUNITS, GARRISON, TEMP, ACTORS,
+		ITEXT, BUILDING_TRADER, LT, SHOP_ITEXT
+	)
+
+	# None of the markers can overlap each other, so one alternation
+	# finds every occurrence of every marker
+	_MARKERS_PATTERN: re.Pattern = re.compile(b'|'.join(re.escape(m) for m in MARKERS))
+
+	# Shortest UTF-16-LE tail completing "itext_" into "itext_{location}_{digit}"
+	_SHOP_ITEXT_TAIL_PATTERN: re.Pattern = re.compile(rb'(?:[-\w]\x00)+?_\x00\d\x00')
+
+	def __init__(self, data: bytes):
+		"""
+		Index all markers of decompressed save data
+
+		:param data:
+			Decompressed save file data
+		"""
+		self._positions: dict[bytes, list[int]] = {marker: [] for marker in self.MARKERS}
+
+		for match in self._MARKERS_PATTERN.finditer(data):
+			self._positions[match.group()].append(match.start())
+
+		self._shop_itext_ends: list[Optional[int]] = [
+			self._shop_itext_end(data, pos) for pos in self._positions[self.SHOP_ITEXT]
+		]
+
+	def positions(self, marker: bytes) -> list[int]:
+		"""
+		Get all positions of marker in ascending order
+
+		:param marker:
+			One of MARKERS
+		:return:
+			Sorted marker positions
+		"""
+		return self._positions[marker]
+
+	def find_preceding(self, marker: bytes, end: int, max_distance: int) -> Optional[int]:
+		"""
+		Find last marker lying entirely within [end - max_distance, end)
+
+		:param marker:
+			One of MARKERS
+		:param end:
+			Exclusive end of search range
+		:param max_distance:
+			Maximum distance to search backwards
+		:return:
+			Marker position or None if not found
+		"""
+		positions = self._positions[marker]
+		i = bisect.bisect_right(positions, end - len(marker)) - 1
+		if i >= 0 and positions[i] >= max(0, end - max_distance):
+			return positions[i]
+		return None
+
+	def find_next(self, marker: bytes, start: int, end: int) -> Optional[int]:
+		"""
+		Find first marker lying entirely within [start, end)
+
+		:param marker:
+			One of MARKERS
+		:param start:
+			Inclusive start of search range
+		:param end:
+			Exclusive end of search range
+		:return:
+			Marker position or None if not found
+		"""
+		positions = self._positions[marker]
+		i = bisect.bisect_left(positions, start)
+		if i < len(positions) and positions[i] + len(marker) <= end:
+			return positions[i]
+		return None
+
+	def contains(self, marker: bytes, start: int, end: int) -> bool:
+		"""
+		Check whether marker lies entirely within [start, end)
+
+		:param marker:
+			One of MARKERS
+		:param start:
+			Inclusive start of range
+		:param end:
+			Exclusive end of range
+		:return:
+			True if marker found
+		"""
+		return self.find_next(marker, start, end) is not None
+
+	def contains_shop_itext(self, start: int, end: int) -> bool:
+		"""
+		Check whether a complete UTF-16-LE itext_{location}_{id} lies within [start, end)
+
+		:param start:
+			Inclusive start of range
+		:param end:
+			Exclusive end of range
+		:return:
+			True if shop ID found
+		"""
+		positions = self._positions[self.SHOP_ITEXT]
+		i = bisect.bisect_left(positions, start)
+		while i < len(positions) and positions[i] < end:
+			shop_end = self._shop_itext_ends[i]
+			if shop_end is not None and shop_end <= end:
+				return True
+			i += 1
+		return False
+
+	def _shop_itext_end(self, data: bytes, pos: int) -> Optional[int]:
+		"""
+		Get end of the shortest itext_{location}_{digit} match at position
+
+		:param data:
+			Decompressed save file data
+		:param pos:
+			Position of UTF-16-LE itext_ marker
+		:return:
+			End position or None if marker is not followed by a shop ID
+		"""
+		match = self._SHOP_ITEXT_TAIL_PATTERN.match(data, pos + len(self.SHOP_ITEXT))
+		return match.end() if match else None
@@ -9,7 +9,7 @@ from src.domain.exceptions import InvalidKbIdException
 from src.domain.game.interfaces.IProfileRepository import IProfileRepository
 from src.domain.game.interfaces.IProfileService import IProfileService
 from src.domain.game.interfaces.ISaveFileService import ISaveFileService
-from src.web.dependencies.game_context import get_game_context, GameContext
+from src.web.dependencies.game_context import get_scoped_game_context, GameContext
 
 router = APIRouter(prefix="/api", tags=["api"])
 
@@ -57,7 +57,7 @@ async def rename_game(
 @inject
 async def list_save_directories(
 	game_id: int,
-	game_context: GameContext = Depends(get_game_context),
+	game_context: GameContext = Depends(get_scoped_game_context),
 	save_file_service: ISaveFileService = Depends(Provide["save_file_service"]),
 	game_service: IGameService = Depends(Provide["game_service"])
 ):
@@ -93,7 +93,7 @@ async def list_save_directories(
 async def scan_hero(
 	game_id: int,
 	request_data: dict,
-	game_context: GameContext = Depends(get_game_context),
+	game_context: GameContext = Depends(get_scoped_game_context),
 	save_file_service: ISaveFileService = Depends(Provide["save_file_service"]),
 	game_service: IGameService = Depends(Provide["game_service"])
 ):
@@ -139,7 +139,7 @@ async def scan_hero(
 async def scan_shops(
 	game_id: int,
 	profile_id: int,
-	game_context: GameContext = Depends(get_game_context),
+	game_context: GameContext = Depends(get_scoped_game_context),
 	profile_service: IProfileService = Depends(Provide["profile_service"])
 ):
 	"""
@@ -212,7 +212,7 @@ async def update_profile_auto_scan(
 	game_id: int,
 	profile_id: int,
 	is_enabled: bool,
-	game_context: GameContext = Depends(get_game_context),
+	game_context: GameContext = Depends(get_scoped_game_context),
 	profile_repository: IProfileRepository = Depends(Provide["profile_repository"])
 ) -> JSONResponse:
 	"""
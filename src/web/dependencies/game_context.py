@@ -1,18 +1,98 @@
+import logging
+from contextlib import contextmanager
+from typing import Iterator
+
 from fastapi import Depends, Path
 from dependency_injector.wiring import Provide, inject
+from sqlalchemy.orm import Session
 
 from src.core.Container import Container
 from src.domain.app.interfaces.ISchemaManagementService import ISchemaManagementService
+from src.utils.db import get_game_database_registry
+
+logger = logging.getLogger(__name__)
 
 
 class GameContext:
 	"""
 	Game context containing game ID and schema name
+
+	Inside ``session_scope`` all repository calls share one database
+	session, inside ``transaction`` they also share one transaction.
 	"""
 
 	def __init__(self, game_id: int, schema_name: str):
 		self.game_id = game_id
 		self.schema_name = schema_name
+		self.session: Session | None = None
+		self.in_transaction: bool = False
+		self.sessions_opened: int = 0
+
+	def open_session(self) -> Session:
+		"""
+		Open a new session on the game database
+
+		:return:
+			Database session, counted in sessions_opened
+		"""
+		self.sessions_opened += 1
+		return get_game_database_registry().get_session_factory(self.schema_name)()
+
+	@contextmanager
+	def session_scope(self) -> Iterator[Session]:
+		"""
+		Share one session among all repository calls made within the block
+
+		Repositories still commit their own writes; the shared session only
+		saves opening a session (and checking out a connection) per call.
+		Nested scopes reuse the outer session.
+
+		:return:
+			Shared database session
+		"""
+		if self.session is not None:
+			yield self.session
+			return
+
+		self.session = self.open_session()
+		try:
+			yield self.session
+		finally:
+			self.session.close()
+			self.session = None
+			logger.debug(f"{self.schema_name}: {self.sessions_opened} database sessions opened")
+
+	@contextmanager
+	def transaction(self) -> Iterator[Session]:
+		"""
+		Share one session and one transaction among all repository calls made within the block
+
+		The session joins a transaction of its own connection: commits of
+		repositories only flush their writes, which are committed when the
+		block exits. Any rollback, or an error leaving the block, rolls
+		back everything written within it. Nested blocks join the outer
+		transaction; an enclosing session scope is resumed afterwards.
+
+		:return:
+			Transactional database session
+		"""
+		if self.in_transaction:
+			yield self.session
+			return
+
+		session_factory = get_game_database_registry().get_session_factory(self.schema_name)
+		scope_session = self.session
+		self.sessions_opened += 1
+
+		with session_factory.kw["bind"].connect() as connection, connection.begin():
+			self.session = session_factory(bind=connection, join_transaction_mode="rollback_only")
+			self.in_transaction = True
+			try:
+				yield self.session
+			finally:
+				self.session.close()
+				self.session = scope_session
+				self.in_transaction = False
 
 
 @inject
@@ -32,3 +112,16 @@ def get_game_context(
 	"""
 	schema_name = schema_mgmt.get_schema_name(game_id)
 	return GameContext(game_id, schema_name)
+
+
+def get_scoped_game_context(game_context: GameContext = Depends(get_game_context)) -> Iterator[GameContext]:
+	"""
+	Game context whose repository calls share one session for the whole request
+
+	:param game_context:
+		Game context of the request
+	:return:
+		Game context with an open session scope
+	"""
+	with game_context.session_scope():
+		yield game_context
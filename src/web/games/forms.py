@@ -40,6 +40,7 @@ class ScanForm(BaseModel):
 
 class SpellFilterForm(BaseModel):
 	profile_id: OptionalInt = None
+	query: str = ""
 	school: str = ""
 	profit: OptionalInt = None
 	sort_by: str = "name"
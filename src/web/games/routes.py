@@ -28,7 +28,7 @@ from src.domain.game.events.ScanProgressEvent import ScanProgressEvent
 from src.domain.base.repositories.CrudRepository import GAME_CONTEXT
 from src.domain.game.services.ItemService import ItemService
 from src.domain.game.services.ScannerService import ScannerService
-from src.web.dependencies.game_context import get_game_context, GameContext
+from src.web.dependencies.game_context import get_game_context, get_scoped_game_context, GameContext
 from src.web.games.forms import GameCreateForm, ScanForm, SpellFilterForm, UnitFilterForm
 from src.web.template_filters import register_filters
 
@@ -438,11 +438,13 @@ async def scan_game_files_stream(
 
 				game_service.prepare_rescan(game_id)
 
-			# Proceed with normal scan
-			for event in scanner_service.scan_game_files_stream(game_id, language):
-				# Format as SSE: "data: {json}\n\n"
-				event_data = json.dumps(event.to_dict())
-				yield f"data: {event_data}\n\n"
+			# Proceed with normal scan, sharing one session (opened after
+			# the rescan preparation replaced the game database)
+			with game_context.session_scope():
+				for event in scanner_service.scan_game_files_stream(game_id, language):
+					# Format as SSE: "data: {json}\n\n"
+					event_data = json.dumps(event.to_dict())
+					yield f"data: {event_data}\n\n"
 
 		except DuplicateEntityException as e:
 			error_event = ScanProgressEvent(
@@ -499,7 +501,7 @@ async def list_items(
 	sort_by: str = Query(default="name"),
 	sort_order: str = Query(default="asc"),
 	profile_id: int | None = Query(default=None),
-	game_context: GameContext = Depends(get_game_context),
+	game_context: GameContext = Depends(get_scoped_game_context),
 	item_tracking_service: ItemService = Depends(Provide["item_service"]),
 	game_service: IGameService = Depends(Provide["game_service"]),
 	profile_repository: IProfileRepository = Depends(Provide["profile_repository"]),
@@ -630,7 +632,7 @@ async def list_units(
 	sort_by: str = Query(default="name"),
 	sort_order: str = Query(default="asc"),
 	filters: UnitFilterForm = Depends(),
-	game_context: GameContext = Depends(get_game_context),
+	game_context: GameContext = Depends(get_scoped_game_context),
 	unit_repository: IUnitRepository = Depends(Provide["unit_repository"]),
 	game_service: IGameService = Depends(Provide["game_service"]),
 	profile_repository: IProfileRepository = Depends(Provide["profile_repository"]),
@@ -748,7 +750,7 @@ async def list_spells(
 	request: Request,
 	game_id: int,
 	filters: SpellFilterForm = Depends(),
-	game_context: GameContext = Depends(get_game_context),
+	game_context: GameContext = Depends(get_scoped_game_context),
 	spell_repository: ISpellRepository = Depends(Provide["spell_repository"]),
 	game_service: IGameService = Depends(Provide["game_service"]),
 	profile_repository: IProfileRepository = Depends(Provide["profile_repository"]),
@@ -786,6 +788,7 @@ async def list_spells(
 
 	# Fetch spells with filters
 	all_spells = spell_repository.search_with_filters(
+		name_query=filters.query.strip() or None,
 		school=selected_school,
 		profit=filters.profit,
 		sort_by=filters.sort_by,
@@ -818,7 +821,8 @@ async def list_spells(
 			"shops_by_spell": shops_by_spell,
 			"all_schools": list(SpellSchool),
 			"selected_school": selected_school,
-			"selected_profit": filters.profit
+			"selected_profit": filters.profit,
+			"query": filters.query
 		}
 	)
 
@@ -829,7 +833,7 @@ async def list_shops(
 	request: Request,
 	game_id: int,
 	profile_id: int | None = Query(default=None),
-	game_context: GameContext = Depends(get_game_context),
+	game_context: GameContext = Depends(get_scoped_game_context),
 	shop_inventory_service: IShopInventoryService = Depends(Provide["shop_inventory_service"]),
 	profile_repository: IProfileRepository = Depends(Provide["profile_repository"]),
 	game_service: IGameService = Depends(Provide["game_service"])
@@ -882,7 +886,7 @@ async def list_shops(
 @inject
 async def get_profiles_by_game(
 	game_id: int,
-	game_context: GameContext = Depends(get_game_context),
+	game_context: GameContext = Depends(get_scoped_game_context),
 	profile_service: IProfileService = Depends(Provide["profile_service"])
 ):
 	"""
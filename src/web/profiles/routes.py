@@ -5,7 +5,7 @@ from dependency_injector.wiring import inject, Provide
 from src.web.profiles.forms import ProfileCreateForm
 from src.domain.app.interfaces.IGameService import IGameService
 from src.domain.game.interfaces.IProfileService import IProfileService
-from src.web.dependencies.game_context import get_game_context, GameContext
+from src.web.dependencies.game_context import get_scoped_game_context, GameContext
 from src.domain.base.repositories.CrudRepository import GAME_CONTEXT
 from src.web.template_filters import register_filters
 
@@ -28,7 +28,7 @@ async def index():
 async def list_game_profiles(
 	request: Request,
 	game_id: int,
-	game_context: GameContext = Depends(get_game_context),
+	game_context: GameContext = Depends(get_scoped_game_context),
 	profile_service: IProfileService = Depends(Provide["profile_service"]),
 	game_service: IGameService = Depends(Provide["game_service"])
 ):
@@ -58,7 +58,7 @@ async def list_game_profiles(
 async def create_profile_form(
 	request: Request,
 	game_id: int,
-	game_context: GameContext = Depends(get_game_context),
+	game_context: GameContext = Depends(get_scoped_game_context),
 	game_service: IGameService = Depends(Provide["game_service"])
 ):
 	GAME_CONTEXT.set(game_context)
@@ -83,7 +83,7 @@ async def create_profile(
 	name: str = Form(...),
 	full_name: str = Form(None),
 	save_dir: str = Form(None),
-	game_context: GameContext = Depends(get_game_context),
+	game_context: GameContext = Depends(get_scoped_game_context),
 	profile_service: IProfileService = Depends(Provide["profile_service"]),
 	game_service: IGameService = Depends(Provide["game_service"])
 ):
@@ -108,7 +108,7 @@ async def create_profile(
 async def delete_profile(
 	game_id: int,
 	profile_id: int,
-	game_context: GameContext = Depends(get_game_context),
+	game_context: GameContext = Depends(get_scoped_game_context),
 	profile_service: IProfileService = Depends(Provide["profile_service"])
 ):
 	GAME_CONTEXT.set(game_context)
@@ -122,7 +122,7 @@ async def delete_profile(
 async def clear_profile(
 	game_id: int,
 	profile_id: int,
-	game_context: GameContext = Depends(get_game_context),
+	game_context: GameContext = Depends(get_scoped_game_context),
 	profile_service: IProfileService = Depends(Provide["profile_service"])
 ):
 	GAME_CONTEXT.set(game_context)
@@ -0,0 +1,73 @@
+import pytest
+from typing import Callable
+
+from src.core.Config import Config
+from src.domain.game.entities.Localization import Localization
+from src.utils.parsers.game_data.KFSFileSystem import KFSFileSystem
+from src.utils.parsers.game_data.KFSReader import KFSReader
+
+
+class SyntheticLocalizationRepository:
+	"""Localization repository listing a synthetic set of units"""
+
+	def __init__(self, kb_ids: list[str]):
+		self._kb_ids = kb_ids
+
+	def list_all(self, tag: str | None = None):
+		return [
+			Localization(id=i, kb_id=f'cpn_{kb_id}', text=kb_id, source='units', tag='units')
+			for i, kb_id in enumerate(self._kb_ids)
+		]
+
+
+def _write_synthetic_units(data_dir, count: int) -> list[str]:
+	"""
+	Write unit atom files, every tenth unit being a spirit
+
+	:param data_dir:
+		Extracted data directory of the game
+	:param count:
+		Number of units
+	:return:
+		Unit kb_ids
+	"""
+	session_dir = data_dir / '4-data'
+	session_dir.mkdir(parents=True, exist_ok=True)
+
+	kb_ids = []
+	for i in range(count):
+		kb_id = f'unit_{i}'
+		unit_class = 'spirit' if i % 10 == 9 else 'chesspiece'
+		content = (
+			f"// synthetic unit {i}\n"
+			f"main {{\n\tclass={unit_class}\n\tmodel={kb_id}.bma\n}}\n"
+			f"arena_params {{\n\trace=human\n\tlevel={i % 5 + 1}\n\tcost={i * 10}\n"
+			f"\tfeatures_hints=shot_header/shot_hint,armor_header/armor_hint_{i}\n"
+			f"\tattacks=moveattack,shot_{i}\n"
+			f"\tresistances {{\n\t\tphysical={i % 50}\n\t\tfire=-10\n\t}}\n}}\n"
+		)
+		(session_dir / f'{kb_id}.atom').write_text(content, encoding='utf-16-le')
+		kb_ids.append(kb_id)
+
+	return kb_ids
+
+
+@pytest.fixture
+def synthetic_unit_game(tmp_path) -> Callable[[int], tuple[KFSReader, SyntheticLocalizationRepository]]:
+	"""
+	Function-scoped factory of a game with synthetic unit files extracted to tmp_path/game_1
+
+	:param tmp_path:
+		Temporary directory used as the extraction directory
+	:return:
+		Callable taking the number of units and returning the file reader
+		and the localization repository of the game
+	"""
+	def create(count: int) -> tuple[KFSReader, SyntheticLocalizationRepository]:
+		config = Config()
+		config.tmp_dir = str(tmp_path)
+		kb_ids = _write_synthetic_units(tmp_path / 'game_1' / 'data', count)
+		reader = KFSReader(config=config, file_system=KFSFileSystem(config=config))
+		return reader, SyntheticLocalizationRepository(kb_ids)
+
+	return create
@@ -0,0 +1,85 @@
+import pytest
+from unittest.mock import Mock
+
+from src.domain.base.repositories.CrudRepository import GAME_CONTEXT
+from src.domain.game.entities.AtomMap import AtomMap
+from src.domain.game.entities.Localization import Localization
+from src.domain.game.entities.ShopProduct import ShopProduct
+from src.domain.game.entities.ShopProductType import ShopProductType
+from src.domain.game.entities.ShopType import ShopType
+from src.domain.game.factories.ShopFactory import ShopFactory
+from src.domain.game.services.LocalizationCache import LocalizationCache
+from src.web.dependencies.game_context import GameContext
+
+
+class TestShopFactory:
+
+	@pytest.fixture
+	def localization_repository(self):
+		repository = Mock()
+		repository.get_by_kb_ids.side_effect = lambda kb_ids: {
+			kb_id: Localization(id=1, kb_id=kb_id, text=kb_id.upper(), source='test', tag='test')
+			for kb_id in kb_ids
+			if kb_id != 'm_unnamed'
+		}
+		return repository
+
+	@pytest.fixture
+	def game_context(self):
+		token = GAME_CONTEXT.set(GameContext(game_id=1, schema_name="game_1"))
+		yield
+		GAME_CONTEXT.reset(token)
+
+	@pytest.fixture
+	def localization_cache(self, localization_repository):
+		return LocalizationCache(localization_repository=localization_repository)
+
+	def create_factory(self, localization_cache, locations: list[str]) -> ShopFactory:
+		atom_map_repository = Mock()
+		atom_map_repository.get_by_ids.side_effect = lambda ids: {
+			i: AtomMap(id=i, kb_id=f"shop_{i}", loc=None) for i in ids
+		}
+		empty_repository = Mock()
+		empty_repository.get_by_ids.return_value = {}
+
+		products = [
+			ShopProduct(
+				product_id=1,
+				product_type=ShopProductType.ITEM,
+				count=1,
+				shop_id=i,
+				shop_type=ShopType.ATOM,
+				location=location,
+				profile_id=1
+			)
+			for i, location in enumerate(locations)
+		]
+
+		return ShopFactory(
+			products,
+			atom_map_repository=atom_map_repository,
+			actor_repository=empty_repository,
+			localization_cache=localization_cache,
+			item_repository=empty_repository,
+			spell_repository=empty_repository,
+			unit_repository=empty_repository
+		)
+
+	def test_location_names_are_fetched_in_one_query(self, localization_cache, localization_repository, game_context):
+		"""Test that distinct locations are resolved with one bulk lookup"""
+		factory = self.create_factory(localization_cache, ['m_zcom', 'm_zcom', 'm_unnamed', 'm_zcom'])
+
+		shops = factory.produce()
+
+		assert [shop.location_name for shop in shops] == ['M_ZCOM', 'M_ZCOM', 'm_unnamed', 'M_ZCOM']
+		localization_repository.get_by_kb_ids.assert_called_once_with({'m_zcom', 'm_unnamed'})
+
+	def test_location_names_are_shared_between_factories(self, localization_cache, localization_repository, game_context):
+		"""Test that shop lists built for one game reuse resolved names"""
+		self.create_factory(localization_cache, ['m_zcom', 'm_unnamed']).produce()
+		self.create_factory(localization_cache, ['m_zcom', 'm_portland']).produce()
+
+		assert [c.args[0] for c in localization_repository.get_by_kb_ids.call_args_list] == [
+			{'m_zcom', 'm_unnamed'},
+			{'m_portland'}
+		]
@@ -0,0 +1,29 @@
+import pytest
+from sqlalchemy.orm import Session, sessionmaker
+
+import src.utils.db
+from src.utils.db import GameDatabaseRegistry
+
+
+@pytest.fixture
+def game_session_factory(tmp_path, monkeypatch) -> sessionmaker[Session]:
+	"""
+	Function-scoped session factory of a game database in tmp_path
+
+	The registry is also installed as the process-wide one, so repositories
+	sharing the session of GAME_CONTEXT open the same database. The database
+	is dropped after the test.
+
+	:param tmp_path:
+		Data directory of the game database
+	:param monkeypatch:
+		Pytest monkeypatch
+	:return:
+		Session factory of game_1
+	"""
+	registry = GameDatabaseRegistry(str(tmp_path))
+	monkeypatch.setattr(src.utils.db, "_GAME_DB_REGISTRY", registry)
+
+	yield registry.get_session_factory("game_1")
+
+	registry.drop("game_1")
@@ -0,0 +1,39 @@
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+import src.core.DefaultInstaller  # noqa: F401 - imports repositories, registering all mappers
+from src.domain.game.entities.HeroInventoryProduct import HeroInventoryProduct
+from src.domain.game.entities.InventoryEntityType import InventoryEntityType
+from src.domain.game.repositories.HeroInventoryRepository import HeroInventoryRepository
+from src.domain.game.repositories.mappers.HeroInventoryMapper import HeroInventoryMapper
+from src.domain.game.repositories.mappers.ProfileMapper import ProfileMapper
+from src.utils.db import create_db_engine
+
+
+class TestHeroInventoryRepository:
+
+	@pytest.fixture
+	def repository(self, tmp_path):
+		engine = create_db_engine(f"sqlite:///{tmp_path / 'app.db'}")
+		ProfileMapper.__table__.create(engine)
+		HeroInventoryMapper.__table__.create(engine)
+
+		with engine.begin() as connection:
+			connection.execute(insert(ProfileMapper.__table__), [{"name": "hero", "game_id": 1}])
+
+		yield HeroInventoryRepository(session_factory=sessionmaker(bind=engine))
+
+		engine.dispose()
+
+	def test_create_batch_keeps_composite_primary_key(self, repository):
+		"""Test that batch creation writes every primary key column of a table without autoincrement column"""
+		inventory = [
+			HeroInventoryProduct(product_id=product_id, product_type=InventoryEntityType.ITEM, count=2, profile_id=1)
+			for product_id in (7, 3)
+		]
+
+		created = repository._create_batch(inventory)
+
+		assert created == inventory
+		assert sorted(product.product_id for product in repository.get_by_profile(1)) == [3, 7]
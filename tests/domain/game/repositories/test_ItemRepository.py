@@ -0,0 +1,42 @@
+import pytest
+
+import src.core.DefaultInstaller  # noqa: F401 - imports repositories, registering all mappers
+from src.domain.exceptions import InvalidPropbitException
+from src.domain.game.entities.Item import Item
+from src.domain.game.entities.Propbit import Propbit
+from src.domain.game.repositories.ItemRepository import ItemRepository
+
+
+class TestItemRepository:
+
+	@pytest.fixture
+	def repository(self, game_session_factory):
+		repository = ItemRepository(session_factory=game_session_factory)
+		repository.create_batch([
+			Item(id=0, item_set_id=None, kb_id=kb_id, name=kb_id, price=1, propbits=propbits, tiers=None)
+			for kb_id, propbits in [
+				("sword", [Propbit.WEAPON, Propbit.RARE]),
+				("helmet", [Propbit.HELMET, Propbit.ARMOR]),
+				("wife", [Propbit.WIFE]),
+				("scroll", None)
+			]
+		])
+
+		return repository
+
+	@pytest.mark.parametrize("propbits, expected", [
+		(["weapon"], ["sword"]),
+		(["rare", "armor"], ["helmet", "sword"]),
+		(["wife"], ["wife"]),
+		(["pet"], [])
+	])
+	def test_search_with_filters_by_propbits(self, repository, propbits, expected):
+		"""Test that items having any of the propbits are found"""
+		items = repository.search_with_filters(propbits=propbits)
+
+		assert [item.kb_id for item in items] == expected
+
+	def test_search_with_filters_rejects_unknown_propbit(self, repository):
+		"""Test that unknown propbits are reported instead of matching nothing"""
+		with pytest.raises(InvalidPropbitException):
+			repository.search_with_filters(propbits=["weapon", "laser"])
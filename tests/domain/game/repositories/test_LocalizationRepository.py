@@ -0,0 +1,78 @@
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+import src.core.DefaultInstaller  # noqa: F401 - imports repositories, registering all mappers
+from src.domain.game.entities.Localization import Localization
+from src.domain.game.repositories.LocalizationRepository import LocalizationRepository
+from src.domain.game.repositories.mappers.LocalizationMapper import LocalizationMapper
+from src.utils.db import create_db_engine
+
+
+class TestLocalizationRepository:
+
+	@pytest.fixture
+	def repository(self, tmp_path):
+		engine = create_db_engine(f"sqlite:///{tmp_path / 'game.db'}")
+		LocalizationMapper.__table__.create(engine)
+
+		with engine.begin() as connection:
+			connection.execute(insert(LocalizationMapper.__table__), [
+				{"kb_id": kb_id, "text": kb_id, "source": "test", "tag": "test"}
+				for kb_id in [
+					"spell_empathy_name", "spell_empathy_hint", "spell_empathy_2_name",
+					"spell_empathy2_name", "spell_slow_name", "itext_m_zcom_1422_name"
+				]
+			])
+
+		yield LocalizationRepository(session_factory=sessionmaker(bind=engine))
+
+		engine.dispose()
+
+	@pytest.mark.parametrize("ranges_limit", [3, 1000])
+	def test_search_by_kb_id_pattern_matches_like(self, repository, ranges_limit, monkeypatch):
+		"""Test that batched search groups rows as a LIKE query per kb_id would"""
+		monkeypatch.setattr(LocalizationRepository, "_PATTERN_RANGES_LIMIT", ranges_limit)
+
+		result = repository.search_by_kb_id_pattern("spell\\_{}\\_%", ["empathy", "empathy_2", "slow", "haste"])
+
+		assert {kb_id: sorted(loc.kb_id for loc in locs) for kb_id, locs in result.items()} == {
+			"empathy": ["spell_empathy_2_name", "spell_empathy_hint", "spell_empathy_name"],
+			"empathy_2": ["spell_empathy_2_name"],
+			"slow": ["spell_slow_name"]
+		}
+
+	def test_search_by_kb_id_pattern_rejects_inner_wildcards(self, repository):
+		"""Test that patterns that are not a kb_id prefix are refused"""
+		with pytest.raises(ValueError):
+			repository.search_by_kb_id_pattern("spell_{}\\_%", ["slow"])
+		with pytest.raises(ValueError):
+			repository.search_by_kb_id_pattern("spell\\_{}\\_name", ["slow"])
+
+	def test_get_by_kb_ids(self, repository):
+		"""Test that only existing kb_ids are returned"""
+		result = repository.get_by_kb_ids(["spell_slow_name", "spell_slow_name", "spell_haste_name"])
+
+		assert list(result) == ["spell_slow_name"]
+		assert result["spell_slow_name"].text == "spell_slow_name"
+
+	def test_create_batch_assigns_ids_in_order(self, repository):
+		"""Test that created localizations get the IDs of their inserted rows"""
+		created = repository.create_batch([
+			Localization(id=0, kb_id=f"itm_new_{i}_name", text=str(i), source="test", tag=None)
+			for i in range(5)
+		])
+
+		assert [loc.kb_id for loc in created] == [f"itm_new_{i}_name" for i in range(5)]
+		for loc in created:
+			assert repository.get_by_id(loc.id) == loc
+
+	def test_create_batch_returns_count(self, repository):
+		"""Test that return_entities=False only reports how many rows were created"""
+		count = repository.create_batch(
+			[Localization(id=0, kb_id=f"itm_new_{i}_hint", text="", source=None, tag=None) for i in range(3)],
+			return_entities=False
+		)
+
+		assert count == 3
+		assert len(repository.list_all()) == 9
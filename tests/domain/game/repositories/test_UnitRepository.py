@@ -0,0 +1,45 @@
+import pytest
+
+import src.core.DefaultInstaller  # noqa: F401 - imports repositories, registering all mappers
+from src.domain.game.dto.UnitFilterDto import UnitFilterDto
+from src.domain.game.entities.Unit import Unit
+from src.domain.game.entities.UnitClass import UnitClass
+from src.domain.game.repositories.UnitRepository import UnitRepository
+
+
+class TestUnitRepository:
+
+	@pytest.fixture
+	def repository(self, game_session_factory):
+		repository = UnitRepository(session_factory=game_session_factory)
+		repository.create_batch([
+			Unit(
+				id=0, kb_id=kb_id, name=kb_id, unit_class=UnitClass.CHESSPIECE, main={}, params={},
+				level=level, resistance=resistance
+			)
+			for kb_id, level, resistance in [
+				("dragon", 5, {"physical": 30, "fire": 80, "magic": 10}),
+				("salamander", 2, {"physical": 10, "fire": 50}),
+				("bowman", 1, {"physical": 0}),
+				("ghost", 3, None)
+			]
+		])
+
+		return repository
+
+	@pytest.mark.parametrize("filters, expected", [
+		(UnitFilterDto(min_resistance_fire=50), ["dragon", "salamander"]),
+		(UnitFilterDto(min_resistance_fire=50, min_resistance_physical=20), ["dragon"]),
+		(UnitFilterDto(min_resistance_physical=0, level=1), ["bowman"]),
+		(UnitFilterDto(min_resistance_astral=0), [])
+	])
+	def test_search_with_filters_by_resistance(self, repository, filters, expected):
+		"""Test that resistance filters use the values of the resistance dictionary"""
+		units = repository.search_with_filters(filters, sort_by="kb_id")
+
+		assert [unit.kb_id for unit in units] == expected
+
+	def test_resistance_is_kept(self, repository):
+		"""Test that the resistance dictionary is returned unchanged"""
+		assert repository.get_by_kb_id("salamander").resistance == {"physical": 10.0, "fire": 50.0}
+		assert repository.get_by_kb_id("ghost").resistance is None
@@ -0,0 +1,98 @@
+import re
+
+import pytest
+from sqlalchemy import event
+
+import src.core.DefaultInstaller  # noqa: F401 - imports repositories, registering all mappers
+from src.domain.base.repositories.mappers.base import Base
+from src.domain.game.dto.UnitFilterDto import UnitFilterDto
+from src.domain.game.entities.InventoryEntityType import InventoryEntityType
+from src.domain.game.entities.ShopProductType import ShopProductType
+from src.domain.game.repositories.HeroInventoryRepository import HeroInventoryRepository
+from src.domain.game.repositories.ItemRepository import ItemRepository
+from src.domain.game.repositories.ShopInventoryRepository import ShopInventoryRepository
+from src.domain.game.repositories.UnitRepository import UnitRepository
+
+# Plan detail of a full table scan, e.g. "SCAN shop_inventory"; scans of
+# an index ("SCAN item USING INDEX ...") or of a virtual table are allowed
+_TABLE_SCAN_PATTERN: re.Pattern = re.compile(r"^SCAN (\w+)$")
+
+_HOT_QUERIES = {
+	"shop_inventory_by_profile": lambda r: r[ShopInventoryRepository].get_by_profile(1),
+	"shop_inventory_by_profile_and_type": lambda r: r[ShopInventoryRepository].get_by_profile(
+		1, [ShopProductType.ITEM, ShopProductType.UNIT]
+	),
+	"shop_inventory_by_entity": lambda r: r[ShopInventoryRepository].get_by_entity(1, ShopProductType.ITEM, 1),
+	"shop_inventory_delete_by_profile": lambda r: r[ShopInventoryRepository].delete_by_profile(1),
+	"shop_inventory_sync_profile": lambda r: r[ShopInventoryRepository].sync_profile(1, []),
+	"hero_inventory_by_profile": lambda r: r[HeroInventoryRepository].get_by_profile(1),
+	"hero_inventory_by_profile_and_type": lambda r: r[HeroInventoryRepository].get_by_profile(
+		1, [InventoryEntityType.ITEM]
+	),
+	"hero_inventory_delete_by_profile": lambda r: r[HeroInventoryRepository].delete_by_profile(1),
+	"hero_inventory_sync_profile": lambda r: r[HeroInventoryRepository].sync_profile(1, []),
+	"items_by_profile": lambda r: r[ItemRepository].search_with_filters(profile_id=1),
+	"items_by_level": lambda r: r[ItemRepository].search_with_filters(level=2),
+	"items_by_item_set": lambda r: r[ItemRepository].list_by_item_set_id(1),
+	"items_by_name": lambda r: r[ItemRepository].search_with_filters(name_query="меч"),
+	"units_by_profile": lambda r: r[UnitRepository].search_with_filters(UnitFilterDto(profile_id=1)),
+	"units_by_cost": lambda r: r[UnitRepository].search_with_filters(UnitFilterDto(min_cost=100, max_cost=500)),
+	"units_by_leadership": lambda r: r[UnitRepository].search_with_filters(UnitFilterDto(min_leadership=50)),
+	"units_by_level": lambda r: r[UnitRepository].search_with_filters(UnitFilterDto(level=3)),
+	"units_by_resistance": lambda r: r[UnitRepository].search_with_filters(UnitFilterDto(min_resistance_fire=50))
+}
+
+
+class TestQueryPlans:
+
+	@pytest.fixture
+	def repositories(self, game_session_factory):
+		return {
+			repository_type: repository_type(session_factory=game_session_factory)
+			for repository_type in [ShopInventoryRepository, HeroInventoryRepository, ItemRepository, UnitRepository]
+		}
+
+	@pytest.fixture
+	def explain(self, game_session_factory):
+		"""
+		Run a callable and return the query plan details of every statement it executed
+		"""
+		engine = game_session_factory.kw["bind"]
+
+		def run(query) -> list[tuple[str, list[str]]]:
+			statements = []
+
+			def capture(conn, cursor, statement, parameters, context, executemany):
+				if not executemany:
+					statements.append((statement, parameters))
+
+			event.listen(engine, "before_cursor_execute", capture)
+			try:
+				query()
+			finally:
+				event.remove(engine, "before_cursor_execute", capture)
+
+			connection = engine.raw_connection()
+			try:
+				return [
+					(statement, [row[3] for row in connection.cursor().execute(f"EXPLAIN QUERY PLAN {statement}", parameters)])
+					for statement, parameters in statements
+				]
+			finally:
+				connection.close()
+
+		return run
+
+	@pytest.mark.parametrize("query_name", list(_HOT_QUERIES))
+	def test_hot_query_does_not_scan_tables(self, repositories, explain, query_name):
+		"""Test that repository queries behind the list pages and inventory sync search an index"""
+		plans = explain(lambda: _HOT_QUERIES[query_name](repositories))
+
+		assert plans
+		for statement, details in plans:
+			scanned = [
+				match.group(1)
+				for match in map(_TABLE_SCAN_PATTERN.match, details)
+				if match and match.group(1) in Base.metadata.tables
+			]
+			assert not scanned, f"Full scan of {scanned} in:\n{statement}\n" + "\n".join(details)
@@ -0,0 +1,109 @@
+import pytest
+from sqlalchemy import insert
+
+import src.core.DefaultInstaller  # noqa: F401 - imports repositories, registering all mappers
+from src.domain.base.repositories.CrudRepository import GAME_CONTEXT
+from src.domain.game.factories.LocFactory import LocFactory
+from src.domain.game.repositories.ItemRepository import ItemRepository
+from src.domain.game.repositories.LocalizationRepository import LocalizationRepository
+from src.domain.game.repositories.SpellRepository import SpellRepository
+from src.domain.game.repositories.UnitRepository import UnitRepository
+from src.domain.game.repositories.mappers.ItemMapper import ItemMapper
+from src.domain.game.repositories.mappers.LocalizationMapper import LocalizationMapper
+from src.domain.game.repositories.mappers.SpellMapper import SpellMapper
+from src.domain.game.repositories.mappers.UnitMapper import UnitMapper
+from src.web.dependencies.game_context import GameContext
+
+
+class TestSearchText:
+
+	@pytest.fixture
+	def session_factory(self, game_session_factory):
+		token = GAME_CONTEXT.set(GameContext(game_id=1, schema_name="game_1"))
+
+		with game_session_factory() as session:
+			session.execute(insert(ItemMapper.__table__), [
+				{"kb_id": "sword", "price": 1, "level": 1, "name": "Меч героя", "hint": "Острый клинок"},
+				{"kb_id": "tree", "price": 1, "level": 2, "name": "Ёлочный меч", "hint": None},
+				{"kb_id": "swordsman", "price": 1, "level": 1, "name": "Мечник", "hint": None},
+				{"kb_id": "shield", "price": 1, "level": 1, "name": "Щит", "hint": "Меч не пробьёт"},
+				{"kb_id": "junk", "price": 1, "level": 1, "name": None, "hint": None}
+			])
+			session.execute(insert(UnitMapper.__table__), [
+				{"kb_id": kb_id, "name": name, "unit_class": "chesspiece", "params": {}, "main": {}}
+				for kb_id, name in [("bowman", "Лучник"), ("elf", "Эльф-лучник"), ("knight", "Рыцарь")]
+			])
+			session.execute(insert(SpellMapper.__table__), [
+				{"kb_id": kb_id, "profit": 1, "price": 1, "school": 1, "data": {}}
+				for kb_id in ["slow", "haste"]
+			])
+			session.execute(insert(LocalizationMapper.__table__), [
+				{"kb_id": kb_id, "text": text, "source": "test", "tag": "test"}
+				for kb_id, text in [
+					("spell_slow_name", "Замедление"), ("spell_slow_desc", "Ускорение врагов отменяется"),
+					("spell_haste_name", "Ускорение")
+				]
+			])
+			session.commit()
+
+		yield game_session_factory
+
+		GAME_CONTEXT.reset(token)
+
+	@pytest.fixture
+	def item_repository(self, session_factory):
+		repository = ItemRepository(session_factory=session_factory)
+		repository.index_search_text()
+		return repository
+
+	@pytest.mark.parametrize("query, expected", [
+		("меч", ["sword", "tree", "swordsman"]),
+		("МЕЧ ГЕР", ["sword"]),
+		("елочный", ["tree"]),
+		("клинок", []),
+		("*", [])
+	])
+	def test_item_search_by_name(self, item_repository, query, expected):
+		"""Test that every word matches a name word prefix, ignoring case and ё"""
+		assert sorted(item.kb_id for item in item_repository.search_by_name(query)) == sorted(expected)
+
+	def test_item_search_ranks_better_matches_first(self, item_repository):
+		"""Test that shorter names containing the term rank above longer ones"""
+		assert item_repository.search_by_name("меч")[0].kb_id == "swordsman"
+
+	def test_item_search_with_filters_uses_index(self, item_repository):
+		"""Test that name_query combines with other filters and keeps the requested order"""
+		items = item_repository.search_with_filters(name_query="меч", level=1, sort_by="name")
+
+		assert [item.kb_id for item in items] == ["sword", "swordsman"]
+
+	def test_index_is_rebuilt(self, item_repository, session_factory):
+		"""Test that reindexing replaces the rows of the entity type"""
+		with session_factory() as session:
+			session.query(ItemMapper).filter(ItemMapper.kb_id == "shield").update({"name": "Щит мечника"})
+			session.commit()
+
+		item_repository.index_search_text()
+
+		assert sorted(item.kb_id for item in item_repository.search_by_name("мечник")) == ["shield", "swordsman"]
+
+	def test_unit_search_by_name(self, session_factory):
+		"""Test that unit names are searched per word"""
+		repository = UnitRepository(session_factory=session_factory)
+		repository.index_search_text()
+
+		assert sorted(unit.kb_id for unit in repository.search_by_name("лучн")) == ["bowman", "elf"]
+
+	def test_spell_search_with_filters_by_name(self, session_factory):
+		"""Test that spells are indexed from their localized names, not descriptions"""
+		repository = SpellRepository(
+			loc_factory=LocFactory(),
+			localization_repository=LocalizationRepository(session_factory=session_factory)
+		)
+		repository.index_search_text()
+
+		spells = repository.search_with_filters(name_query="ускор")
+
+		assert [spell.kb_id for spell in spells] == ["haste"]
+		assert spells[0].loc.name == "Ускорение"
+		assert [spell.kb_id for spell in repository.search_with_filters(name_query="врагов")] == []
@@ -0,0 +1,117 @@
+import pytest
+from sqlalchemy import text
+
+import src.core.DefaultInstaller  # noqa: F401 - imports repositories, registering all mappers
+from src.domain.base.repositories.CrudRepository import GAME_CONTEXT
+from src.domain.exceptions import DuplicateEntityException
+from src.domain.game.entities.Localization import Localization
+from src.domain.game.repositories.LocalizationRepository import LocalizationRepository
+from src.web.dependencies.game_context import GameContext
+
+
+class TestSessionScope:
+
+	@pytest.fixture
+	def game_context(self, game_session_factory):
+		context = GameContext(game_id=1, schema_name="game_1")
+		token = GAME_CONTEXT.set(context)
+
+		yield context
+
+		GAME_CONTEXT.reset(token)
+
+	@pytest.fixture
+	def repository(self, game_context):
+		return LocalizationRepository(session_factory=None)
+
+	@staticmethod
+	def localization(kb_id: str, text: str = "text") -> Localization:
+		return Localization(id=0, kb_id=kb_id, text=text, source="test", tag=None)
+
+	def test_repository_calls_share_scope_session(self, game_context, repository):
+		"""Test that only one session is opened for all calls within a scope"""
+		repository.create(self.localization("a"))
+		repository.get_by_kb_id("a")
+		assert game_context.sessions_opened == 2
+
+		with game_context.session_scope():
+			created = repository.create(self.localization("b"))
+			repository.get_by_kb_id("b")
+			repository.get_by_kb_ids(["a", "b"])
+			repository.list_all()
+
+		assert game_context.sessions_opened == 3
+		assert game_context.session is None
+		assert repository.get_by_id(created.id) == created
+
+	def test_scope_session_sees_committed_changes(self, game_context, repository, game_session_factory):
+		"""Test that mappers are not kept between calls sharing the session"""
+		with game_context.session_scope():
+			created = repository.create(self.localization("a", "old"))
+			repository.get_by_id(created.id)
+
+			with game_session_factory() as session:
+				session.execute(text("UPDATE localization SET text = 'new'"))
+				session.commit()
+
+			assert repository.get_by_id(created.id).text == "new"
+
+	def test_scope_session_recovers_from_errors(self, game_context, repository):
+		"""Test that a failed call does not break later calls within the scope"""
+		with game_context.session_scope():
+			repository.create(self.localization("a"))
+			with pytest.raises(DuplicateEntityException):
+				repository.create(self.localization("a"))
+
+			repository.create(self.localization("b"))
+
+			assert sorted(loc.kb_id for loc in repository.list_all()) == ["a", "b"]
+
+	def test_nested_scopes_reuse_session(self, game_context):
+		"""Test that an inner scope keeps the outer session open"""
+		with game_context.session_scope() as outer:
+			with game_context.session_scope() as inner:
+				assert inner is outer
+			assert game_context.session is outer
+
+		assert game_context.sessions_opened == 1
+
+	def test_transaction_commits_on_exit(self, game_context, repository):
+		"""Test that writes within a transaction are committed together when it exits"""
+		with game_context.transaction():
+			repository.create(self.localization("a"))
+			repository.create(self.localization("b"))
+
+		assert game_context.session is None
+		assert sorted(loc.kb_id for loc in repository.list_all()) == ["a", "b"]
+
+	def test_transaction_rolls_back_earlier_writes(self, game_context, repository):
+		"""Test that an error within a transaction rolls back writes already committed by repositories"""
+		with pytest.raises(RuntimeError):
+			with game_context.transaction():
+				repository.create(self.localization("a"))
+				raise RuntimeError("sync failed")
+
+		assert repository.list_all() == []
+
+	def test_failed_call_rolls_back_transaction(self, game_context, repository):
+		"""Test that a failed repository call rolls back the whole transaction"""
+		with pytest.raises(DuplicateEntityException):
+			with game_context.transaction():
+				repository.create(self.localization("a"))
+				repository.create(self.localization("a"))
+
+		assert repository.list_all() == []
+
+	def test_nested_transactions_join(self, game_context, repository):
+		"""Test that an inner transaction joins the outer one and resumes the scope session"""
+		with game_context.session_scope() as scope:
+			with pytest.raises(RuntimeError):
+				with game_context.transaction() as outer:
+					with game_context.transaction() as inner:
+						assert inner is outer
+						repository.create(self.localization("a"))
+					raise RuntimeError("sync failed")
+
+			assert game_context.session is scope
+			assert repository.list_all() == []
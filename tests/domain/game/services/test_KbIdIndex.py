@@ -0,0 +1,97 @@
+import pytest
+from unittest.mock import Mock
+
+from src.domain.base.repositories.CrudRepository import GAME_CONTEXT
+from src.domain.game.entities.Actor import Actor
+from src.domain.game.entities.AtomMap import AtomMap
+from src.domain.game.entities.Item import Item
+from src.domain.game.entities.Spell import Spell
+from src.domain.game.entities.Unit import Unit
+from src.domain.game.services.KbIdIndex import KbIdIndex
+from src.web.dependencies.game_context import GameContext
+
+
+class TestKbIdIndex:
+
+	@pytest.fixture
+	def repositories(self):
+		def repository(ids):
+			repo = Mock()
+			repo.get_ids_by_kb_ids.return_value = ids
+			return repo
+
+		return {
+			Item: repository({'sword': 1, 'ring': 2}),
+			Spell: repository({'slow': 3}),
+			Unit: repository({'bowman': 4}),
+			AtomMap: repository({'m_zcom_1422': 5}),
+			Actor: repository({'actor_1': 6})
+		}
+
+	@pytest.fixture
+	def index(self, repositories):
+		return KbIdIndex(
+			item_repository=repositories[Item],
+			spell_repository=repositories[Spell],
+			unit_repository=repositories[Unit],
+			atom_map_repository=repositories[AtomMap],
+			actor_repository=repositories[Actor]
+		)
+
+	@pytest.fixture
+	def game_context(self):
+		def use(game_id: int):
+			token = GAME_CONTEXT.set(GameContext(game_id=game_id, schema_name=f"game_{game_id}"))
+			tokens.append(token)
+
+		tokens = []
+		yield use
+		for token in reversed(tokens):
+			GAME_CONTEXT.reset(token)
+
+	def test_lookups_are_loaded_once(self, index, repositories, game_context):
+		"""Test that every entity type is loaded with one query and then served from memory"""
+		game_context(1)
+
+		assert index.get_id(Item, 'sword') == 1
+		assert index.get_id(Item, 'axe') is None
+		assert index.get_ids(Spell, ['slow', 'haste']) == {'slow': 3}
+		assert index.contains(Unit, 'bowman')
+		assert not index.contains(Unit, 'sword')
+		assert index.get_id(AtomMap, 'm_zcom_1422') == 5
+		assert index.get_id(Actor, 'actor_1') == 6
+
+		for repository in repositories.values():
+			repository.get_ids_by_kb_ids.assert_called_once_with()
+
+	def test_indexes_are_kept_per_game(self, index, repositories, game_context):
+		"""Test that each game gets its own index"""
+		game_context(1)
+		index.get_id(Item, 'sword')
+		game_context(2)
+		index.get_id(Item, 'sword')
+		game_context(1)
+		index.get_id(Item, 'ring')
+
+		assert repositories[Item].get_ids_by_kb_ids.call_count == 2
+
+	def test_invalidate_reloads_game(self, index, repositories, game_context):
+		"""Test that invalidate drops only the given game, or all games without ID"""
+		game_context(1)
+		index.get_id(Item, 'sword')
+		game_context(2)
+		index.get_id(Item, 'sword')
+
+		index.invalidate(1)
+		index.get_id(Item, 'sword')
+		assert repositories[Item].get_ids_by_kb_ids.call_count == 2
+
+		repositories[Item].get_ids_by_kb_ids.return_value = {'axe': 7}
+		game_context(1)
+		assert index.get_id(Item, 'axe') == 7
+		assert index.get_id(Item, 'sword') is None
+
+		index.invalidate()
+		game_context(2)
+		assert index.get_id(Item, 'axe') == 7
+		assert repositories[Item].get_ids_by_kb_ids.call_count == 4
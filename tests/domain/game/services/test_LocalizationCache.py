@@ -0,0 +1,81 @@
+import pytest
+from unittest.mock import Mock
+
+from src.domain.base.repositories.CrudRepository import GAME_CONTEXT
+from src.domain.game.entities.Localization import Localization
+from src.domain.game.services.LocalizationCache import LocalizationCache
+from src.web.dependencies.game_context import GameContext
+
+
+class TestLocalizationCache:
+
+	@pytest.fixture
+	def localization_repository(self):
+		repository = Mock()
+		repository.get_by_kb_ids.side_effect = lambda kb_ids: {
+			kb_id: Localization(id=1, kb_id=kb_id, text=kb_id.upper(), source='test', tag='test')
+			for kb_id in kb_ids
+			if kb_id != 'm_unnamed'
+		}
+		return repository
+
+	@pytest.fixture
+	def cache(self, localization_repository):
+		return LocalizationCache(localization_repository=localization_repository)
+
+	@pytest.fixture
+	def game_context(self):
+		def use(game_id: int):
+			token = GAME_CONTEXT.set(GameContext(game_id=game_id, schema_name=f"game_{game_id}"))
+			tokens.append(token)
+
+		tokens = []
+		yield use
+		for token in reversed(tokens):
+			GAME_CONTEXT.reset(token)
+
+	def test_only_missing_texts_are_fetched(self, cache, localization_repository, game_context):
+		"""Test that known and unknown kb_ids are not queried again"""
+		game_context(1)
+
+		assert cache.get_texts(['m_zcom', 'm_unnamed', 'm_zcom']) == {'m_zcom': 'M_ZCOM'}
+		assert cache.get_texts(['m_zcom', 'm_portland', 'm_unnamed']) == {
+			'm_zcom': 'M_ZCOM',
+			'm_portland': 'M_PORTLAND'
+		}
+
+		assert [c.args[0] for c in localization_repository.get_by_kb_ids.call_args_list] == [
+			{'m_zcom', 'm_unnamed'},
+			{'m_portland'}
+		]
+
+	def test_texts_are_kept_per_game(self, cache, localization_repository, game_context):
+		"""Test that each game gets its own texts"""
+		game_context(1)
+		cache.get_texts(['m_zcom'])
+		game_context(2)
+		cache.get_texts(['m_zcom'])
+		game_context(1)
+		cache.get_texts(['m_zcom'])
+
+		assert localization_repository.get_by_kb_ids.call_count == 2
+
+	def test_invalidate_reloads_game(self, cache, localization_repository, game_context):
+		"""Test that invalidate drops only the given game, or all games without ID"""
+		game_context(1)
+		cache.get_texts(['m_zcom'])
+		game_context(2)
+		cache.get_texts(['m_zcom'])
+
+		cache.invalidate(1)
+		cache.get_texts(['m_zcom'])
+		assert localization_repository.get_by_kb_ids.call_count == 2
+
+		game_context(1)
+		cache.get_texts(['m_zcom'])
+		assert localization_repository.get_by_kb_ids.call_count == 3
+
+		cache.invalidate()
+		game_context(2)
+		cache.get_texts(['m_zcom'])
+		assert localization_repository.get_by_kb_ids.call_count == 4
@@ -0,0 +1,97 @@
+import pytest
+from unittest.mock import Mock
+
+from src.domain.game.dto.ProfileSyncResult import InventoryChanges
+from src.domain.game.entities.InventoryEntityType import InventoryEntityType
+from src.domain.game.entities.ShopProductType import ShopProductType
+from src.domain.game.entities.ShopType import ShopType
+from src.domain.game.services.ProfileGameDataSyncerService import ProfileGameDataSyncerService
+from src.utils.parsers.save_data.SaveFileData import SaveFileData, HeroInventory, GameObjectData
+
+
+class TestProfileGameDataSyncerService:
+
+	@pytest.fixture
+	def mock_shop_inventory_repo(self):
+		repo = Mock()
+		repo.sync_profile.return_value = InventoryChanges(added=1)
+		return repo
+
+	@pytest.fixture
+	def mock_hero_inventory_repo(self):
+		repo = Mock()
+		repo.sync_profile.return_value = InventoryChanges(updated=1)
+		return repo
+
+	@pytest.fixture
+	def service(self, mock_shop_inventory_repo, mock_hero_inventory_repo):
+		def get_id(entity_type, kb_id):
+			return None if kb_id.startswith("missing") else len(kb_id)
+
+		kb_id_index = Mock()
+		kb_id_index.get_id.side_effect = get_id
+		kb_id_index.get_ids.side_effect = lambda entity_type, kb_ids: {
+			kb_id: get_id(entity_type, kb_id) for kb_id in kb_ids if get_id(entity_type, kb_id) is not None
+		}
+
+		return ProfileGameDataSyncerService(
+			kb_id_index=kb_id_index,
+			shop_inventory_repository=mock_shop_inventory_repo,
+			hero_inventory_repository=mock_hero_inventory_repo,
+			logger=Mock()
+		)
+
+	def test_sync_writes_inventory_through_diff(
+		self,
+		service,
+		mock_shop_inventory_repo,
+		mock_hero_inventory_repo
+	):
+		"""Test that all products are handed to sync_profile once, duplicates dropped"""
+		data = SaveFileData(
+			shops=[{
+				'itext': 'm_zcom_1422',
+				'actor': None,
+				'location': 'm_zcom',
+				'inventory': {
+					'items': [{'name': 'sword', 'quantity': 1}, {'name': 'sword', 'quantity': 1}],
+					'spells': [{'name': 'spell_slow', 'quantity': 2}],
+					'units': [{'name': 'missing_unit', 'quantity': 10}],
+					'garrison': []
+				}
+			}],
+			hero_inventory=HeroInventory(items=[
+				GameObjectData(kb_id='ring', quantity=1),
+				GameObjectData(kb_id='ring', quantity=2)
+			])
+		)
+
+		result = service.sync(data, 1)
+
+		shop_products = mock_shop_inventory_repo.sync_profile.call_args.args[1]
+		assert [(p.product_type, p.shop_type, p.count) for p in shop_products] == [
+			(ShopProductType.ITEM, ShopType.ATOM, 1),
+			(ShopProductType.SPELL, ShopType.ATOM, 2)
+		]
+		assert result.shops.items == 1
+		assert result.shops.spells == 1
+		assert result.shops.missed_data.units == ['missing_unit']
+		assert result.shops.changes == InventoryChanges(added=1)
+
+		hero_products = mock_hero_inventory_repo.sync_profile.call_args.args[1]
+		assert [(p.product_type, p.count) for p in hero_products] == [(InventoryEntityType.ITEM, 3)]
+		assert result.hero_inventory.items == 1
+		assert result.hero_inventory.changes == InventoryChanges(updated=1)
+
+	def test_sync_empty_save_removes_stored_inventory(
+		self,
+		service,
+		mock_shop_inventory_repo,
+		mock_hero_inventory_repo
+	):
+		"""Test that an empty save still syncs, so stale rows get removed"""
+		result = service.sync(SaveFileData(shops=[], hero_inventory=None), 1)
+
+		mock_shop_inventory_repo.sync_profile.assert_called_once_with(1, [])
+		mock_hero_inventory_repo.sync_profile.assert_called_once_with(1, [])
+		assert result.hero_inventory.items == 0
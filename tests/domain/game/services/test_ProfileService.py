@@ -37,6 +37,10 @@ class TestProfileServiceScan:
 	def mock_hero_inventory_repo(self):
 		return Mock()
 
+	@pytest.fixture
+	def mock_transaction_manager(self):
+		return MagicMock()
+
 	@pytest.fixture
 	def service(
 		self,
@@ -45,7 +49,8 @@ class TestProfileServiceScan:
 		mock_config,
 		mock_data_syncer,
 		mock_shop_inventory_repo,
-		mock_hero_inventory_repo
+		mock_hero_inventory_repo,
+		mock_transaction_manager
 	):
 		return ProfileService(
 			profile_repository=mock_profile_repo,
@@ -53,7 +58,8 @@ class TestProfileServiceScan:
 			config=mock_config,
 			data_syncer=mock_data_syncer,
 			shop_inventory_repository=mock_shop_inventory_repo,
-			hero_inventory_repository=mock_hero_inventory_repo
+			hero_inventory_repository=mock_hero_inventory_repo,
+			transaction_manager=mock_transaction_manager
 		)
 
 	@pytest.fixture
@@ -286,3 +292,105 @@ class TestProfileServiceScan:
 
 		mock_save_file_service.find_profile_most_recent_save.assert_called_once_with(sample_profile)
 		mock_save_file_service.scan_save_data.assert_called_once_with(save2)
+
+	def test_scan_unchanged_save_returns_stored_result(
+		self,
+		service,
+		mock_profile_repo,
+		mock_save_file_service,
+		mock_data_syncer,
+		mock_shop_inventory_repo,
+		sample_profile,
+		tmp_path
+	):
+		"""Test that a save with the stored digest is neither parsed nor synced"""
+		save_file = tmp_path / "data"
+		save_file.write_text("test save data")
+
+		stored_result = ProfileSyncResult(
+			shops=ProfileSyncShopResult(items=4, spells=3, units=2, garrison=1),
+			hero_inventory=ProfileSyncHeroInventoryResult(items=5)
+		)
+		sample_profile.last_save_digest = "abc"
+		sample_profile.last_sync_result = stored_result
+		mock_save_file_service.compute_save_digest.return_value = "abc"
+
+		result = service.scan_save(sample_profile, save_file)
+
+		assert result == stored_result
+		mock_save_file_service.scan_save_data.assert_not_called()
+		mock_data_syncer.sync.assert_not_called()
+		mock_shop_inventory_repo.delete_by_profile.assert_not_called()
+		mock_profile_repo.update.assert_called_once_with(sample_profile)
+		assert sample_profile.last_save_timestamp == int(save_file.stat().st_mtime)
+
+	def test_scan_changed_save_stores_digest_and_result(
+		self,
+		service,
+		mock_profile_repo,
+		mock_save_file_service,
+		mock_data_syncer,
+		sample_profile,
+		tmp_path
+	):
+		"""Test that a changed save is synced and its digest and result are stored"""
+		save_file = tmp_path / "data"
+		save_file.write_text("test save data")
+
+		sync_result = ProfileSyncResult(
+			shops=ProfileSyncShopResult(items=1, spells=0, units=0, garrison=0),
+			hero_inventory=ProfileSyncHeroInventoryResult(items=0)
+		)
+		sample_profile.last_save_digest = "old"
+		sample_profile.last_sync_result = sync_result.model_copy()
+		mock_save_file_service.compute_save_digest.return_value = "new"
+		mock_data_syncer.sync.return_value = sync_result
+
+		result = service.scan_save(sample_profile, save_file)
+
+		assert result is sync_result
+		mock_data_syncer.sync.assert_called_once()
+		assert sample_profile.last_save_digest == "new"
+		assert sample_profile.last_sync_result is sync_result
+
+	def test_scan_syncs_and_stores_digest_in_one_transaction(
+		self,
+		service,
+		mock_profile_repo,
+		mock_save_file_service,
+		mock_data_syncer,
+		mock_transaction_manager,
+		sample_profile,
+		tmp_path
+	):
+		"""Test that inventories and the profile with its new digest are written in one transaction"""
+		save_file = tmp_path / "data"
+		save_file.write_text("test save data")
+
+		calls = Mock()
+		calls.attach_mock(mock_transaction_manager.transaction.return_value.__enter__, "enter")
+		calls.attach_mock(mock_transaction_manager.transaction.return_value.__exit__, "exit")
+		calls.attach_mock(mock_data_syncer.sync, "sync")
+		calls.attach_mock(mock_profile_repo.update, "update")
+		mock_save_file_service.compute_save_digest.return_value = "new"
+
+		service.scan_save(sample_profile, save_file)
+
+		assert [name for name, _, _ in calls.mock_calls] == ["enter", "sync", "update", "exit"]
+
+	def test_clear_profile_resets_stored_digest(
+		self,
+		service,
+		mock_profile_repo,
+		mock_hero_inventory_repo,
+		sample_profile
+	):
+		"""Test that clearing a profile forces the next scan to resync"""
+		mock_profile_repo.get_by_id.return_value = sample_profile
+		sample_profile.last_save_digest = "abc"
+
+		service.clear_profile(1)
+
+		mock_hero_inventory_repo.delete_by_profile.assert_called_once_with(1)
+		assert sample_profile.last_save_digest is None
+		mock_profile_repo.update.assert_called_once_with(sample_profile)
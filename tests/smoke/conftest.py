@@ -1,5 +1,6 @@
 import pytest
 from pathlib import Path
+from typing import Callable
 from dependency_injector import providers
 from unittest.mock import Mock
 
@@ -7,6 +8,8 @@ from src.core.Container import Container
 from src.utils.parsers.save_data.SaveFileDecompressor import SaveFileDecompressor
 from src.utils.parsers.save_data.SaveDataParser import SaveDataParser
 
+_BENCHMARK_TIMINGS: pytest.StashKey[list[str]] = pytest.StashKey()
+
 
 @pytest.fixture(scope="session")
 def test_saves_path() -> str:
@@ -33,25 +36,25 @@ def test_save_1707047253_path(test_saves_path: str) -> Path:
 
 
 @pytest.fixture(scope="module")
-def mock_item_repository():
+def mock_kb_id_index():
 	"""
-	Module-scoped mock ItemRepository
+	Module-scoped mock KbIdIndex
 
 	:return:
-		Mock ItemRepository instance that always returns False
+		Mock KbIdIndex instance that knows no entities
 	"""
-	mock_repo = Mock()
-	mock_repo.is_item_exists.return_value = False
-	return mock_repo
+	mock_index = Mock()
+	mock_index.contains.return_value = False
+	return mock_index
 
 
 @pytest.fixture(scope="module")
-def test_container(mock_item_repository):
+def test_container(mock_kb_id_index):
 	"""
 	Module-scoped test container with real parser implementations
 
-	:param mock_item_repository:
-		Mock ItemRepository instance
+	:param mock_kb_id_index:
+		Mock KbIdIndex instance
 	:return:
 		Configured Container instance
 	"""
@@ -59,7 +62,7 @@ def test_container(mock_item_repository):
 
 	container.save_file_decompressor.override(providers.Singleton(SaveFileDecompressor))
 	container.save_data_parser.override(providers.Singleton(SaveDataParser))
-	container.item_repository.override(providers.Singleton(lambda: mock_item_repository))
+	container.kb_id_index.override(providers.Singleton(lambda: mock_kb_id_index))
 
 	container.wire(modules=["tests.smoke.test_save_data_parser"])
 
@@ -79,3 +82,39 @@ def save_data_parser(test_container):
 		SaveDataParser instance from container
 	"""
 	return test_container.save_data_parser()
+
+
+@pytest.fixture
+def benchmark_report(request) -> Callable[[str], None]:
+	"""
+	Function-scoped reporter of benchmark timings
+
+	Reported lines are shown in the "benchmark timings" section of the
+	terminal summary, so benchmarks do not need to print.
+
+	:param request:
+		Pytest request of the benchmark
+	:return:
+		Callable adding a line to the report
+	"""
+	lines = request.config.stash.setdefault(_BENCHMARK_TIMINGS, [])
+	return lambda line: lines.append(f"{request.node.nodeid}: {line}")
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config) -> None:
+	"""
+	Show timings reported by benchmarks after the test results
+
+	:param terminalreporter:
+		Pytest terminal reporter
+	:param exitstatus:
+		Exit status of the test session
+	:param config:
+		Pytest config
+	:return:
+	"""
+	lines = config.stash.get(_BENCHMARK_TIMINGS, [])
+	if lines:
+		terminalreporter.section("benchmark timings")
+		for line in lines:
+			terminalreporter.write_line(line)
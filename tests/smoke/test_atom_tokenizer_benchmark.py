@@ -0,0 +1,174 @@
+import glob
+import time
+import zipfile
+
+import pytest
+
+from src.utils.parsers.atom.AtomParser import AtomParser
+
+_GAME_FILES_DIR = "tests/game_files"
+_SYNTHETIC_BLOCKS = 5000
+_ROUNDS = 3
+
+
+def _legacy_tokenize(content: str) -> list[str]:
+	"""
+	Reference copy of the character-by-character tokenizer with separate comment removal
+
+	:param content:
+		Raw content string
+	:return:
+		List of tokens
+	"""
+	lines = []
+	for line in content.split('\n'):
+		if line.strip().startswith('//'):
+			continue
+		comment_pos = line.find('//')
+		if comment_pos != -1:
+			line = line[:comment_pos]
+		if line.strip():
+			lines.append(line)
+	content = '\n'.join(lines)
+
+	tokens = []
+	current = ''
+	after_equals = False
+
+	for char in content:
+		if char in '{}=':
+			if current.strip():
+				tokens.append(current.strip())
+				current = ''
+			elif after_equals and char != '=':
+				tokens.append('')
+
+			tokens.append(char)
+			after_equals = (char == '=')
+			current = ''
+
+		elif char in ' \t\n\r':
+			if current.strip():
+				tokens.append(current.strip())
+				after_equals = False
+				current = ''
+			elif after_equals:
+				tokens.append('')
+				after_equals = False
+			current = ''
+
+		else:
+			current += char
+			after_equals = False
+
+	if current.strip():
+		tokens.append(current.strip())
+	elif after_equals:
+		tokens.append('')
+
+	return tokens
+
+
+def _synthetic_corpus() -> list[str]:
+	"""
+	Build items.txt and spells.txt like content
+
+	:return:
+		Synthetic file contents
+	"""
+	items = []
+	spells = []
+	for i in range(_SYNTHETIC_BLOCKS):
+		items.append(
+			f"// item {i}\n"
+			f"item_{i} {{\n"
+			f"\tcategory=e\n"
+			f"\tprice={i * 10}\n"
+			f"\tlevel={i % 5 + 1}\n"
+			f"\timage=item_{i}.png // icon\n"
+			f"\tmods {{\n"
+			f"\t\tattack={i % 7},defense={i % 3}\n"
+			f"\t\tsound=\n"
+			f"\t}}\n"
+			f"\tpropbits=weapon,armor\n"
+			f"}}\n"
+		)
+		spells.append(
+			f"spell_{i} {{\n"
+			f"\tschool={i % 4}\n"
+			f"\tlevels {{\n"
+			f"\t\t1 {{ mana={i % 20} damage=fire,{i % 50} }}\n"
+			f"\t\t2 {{ mana={i % 20 + 5} damage=fire,{i % 50 + 10} }}\n"
+			f"\t}}\n"
+			f"\tscript=scripts/spell_{i}.lua\n"
+			f"}}\n"
+		)
+	return ["".join(items), "".join(spells)]
+
+
+def _game_files_corpus() -> list[str]:
+	"""
+	Read the atom and txt files of the test game data, if present
+
+	:return:
+		File contents from loose examples and data archives
+	"""
+	contents = []
+	for path in sorted(glob.glob(f"{_GAME_FILES_DIR}/**/*.atom", recursive=True)):
+		with open(path, 'rb') as file:
+			contents.append(file.read())
+
+	for archive_path in sorted(glob.glob(f"{_GAME_FILES_DIR}/**/*.kfs", recursive=True)):
+		with zipfile.ZipFile(archive_path) as archive:
+			for name in archive.namelist():
+				if name.lower().endswith(('.atom', '.txt')):
+					contents.append(archive.read(name))
+
+	return [content.decode('utf-8', errors='replace').lstrip('﻿') for content in contents]
+
+
+@pytest.mark.smoke
+class TestAtomTokenizerBenchmark:
+
+	"""
+	Compares the regex tokenizer of AtomParser with the legacy character loop
+
+	CRITICAL: Manual execution only - excluded from CI/CD
+	Run with: pytest -m smoke tests/smoke/test_atom_tokenizer_benchmark.py
+	"""
+
+	@pytest.mark.parametrize("corpus_name", ["synthetic", "game_files"])
+	def test_tokenizer_matches_legacy(self, corpus_name: str, benchmark_report) -> None:
+		"""
+		Smoke test: both tokenizers return identical token streams and the timings are reported
+
+		:param corpus_name:
+			Synthetic items/spells content or the real test game files
+		:param benchmark_report:
+			Reporter of benchmark timings
+		"""
+		corpus = _synthetic_corpus() if corpus_name == "synthetic" else _game_files_corpus()
+		if not corpus:
+			pytest.skip(f"No atom files found in {_GAME_FILES_DIR}")
+
+		parser = AtomParser()
+
+		def measure(tokenize) -> tuple[list[list[str]], float]:
+			best = float('inf')
+			for _ in range(_ROUNDS):
+				start = time.perf_counter()
+				tokens = [tokenize(content) for content in corpus]
+				best = min(best, time.perf_counter() - start)
+			return tokens, best
+
+		legacy, legacy_time = measure(_legacy_tokenize)
+		fast, fast_time = measure(parser._tokenize)
+
+		assert fast == legacy
+
+		size = sum(len(content) for content in corpus)
+		benchmark_report(
+			f"{corpus_name}: {len(corpus)} files, {size / 1024:.0f} KiB: "
+			f"legacy {legacy_time * 1000:.0f} ms, regex {fast_time * 1000:.0f} ms "
+			f"({legacy_time / fast_time:.2f}x)"
+		)
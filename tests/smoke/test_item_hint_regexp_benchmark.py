@@ -0,0 +1,124 @@
+import re
+import time
+
+import pytest
+from sqlalchemy import insert, text
+
+import src.core.DefaultInstaller  # noqa: F401 - imports repositories, registering all mappers
+from src.domain.game.repositories.ItemRepository import ItemRepository
+from src.domain.game.repositories.mappers.ItemMapper import ItemMapper
+from src.utils.db import GameDatabaseRegistry, _sqlite_regexp
+
+_ITEM_COUNT = 5000
+
+_HINT_TEMPLATES = [
+	"Увеличивает урон от огня на {}%",
+	"Защищает от холода. +{} к защите",
+	"+{} к атаке",
+	None
+]
+
+_HINT_PATTERNS = ["урон", "огн|холод", r"\+\d+ к атаке", "^Увеличивает"]
+
+
+def _hint(i: int) -> str | None:
+	"""
+	Build the hint of the i-th benchmark item
+
+	:param i:
+		Item number
+	:return:
+		Hint text, every fourth item has none
+	"""
+	template = _HINT_TEMPLATES[i % len(_HINT_TEMPLATES)]
+	return template.format(i % 30) if template else None
+
+
+def _legacy_sqlite_regexp(pattern: str, value: str | None) -> bool:
+	"""
+	Reference copy of the per-row ``re.search`` REGEXP callback
+
+	:param pattern:
+		Regular expression pattern
+	:param value:
+		Column value being tested
+	:return:
+		True when the pattern matches anywhere in the value
+	"""
+	if value is None:
+		return False
+	return re.search(pattern, value, re.IGNORECASE) is not None
+
+
+@pytest.mark.smoke
+class TestItemHintRegexpBenchmark:
+
+	"""
+	Compares the per-row re.search callback with the cached REGEXP callback on item hints
+
+	CRITICAL: Manual execution only - excluded from CI/CD
+	Run with: pytest -m smoke tests/smoke/test_item_hint_regexp_benchmark.py
+	"""
+
+	@pytest.fixture
+	def session_factory(self, tmp_path):
+		registry = GameDatabaseRegistry(str(tmp_path))
+		session_factory = registry.get_session_factory("game_1")
+
+		with session_factory() as session:
+			session.execute(insert(ItemMapper.__table__), [
+				{
+					"kb_id": f"item_{i}",
+					"price": i,
+					"level": i % 5 + 1,
+					"name": f"Предмет {i}",
+					"hint": _hint(i)
+				}
+				for i in range(_ITEM_COUNT)
+			])
+			session.commit()
+
+		yield session_factory
+
+		registry.drop("game_1")
+
+	@pytest.mark.parametrize("pattern", _HINT_PATTERNS)
+	def test_cached_regexp_matches_legacy(self, session_factory, pattern: str, benchmark_report) -> None:
+		"""
+		Smoke test: the cached callback selects the same items as the legacy callback
+
+		:param session_factory:
+			Session factory of a game database filled with items
+		:param pattern:
+			Hint pattern
+		:param benchmark_report:
+			Reporter of benchmark timings
+		"""
+		query = text("SELECT id FROM item WHERE hint REGEXP :pattern ORDER BY id")
+
+		with session_factory() as session:
+			dbapi_connection = session.connection().connection.dbapi_connection
+
+			dbapi_connection.create_function("regexp", 2, _legacy_sqlite_regexp)
+			start = time.perf_counter()
+			legacy = session.execute(query, {"pattern": pattern}).scalars().all()
+			legacy_time = time.perf_counter() - start
+
+			dbapi_connection.create_function("regexp", 2, _sqlite_regexp, deterministic=True)
+			start = time.perf_counter()
+			cached = session.execute(query, {"pattern": pattern}).scalars().all()
+			cached_time = time.perf_counter() - start
+
+		assert cached == legacy
+
+		start = time.perf_counter()
+		items = ItemRepository(session_factory=session_factory).search_with_filters(hint_regex=pattern)
+		repository_time = time.perf_counter() - start
+
+		assert len(items) == len(cached)
+
+		benchmark_report(
+			f"{pattern!r}: {len(cached)}/{_ITEM_COUNT} items, legacy {legacy_time * 1000:.1f} ms, "
+			f"cached {cached_time * 1000:.1f} ms ({legacy_time / max(cached_time, 1e-9):.1f}x), "
+			f"search_with_filters {repository_time * 1000:.1f} ms"
+		)
@@ -0,0 +1,113 @@
+import re
+import time
+from pathlib import Path
+
+import pytest
+
+from src.utils.parsers.save_data.SaveDataParser import SaveDataParser
+from src.utils.parsers.save_data.SaveFileDecompressor import SaveFileDecompressor
+
+
+def _legacy_find_all_shop_ids(data: bytes) -> list[tuple[str, int]]:
+	"""
+	Reference copy of the chunked UTF-16 decode shop ID discovery
+
+	:param data:
+		Decompressed save file data
+	:return:
+		List of (shop_id, position) tuples sorted by position
+	"""
+	shops = []
+	seen_positions = set()
+	seen_shop_ids = set()
+	pos = 0
+	chunk_size = 10000
+	overlap = 200
+
+	while pos < len(data):
+		current_chunk_size = min(chunk_size, len(data) - pos)
+
+		for alignment_offset in [0, 1]:
+			decode_start = pos + alignment_offset
+			decode_end = min(decode_start + current_chunk_size, len(data))
+
+			if decode_start >= len(data):
+				continue
+
+			text = data[decode_start:decode_end].decode('utf-16-le', errors='ignore')
+			for match in re.finditer(r'itext_([-\w]+)_(\d+)', text):
+				shop_id = match.group(1) + '_' + match.group(2)
+				actual_pos = data.find(match.group(0).encode('utf-16-le'), pos, pos + current_chunk_size)
+				if actual_pos != -1 and actual_pos not in seen_positions and shop_id not in seen_shop_ids:
+					shops.append((shop_id, actual_pos))
+					seen_positions.add(actual_pos)
+					seen_shop_ids.add(shop_id)
+
+		pos += chunk_size - overlap
+
+	return sorted(shops, key=lambda x: x[1])
+
+
+def _save_paths() -> list[Path]:
+	"""
+	Collect bundled test saves
+
+	:return:
+		Save directories and .sav archives under tests/game_files/saves
+	"""
+	saves_dir = Path(__file__).parent.parent / "game_files" / "saves"
+	if not saves_dir.exists():
+		return []
+	return sorted(p for p in saves_dir.iterdir() if p.is_dir() or p.suffix == '.sav')
+
+
+@pytest.mark.smoke
+class TestShopIdDiscoveryBenchmark:
+
+	"""
+	Compares legacy chunked shop ID discovery with the bytes regex on real saves
+
+	CRITICAL: Manual execution only - excluded from CI/CD
+	Run with: pytest -m smoke tests/smoke/test_shop_id_discovery_benchmark.py
+	"""
+
+	@pytest.mark.parametrize("save_path", _save_paths(), ids=lambda p: p.name)
+	def test_bytes_regex_matches_legacy(self, save_path: Path, mock_kb_id_index, benchmark_report) -> None:
+		"""
+		Smoke test: bytes regex discovers the same shops as the legacy decoder
+
+		The legacy decoder truncates shop IDs that straddle a 10 KB chunk
+		boundary (e.g. m_zcom_start_5 instead of m_zcom_start_519); such
+		entries must appear untruncated at the same position.
+
+		:param save_path:
+			Path to save
+		:param mock_kb_id_index:
+			Mock KbIdIndex instance
+		:param benchmark_report:
+			Reporter of benchmark timings
+		"""
+		parser = SaveDataParser(SaveFileDecompressor(), mock_kb_id_index)
+		data = SaveFileDecompressor().decompress(save_path)
+
+		start = time.perf_counter()
+		legacy = _legacy_find_all_shop_ids(data)
+		legacy_time = time.perf_counter() - start
+
+		start = time.perf_counter()
+		shops = parser._find_all_shop_ids(data)
+		new_time = time.perf_counter() - start
+
+		shops_by_pos = dict((pos, shop_id) for shop_id, pos in shops)
+		truncated = 0
+		for shop_id, pos in legacy:
+			assert pos in shops_by_pos, f"{shop_id} at {pos} not found"
+			assert shops_by_pos[pos].startswith(shop_id), \
+				f"Shop at {pos}: expected '{shop_id}', got '{shops_by_pos[pos]}'"
+			truncated += shops_by_pos[pos] != shop_id
+
+		benchmark_report(
+			f"{save_path.name}: {len(shops)} shops ({len(shops) - len(legacy)} missed by legacy, "
+			f"{truncated} truncated by legacy), legacy {legacy_time * 1000:.1f} ms, "
+			f"bytes regex {new_time * 1000:.1f} ms ({legacy_time / max(new_time, 1e-9):.0f}x)"
+		)
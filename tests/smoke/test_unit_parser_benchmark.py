@@ -0,0 +1,60 @@
+import logging
+import os
+import time
+
+import pytest
+
+from src.utils.parsers.game_data.KFSUnitParser import KFSUnitParser
+
+_UNIT_COUNT = 1000
+
+
+@pytest.mark.smoke
+class TestUnitParserBenchmark:
+
+	"""
+	Compares serial and process pool parsing of unit atom files
+
+	CRITICAL: Manual execution only - excluded from CI/CD
+	Run with: pytest -m smoke tests/smoke/test_unit_parser_benchmark.py
+	"""
+
+	@pytest.fixture
+	def game(self, synthetic_unit_game):
+		return synthetic_unit_game(_UNIT_COUNT)
+
+	@pytest.mark.parametrize("workers", sorted({2, 4, os.cpu_count() or 1}))
+	def test_parallel_matches_serial(self, game, workers: int, benchmark_report) -> None:
+		"""
+		Smoke test: the process pool returns the serial result and reports both timings
+
+		:param game:
+			File reader and localization repository of a synthetic game
+		:param workers:
+			Number of worker processes
+		:param benchmark_report:
+			Reporter of benchmark timings
+		"""
+		reader, localization_repository = game
+
+		def parse(worker_count: int) -> tuple[dict, float]:
+			parser = KFSUnitParser(
+				reader=reader,
+				localization_repository=localization_repository,
+				logger=logging.getLogger(__name__),
+				workers=worker_count
+			)
+			start = time.perf_counter()
+			result = parser.parse(1)
+			return result, time.perf_counter() - start
+
+		serial, serial_time = parse(1)
+		parallel, parallel_time = parse(workers)
+
+		assert list(parallel) == list(serial)
+		assert parallel == serial
+
+		benchmark_report(
+			f"{_UNIT_COUNT} units: serial {serial_time * 1000:.0f} ms, "
+			f"{workers} workers {parallel_time * 1000:.0f} ms ({serial_time / parallel_time:.2f}x)"
+		)
@@ -7,14 +7,14 @@ from src.utils.parsers.save_data.SaveFileDecompressor import SaveFileDecompresso
 
 
 @pytest.fixture
-def mock_item_repository():
+def mock_kb_id_index():
 	"""
-	Create mock ItemRepository that validates common item kb_ids
+	Create mock KbIdIndex that validates common item kb_ids
 
 	:return:
-		Mock ItemRepository instance
+		Mock KbIdIndex instance
 	"""
-	mock_repo = Mock()
+	mock_index = Mock()
 
 	# List of known valid item prefixes from the save file
 	valid_item_prefixes = [
@@ -44,23 +44,23 @@ def mock_item_repository():
 
 		return False
 
-	mock_repo.is_item_exists.side_effect = is_item_exists
+	mock_index.contains.side_effect = lambda entity_type, kb_id: is_item_exists(kb_id)
 
-	return mock_repo
+	return mock_index
 
 
 @pytest.fixture
-def parser(mock_item_repository):
+def parser(mock_kb_id_index):
 	"""
 	Create SaveDataParser instance for testing
 
-	:param mock_item_repository:
-		Mock ItemRepository instance
+	:param mock_kb_id_index:
+		Mock KbIdIndex instance
 	:return:
-		SaveDataParser instance with real decompressor and mock repository
+		SaveDataParser instance with real decompressor and mock index
 	"""
 	decompressor = SaveFileDecompressor()
-	return SaveDataParser(decompressor, mock_item_repository)
+	return SaveDataParser(decompressor, mock_kb_id_index)
 
 
 @pytest.fixture
@@ -1,5 +1,6 @@
 import pytest
 from src.utils.parsers import atom
+from src.utils.parsers.atom.AtomParser import AtomParser
 from src.utils.parsers.atom.exceptions import AtomSyntaxError
 
 
@@ -168,6 +169,40 @@ class TestComments:
 		result = atom.loads(content)
 		assert result == {"block": {"key": "value"}}
 
+	def test_comment_without_whitespace(self):
+		"""
+		Test that a comment ends a value it directly follows
+		"""
+		content = "block {\n  key=value//inline comment\n  path=a/b\n}"
+		result = atom.loads(content)
+		assert result == {"block": {"key": "value", "path": "a/b"}}
+
+
+class TestAtomTokenizer:
+	"""
+	Tests for the token stream of AtomParser._tokenize()
+	"""
+
+	@pytest.mark.parametrize("content, expected", [
+		("a=b", ["a", "=", "b"]),
+		("a= b", ["a", "=", "", "b"]),
+		("a={", ["a", "=", "", "{"]),
+		("a==b", ["a", "=", "=", "b"]),
+		("a=", ["a", "=", ""]),
+		("a=//comment", ["a", "=", ""]),
+		("x//y\nz", ["x", "z"]),
+		("// line comment\r\nb { c=1 }\r\n", ["b", "{", "c", "=", "1", "}"]),
+		("a=\xa0b", ["a", "=", "b"]),
+		("a=\xa0 b", ["a", "=", "b"]),
+		("path=a/b/c", ["path", "=", "a/b/c"]),
+		("", [])
+	])
+	def test_tokens(self, content, expected):
+		"""
+		Test delimiters, empty values, comments and whitespace handling
+		"""
+		assert AtomParser()._tokenize(content) == expected
+
 
 class TestIndexedLists:
 	"""
@@ -1,3 +1,6 @@
+import zipfile
+from datetime import datetime
+
 import pytest
 from pathlib import Path
 from dependency_injector import providers
@@ -5,7 +8,10 @@ from unittest.mock import Mock
 
 from src.core.Container import Container
 from src.core.Config import Config
+from src.domain.app.entities.Game import Game
+from src.utils.parsers.game_data.GameDataExtractor import GameDataExtractor
 from src.utils.parsers.game_data.KFSExtractor import KFSExtractor
+from src.utils.parsers.game_data.KFSFileSystem import KFSFileSystem
 from src.utils.parsers.game_data.KFSReader import KFSReader
 from src.utils.parsers.game_data.KFSItemsParser import KFSItemsParser
 from src.utils.parsers.game_data.KFSLocalizationParser import KFSLocalizationParser
@@ -102,6 +108,7 @@ def test_container(test_config):
 	container.config.override(providers.Singleton(lambda: test_config))
 	container.kfs_extractor.override(providers.Singleton(KFSExtractor))
 	container.kfs_reader.override(providers.Singleton(KFSReader))
+	container.kfs_file_system.override(providers.Singleton(KFSFileSystem))
 	container.kfs_items_parser.override(providers.Singleton(KFSItemsParser))
 	container.kfs_localization_parser.override(providers.Singleton(KFSLocalizationParser))
 
@@ -190,3 +197,122 @@ def extracted_game_files(kfs_extractor, test_game):
 
 	# Cleanup
 	shutil.rmtree(extraction_root, ignore_errors=True)
+
+
+@pytest.fixture
+def archive_game(tmp_path):
+	"""
+	Function-scoped fake game with a data archive, two session archives and loose files overriding each other
+
+	:param tmp_path:
+		Directory holding the game files
+	:return:
+		Game entity with id 1 and session 'darkside'
+	"""
+	game_path = tmp_path / "games" / "kb"
+
+	def write_archive(path, members):
+		path.parent.mkdir(parents=True, exist_ok=True)
+		with zipfile.ZipFile(path, "w") as archive:
+			for name, content in members.items():
+				archive.writestr(name, content.encode("utf-8"))
+
+	def write_file(path, content):
+		path.parent.mkdir(parents=True, exist_ok=True)
+		path.write_text(content, encoding="utf-8")
+
+	write_archive(game_path / "data" / "data.kfs", {
+		"items.txt": "kfs data",
+		"units/bowman.atom": "bowman",
+		"rus_items.lng": "kfs data loc",
+		"readme.doc": "ignored"
+	})
+	write_archive(game_path / "sessions" / "darkside" / "a.kfs", {"spells.txt": "first archive"})
+	write_archive(game_path / "sessions" / "darkside" / "b.kfs", {"spells.txt": "second archive"})
+	write_file(game_path / "data" / "items.txt", "loose data")
+	write_file(game_path / "sessions" / "darkside" / "mod" / "items.txt", "loose session")
+
+	return Game(
+		id=1,
+		name="Test Game",
+		path="kb",
+		last_scan_time=datetime.now(),
+		sessions=["darkside"],
+		saves_pattern="*.sav"
+	)
+
+
+@pytest.fixture
+def archive_config(tmp_path):
+	"""
+	Function-scoped mock Config pointing to the archive_game files
+
+	:param tmp_path:
+		Directory holding the game files and the extraction root
+	:return:
+		Mock Config instance
+	"""
+	config = Mock(spec=Config)
+	config.game_data_path = str(tmp_path / "games")
+	config.tmp_dir = str(tmp_path / "tmp")
+	config.data_archive_path = "{game_path}/data/data.kfs"
+	config.session_archives_pattern = "{game_path}/sessions/{session}/*.kfs"
+	config.data_path = "{game_path}/data"
+	config.session_path = "{game_path}/sessions/{session}"
+	config.read_archives_in_place = True
+	config.incremental_extraction = True
+	return config
+
+
+@pytest.fixture
+def archive_file_system(archive_config):
+	"""
+	Function-scoped KFSFileSystem for the archive_game files, unmounted after the test
+
+	:param archive_config:
+		Mock Config instance
+	:return:
+		KFSFileSystem instance
+	"""
+	file_system = KFSFileSystem(config=archive_config)
+
+	yield file_system
+
+	file_system.unmount(1)
+
+
+@pytest.fixture
+def archive_reader(archive_config, archive_file_system):
+	"""
+	Function-scoped KFSReader for the archive_game files
+
+	:param archive_config:
+		Mock Config instance
+	:param archive_file_system:
+		KFSFileSystem instance
+	:return:
+		KFSReader instance
+	"""
+	return KFSReader(config=archive_config, file_system=archive_file_system)
+
+
+@pytest.fixture
+def archive_extractor(archive_config, archive_reader, archive_file_system):
+	"""
+	Function-scoped GameDataExtractor for the archive_game files
+
+	:param archive_config:
+		Mock Config instance
+	:param archive_reader:
+		KFSReader instance
+	:param archive_file_system:
+		KFSFileSystem instance
+	:return:
+		GameDataExtractor instance
+	"""
+	return GameDataExtractor(
+		kfs_extractor=KFSExtractor(config=archive_config),
+		kfs_reader=archive_reader,
+		file_system=archive_file_system,
+		config=archive_config
+	)
@@ -0,0 +1,120 @@
+import os
+import zipfile
+
+import pytest
+
+
+class TestGameDataExtractor:
+
+	@pytest.fixture(autouse=True)
+	def extract_to_disk(self, archive_config, archive_extractor, archive_game):
+		"""
+		Extract the archive_game files to disk instead of mounting them, cleaning up after each test
+		"""
+		archive_config.read_archives_in_place = False
+
+		yield
+
+		archive_extractor.cleanup(archive_game)
+
+	@pytest.fixture
+	def game_path(self, tmp_path):
+		return tmp_path / "games" / "kb"
+
+	@pytest.fixture
+	def extraction_root(self, archive_config):
+		return os.path.join(archive_config.tmp_dir, "game_1")
+
+	def test_unchanged_game_is_skipped(self, archive_extractor, archive_reader, archive_game, extraction_root):
+		"""
+		Test that the second extraction of an unchanged game only compares the manifest
+		"""
+		first = archive_extractor.extract(archive_game)
+
+		assert first.root == extraction_root
+		assert first.refreshed == ["1-darkside", "2-darkside", "3-data", "4-data"]
+		assert os.path.exists(f"{extraction_root}.manifest.json")
+
+		second = archive_extractor.extract(archive_game)
+
+		assert second.skipped
+		assert archive_reader.read_data_files(1, ["spells.txt"], "utf-8") == ["second archive"]
+
+	def test_changed_archive_is_extracted_again(self, archive_extractor, archive_reader, archive_game, game_path):
+		"""
+		Test that only the source of a changed archive is extracted again
+		"""
+		archive_extractor.extract(archive_game)
+		archive_reader.read_data_files(1, ["spells.txt"], "utf-8")
+
+		with zipfile.ZipFile(game_path / "sessions" / "darkside" / "b.kfs", "w") as archive:
+			archive.writestr("new_spells.txt", "new spells")
+
+		extraction = archive_extractor.extract(archive_game)
+
+		assert extraction.refreshed == ["2-darkside"]
+		assert archive_reader.read_data_files(1, ["*spells.txt"], "utf-8") == ["new spells", "first archive"]
+
+	def test_changed_loose_files_are_copied(self, archive_extractor, archive_reader, archive_game, game_path, extraction_root):
+		"""
+		Test that changed loose files are copied and removed ones are deleted
+		"""
+		archive_extractor.extract(archive_game)
+		extracted_items = os.path.join(extraction_root, "data", "3-data", "items.txt")
+
+		(game_path / "sessions" / "darkside" / "mod" / "items.txt").write_text("changed session", encoding="utf-8")
+		(game_path / "sessions" / "darkside" / "units.lng").write_text("units", encoding="utf-16-le")
+		(game_path / "data" / "items.txt").unlink()
+
+		extraction = archive_extractor.extract(archive_game)
+
+		assert extraction.refreshed == ["1-darkside", "3-data"]
+		assert not os.path.exists(extracted_items)
+		assert archive_reader.read_data_files(1, ["items.txt"], "utf-8") == ["changed session", "kfs data"]
+		assert archive_reader.read_loc_files(1, ["units.lng"]) == ["units"]
+
+	def test_removed_session_is_deleted(self, archive_extractor, archive_reader, archive_game):
+		"""
+		Test that files of a session no longer played are removed
+		"""
+		archive_extractor.extract(archive_game)
+		archive_game.sessions = []
+
+		extraction = archive_extractor.extract(archive_game)
+
+		assert extraction.refreshed == ["1-darkside", "2-darkside"]
+		with pytest.raises(FileNotFoundError):
+			archive_reader.read_data_files(1, ["spells.txt"], "utf-8")
+
+	def test_full_extraction_without_manifest(self, archive_config, archive_extractor, archive_game, extraction_root):
+		"""
+		Test that the game is extracted from scratch when the manifest is missing or incremental mode is off
+		"""
+		archive_extractor.extract(archive_game)
+		stray_path = os.path.join(extraction_root, "data", "4-data", "stray.txt")
+		open(stray_path, "w").close()
+
+		archive_config.incremental_extraction = False
+		extraction = archive_extractor.extract(archive_game)
+
+		assert not extraction.skipped
+		assert not os.path.exists(stray_path)
+
+		archive_config.incremental_extraction = True
+		os.remove(f"{extraction_root}.manifest.json")
+
+		assert not archive_extractor.extract(archive_game).skipped
+
+	def test_unchanged_mount_is_kept(self, archive_config, archive_extractor, archive_file_system, archive_game, game_path):
+		"""
+		Test that reading in place mounts the game again only after a source changed
+		"""
+		archive_config.read_archives_in_place = True
+
+		assert not archive_extractor.extract(archive_game).skipped
+		assert archive_extractor.extract(archive_game).skipped
+
+		(game_path / "data" / "items.txt").write_text("changed data", encoding="utf-8")
+
+		assert archive_extractor.extract(archive_game).refreshed == ["3-data"]
+		assert archive_file_system.read_bytes(1, "data/3-data/items.txt") == b"changed data"
@@ -0,0 +1,69 @@
+import os
+import zipfile
+
+import pytest
+
+
+class TestKFSFileSystem:
+
+	def test_mount_mirrors_extraction_layout(self, archive_file_system, archive_game):
+		"""
+		Test that files get the virtual paths extraction would write them to
+		"""
+		archive_file_system.mount(archive_game)
+
+		assert archive_file_system.list_files(1, "data") == {
+			"items.txt": [(4, "data/4-data/items.txt"), (3, "data/3-data/items.txt"), (1, "data/1-darkside/items.txt")],
+			"bowman.atom": [(4, "data/4-data/bowman.atom")],
+			"spells.txt": [(2, "data/2-darkside/spells.txt")]
+		}
+		assert archive_file_system.list_files(1, "loc") == {"rus_items.lng": [(4, "loc/4-data/rus_items.lng")]}
+		assert archive_file_system.read_bytes(1, "data/2-darkside/spells.txt") == b"second archive"
+
+	def test_reads_match_extraction(self, archive_extractor, archive_config, archive_reader, archive_game):
+		"""
+		Test that reading in place returns the same files in the same order as reading the extraction
+		"""
+		requests = [("data", ["items.txt"]), ("data", ["*.atom", "spells*.txt"]), ("loc", ["rus_*.lng"])]
+
+		def read_all():
+			return [
+				archive_reader.read_data_files(1, patterns, "utf-8") if kind == "data" else archive_reader.read_loc_files(1, patterns, "utf-8")
+				for kind, patterns in requests
+			]
+
+		extraction = archive_extractor.extract(archive_game)
+		in_place = read_all()
+
+		assert extraction.root == os.path.join(archive_config.game_data_path, "kb")
+		assert not os.path.exists(os.path.join(archive_config.tmp_dir, "game_1"))
+
+		archive_config.read_archives_in_place = False
+		archive_extractor.extract(archive_game)
+
+		assert read_all() == in_place
+		assert in_place[0] == ["loose session", "loose data", "kfs data"]
+
+		archive_extractor.cleanup(archive_game)
+
+	def test_unmount(self, archive_file_system, archive_reader, archive_game):
+		"""
+		Test that an unmounted game is read from the extraction directory again
+		"""
+		archive_file_system.mount(archive_game)
+		archive_file_system.unmount(1)
+
+		assert not archive_file_system.is_mounted(1)
+		with pytest.raises(FileNotFoundError, match="Directory not found"):
+			archive_reader.read_data_files(1, ["items.txt"])
+
+	def test_invalid_archive(self, archive_file_system, archive_game, tmp_path):
+		"""
+		Test that a broken archive fails the mount
+		"""
+		(tmp_path / "games" / "kb" / "sessions" / "darkside" / "c.kfs").write_bytes(b"not a zip")
+
+		with pytest.raises(zipfile.BadZipFile, match="c.kfs"):
+			archive_file_system.mount(archive_game)
+
+		assert not archive_file_system.is_mounted(1)
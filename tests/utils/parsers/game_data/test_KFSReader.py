@@ -1,7 +1,12 @@
 import shutil
+from unittest.mock import Mock
 
 import pytest
 
+from src.core.Config import Config
+from src.utils.parsers.game_data.KFSFileSystem import KFSFileSystem
+from src.utils.parsers.game_data.KFSReader import KFSReader
+
 
 class TestKFSReader:
 
@@ -207,3 +212,65 @@ class TestKFSReader:
 		for result in results:
 			assert isinstance(result, str)
 			assert len(result) > 0
+
+
+class TestKFSReaderIndex:
+
+	@pytest.fixture
+	def extraction_root(self, tmp_path):
+		"""
+		Fake extraction of game 1 with the same file in several priority directories
+		"""
+		files = {
+			"data/4-data/items.txt": "kfs data",
+			"data/1-darkside/items.txt": "loose session",
+			"data/2-darkside/items_addon.txt": "kfs session",
+			"data/2-darkside/spells.txt": "spells"
+		}
+		for relative, content in files.items():
+			path = tmp_path / "game_1" / relative
+			path.parent.mkdir(parents=True, exist_ok=True)
+			path.write_text(content, encoding="utf-8")
+
+		return tmp_path / "game_1"
+
+	@pytest.fixture
+	def reader(self, tmp_path):
+		config = Mock(spec=Config)
+		config.tmp_dir = str(tmp_path)
+		return KFSReader(config=config, file_system=KFSFileSystem(config=config))
+
+	def test_files_are_ordered_by_priority(self, reader, extraction_root):
+		"""
+		Test that a file name found in several priority directories is read lowest priority first
+		"""
+		assert reader.read_data_files(1, ["items.txt"], "utf-8") == ["loose session", "kfs data"]
+
+	def test_fnmatch_patterns(self, reader, extraction_root):
+		"""
+		Test that wildcard patterns match indexed file names and duplicates are read once
+		"""
+		results = reader.read_data_files(1, ["items*.txt", "items.txt", "spell?.txt"], "utf-8")
+
+		assert results == ["loose session", "kfs session", "spells", "kfs data"]
+
+	def test_index_is_reused_until_invalidated(self, reader, extraction_root):
+		"""
+		Test that the directory is walked once and rewalked after invalidation
+		"""
+		reader.read_data_files(1, ["items.txt"], "utf-8")
+		(extraction_root / "data" / "4-data" / "new_spells.txt").write_text("new", encoding="utf-8")
+
+		with pytest.raises(FileNotFoundError):
+			reader.read_data_files(1, ["new_spells.txt"], "utf-8")
+
+		reader.invalidate(1)
+
+		assert reader.read_data_files(1, ["new_spells.txt"], "utf-8") == ["new"]
+
+	def test_missing_directory(self, reader):
+		"""
+		Test that a game without extracted files is not indexed
+		"""
+		with pytest.raises(FileNotFoundError, match="Directory not found"):
+			reader.read_loc_files(1, ["rus_items.lng"])
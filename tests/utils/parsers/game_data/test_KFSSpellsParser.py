@@ -1,6 +1,7 @@
 import pytest
 
 from src.utils.parsers.game_data.KFSSpellsParser import KFSSpellsParser
+from src.utils.parsers.game_data.KFSFileSystem import KFSFileSystem
 from src.utils.parsers.game_data.KFSReader import KFSReader
 from src.domain.game.entities.Localization import Localization
 from src.core.Config import Config
@@ -71,7 +72,7 @@ class TestKFSSpellsParser:
 	@pytest.fixture
 	def kfs_reader(self, test_config):
 		"""Create KFSReader with test config"""
-		return KFSReader(config=test_config)
+		return KFSReader(config=test_config, file_system=KFSFileSystem(config=test_config))
 
 	@pytest.fixture
 	def mock_localization_repo(self):
@@ -1,6 +1,9 @@
+import logging
+
 import pytest
 
 from src.utils.parsers.game_data.KFSUnitParser import KFSUnitParser
+from src.utils.parsers.game_data.KFSFileSystem import KFSFileSystem
 from src.utils.parsers.game_data.KFSReader import KFSReader
 from src.domain.game.entities.Localization import Localization
 from src.domain.game.entities.UnitClass import UnitClass
@@ -58,7 +61,7 @@ class TestKFSUnitParser:
 	@pytest.fixture
 	def kfs_reader(self, test_config):
 		"""Create KFSReader with test config"""
-		return KFSReader(config=test_config)
+		return KFSReader(config=test_config, file_system=KFSFileSystem(config=test_config))
 
 	@pytest.fixture
 	def mock_localization_repo(self):
@@ -241,3 +244,38 @@ class TestKFSUnitParser:
 		assert 'light_header/light_hint' in unit_data['params']['features_hints']
 		assert 'shot_header/shot_bowman_hint' in unit_data['params']['features_hints']
 		assert 'throw1' in unit_data['params']['attacks']
+
+
+class TestKFSUnitParserWorkers:
+
+	@pytest.fixture
+	def game(self, synthetic_unit_game):
+		"""Create a game with synthetic unit files extracted to tmp_path/game_1"""
+		return synthetic_unit_game(40)
+
+	def create_parser(self, game, workers: int) -> KFSUnitParser:
+		reader, localization_repository = game
+		return KFSUnitParser(
+			reader=reader,
+			localization_repository=localization_repository,
+			logger=logging.getLogger(__name__),
+			workers=workers
+		)
+
+	def test_parallel_parse_matches_serial(self, game):
+		"""Test that worker processes return the same units in the same order"""
+		serial = self.create_parser(game, workers=1).parse(1)
+		parallel = self.create_parser(game, workers=2).parse(1)
+
+		assert list(parallel) == list(serial)
+		assert parallel == serial
+		assert len(serial) == 36
+		assert serial['unit_3']['params']['attacks'] == ['moveattack', 'shot_3']
+		assert serial['unit_3']['unit_class'] == UnitClass.CHESSPIECE
+
+	def test_parallel_parse_raises_invalid_units(self, game, tmp_path):
+		"""Test that an invalid unit file fails the parse in a worker process"""
+		(tmp_path / 'game_1' / 'data' / '4-data' / 'unit_5.atom').write_text('arena_params { }', encoding='utf-16-le')
+
+		with pytest.raises(ValueError, match="Unit 'unit_5': atom file missing 'main' section"):
+			self.create_parser(game, workers=2).parse(1)
@@ -0,0 +1,141 @@
+import os
+import struct
+import zlib
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from src.utils.parsers.save_data.CachingSaveFileDecompressor import CachingSaveFileDecompressor
+from src.utils.parsers.save_data.DataFileType import DataFileType
+from src.utils.parsers.save_data.ISaveFileDecompressor import ISaveFileDecompressor
+from src.utils.parsers.save_data.SaveFileDecompressor import SaveFileDecompressor
+
+
+@pytest.fixture
+def inner() -> Mock:
+	decompressor = Mock(spec=ISaveFileDecompressor)
+	decompressor.decompress.side_effect = lambda path, data_type=DataFileType.DATA: \
+		f"{path.name}:{data_type.name}".encode() * 10
+	return decompressor
+
+
+def _save(tmp_path: Path, name: str) -> Path:
+	path = tmp_path / f"{name}.sav"
+	path.write_bytes(b'archive')
+	return path
+
+
+class TestCachingSaveFileDecompressor:
+
+	def test_repeat_decompress_hits_cache(self, inner, tmp_path):
+		"""
+		Test that an unchanged save is decompressed once per data type
+		"""
+		cache = CachingSaveFileDecompressor(inner, max_bytes=1024)
+		save = _save(tmp_path, "quick1")
+
+		first = cache.decompress(save)
+		assert cache.decompress(save) is first
+		cache.decompress(save, DataFileType.INFO)
+
+		assert inner.decompress.call_count == 2
+		assert cache.hits == 1
+		assert cache.misses == 2
+
+	def test_modified_save_is_decompressed_again(self, inner, tmp_path):
+		"""
+		Test that changing mtime or size of a save invalidates its entry
+		"""
+		cache = CachingSaveFileDecompressor(inner, max_bytes=1024)
+		save = _save(tmp_path, "quick1")
+		cache.decompress(save)
+
+		stat = save.stat()
+		os.utime(save, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+		cache.decompress(save)
+
+		save.write_bytes(b'longer archive')
+		os.utime(save, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+		cache.decompress(save)
+
+		assert inner.decompress.call_count == 3
+		assert cache.hits == 0
+
+	def test_save_directory_file_change_invalidates_entry(self, inner, tmp_path):
+		"""
+		Test that rewriting a file inside a save directory invalidates its entry
+		"""
+		cache = CachingSaveFileDecompressor(inner, max_bytes=1024)
+		(tmp_path / "data").write_bytes(b'data')
+		cache.decompress(tmp_path)
+
+		(tmp_path / "data").write_bytes(b'new data')
+		cache.decompress(tmp_path)
+
+		assert inner.decompress.call_count == 2
+
+	def test_eviction_is_bounded_by_bytes(self, inner, tmp_path):
+		"""
+		Test that least recently used entries are evicted to fit max_bytes
+		"""
+		# Each entry is "a.sav:DATA" * 10, i.e. 100 bytes, so only two fit
+		saves = [_save(tmp_path, name) for name in ("a", "b", "c")]
+		cache = CachingSaveFileDecompressor(inner, max_bytes=250)
+
+		cache.decompress(saves[0])
+		cache.decompress(saves[1])
+		cache.decompress(saves[0])
+		cache.decompress(saves[2])
+
+		assert cache.size == 200
+		cache.decompress(saves[0])
+		cache.decompress(saves[1])
+
+		assert cache.hits == 2
+		assert cache.misses == 4
+
+	def test_oversized_data_is_not_cached(self, inner, tmp_path):
+		"""
+		Test that data larger than max_bytes bypasses the cache
+		"""
+		cache = CachingSaveFileDecompressor(inner, max_bytes=10)
+		save = _save(tmp_path, "quick1")
+
+		cache.decompress(save)
+		cache.decompress(save)
+
+		assert inner.decompress.call_count == 2
+		assert cache.size == 0
+
+	def test_cached_data_is_immutable(self, tmp_path):
+		"""
+		Test that a returned buffer cannot be modified, so cache hits stay intact
+		"""
+		payload = b'.items' + bytes(1024)
+		compressed = zlib.compress(payload)
+		(tmp_path / "data").write_bytes(b'slcb' + struct.pack('<II', len(payload), len(compressed)) + compressed)
+		cache = CachingSaveFileDecompressor(SaveFileDecompressor(), max_bytes=len(payload))
+
+		first = cache.decompress(tmp_path)
+		with pytest.raises(TypeError):
+			first[0] = 0
+		with pytest.raises(AttributeError):
+			first.clear()
+
+		assert cache.decompress(tmp_path) == payload
+
+	def test_mutable_buffer_is_frozen(self, inner, tmp_path):
+		"""
+		Test that a bytearray of the wrapped decompressor is cached as a copy
+		"""
+		buffer = bytearray(b'save data')
+		inner.decompress.side_effect = None
+		inner.decompress.return_value = buffer
+		cache = CachingSaveFileDecompressor(inner, max_bytes=1024)
+		save = _save(tmp_path, "quick1")
+
+		assert type(cache.decompress(save)) is bytes
+		buffer.clear()
+
+		assert cache.decompress(save) == b'save data'
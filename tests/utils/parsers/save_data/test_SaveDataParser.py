@@ -0,0 +1,120 @@
+import struct
+import tracemalloc
+import zlib
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from src.utils.parsers.save_data.SaveDataParser import SaveDataParser
+from src.utils.parsers.save_data.SaveFileDecompressor import SaveFileDecompressor
+
+
+def _lp(value: bytes) -> bytes:
+	return struct.pack('<I', len(value)) + value
+
+
+def _field(name: bytes, value: bytes) -> bytes:
+	return _lp(name) + _lp(value)
+
+
+def _shop(shop_num: int) -> bytes:
+	"""
+	Build one itext_ shop with garrison, items, units and spells sections
+
+	:param shop_num:
+		Shop number used in itext_m_portland_{shop_num}
+	:return:
+		Shop bytes
+	"""
+	items = b''.join(
+		_lp(name) + _field(b'count', b'\x01\x00\x00\x00') + _field(b'slruck', b'197,%d' % quantity)
+		for name, quantity in ((b'moon_sword', 1), (b'snake_ring', 3))
+	)
+	spells = _lp(b'spell_slow') + struct.pack('<I', 2)
+	return (
+		b'.garrison' + _field(b'strg', b'bowman/15/imp/3') + b'\x00' * 16
+		+ b'.items' + items + b'\x00' * 24
+		+ b'.shopunits' + _field(b'strg', b'dark_elf/100') + b'\x00' * 16
+		+ b'.spells' + spells + b'\x00' * 24
+		+ b'.temp' + b'\x00' * 64
+		+ f'itext_m_portland_{shop_num}'.encode('utf-16-le')
+		+ b'\xee' * 16384
+	)
+
+
+@pytest.fixture(scope="module")
+def save_data() -> bytes:
+	"""
+	Synthetic decompressed save with a thousand shops
+
+	Shops are padded with non-shop data so that, like a real save, the
+	parsed result is small compared to the decompressed buffer.
+
+	:return:
+		Decompressed save bytes
+	"""
+	return b'\x00' * 1024 + b''.join(_shop(i) for i in range(1000))
+
+
+@pytest.fixture
+def save_path(tmp_path: Path, save_data: bytes) -> Path:
+	"""
+	Write synthetic save directory with compressed 'data' file
+
+	:param tmp_path:
+		Pytest temporary directory
+	:param save_data:
+		Decompressed save bytes
+	:return:
+		Path to save directory
+	"""
+	compressed = zlib.compress(save_data)
+	(tmp_path / 'data').write_bytes(
+		b'slcb' + struct.pack('<II', len(save_data), len(compressed)) + compressed
+	)
+	return tmp_path
+
+
+@pytest.fixture
+def parser() -> SaveDataParser:
+	kb_id_index = Mock()
+	kb_id_index.contains.return_value = True
+	return SaveDataParser(SaveFileDecompressor(), kb_id_index)
+
+
+class TestSaveDataParser:
+
+	def test_parse_synthetic_shops(self, parser, save_path):
+		"""
+		Test that every section of every shop is parsed
+		"""
+		result = parser.parse(save_path)
+
+		assert len(result.shops) == 1000
+		shop = result.shops[42]
+		assert shop['itext'] == 'm_portland_42'
+		assert shop['location'] == 'm_portland'
+		assert shop['inventory'] == {
+			'garrison': [{'name': 'bowman', 'quantity': 15}, {'name': 'imp', 'quantity': 3}],
+			'items': [{'name': 'moon_sword', 'quantity': 1}, {'name': 'snake_ring', 'quantity': 3}],
+			'units': [{'name': 'dark_elf', 'quantity': 100}],
+			'spells': [{'name': 'spell_slow', 'quantity': 2}]
+		}
+
+	def test_parse_peak_memory_bounded_by_save_size(self, parser, save_path, save_data):
+		"""
+		Test that parsing does not copy the decompressed buffer around
+
+		Peak traced allocation must stay within a small multiple of the
+		decompressed save size.
+		"""
+		tracemalloc.start()
+		try:
+			parser.parse(save_path)
+			_, peak = tracemalloc.get_traced_memory()
+		finally:
+			tracemalloc.stop()
+
+		assert peak < 2 * len(save_data), \
+			f"Peak allocation {peak} is {peak / len(save_data):.2f}x the decompressed size"
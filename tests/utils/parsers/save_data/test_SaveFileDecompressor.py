@@ -0,0 +1,95 @@
+import struct
+import tempfile
+import zipfile
+import zlib
+from pathlib import Path
+
+import pytest
+
+from src.utils.parsers.save_data.DataFileType import DataFileType
+from src.utils.parsers.save_data.SaveFileDecompressor import SaveFileDecompressor
+
+
+# Highly compressible, so a single compressed chunk inflates to many output chunks
+PAYLOAD = b'.items' + bytes(range(256)) * 4096 + bytes(1024 * 1024)
+INFO = b'raw info payload'
+
+
+def _slcb(payload: bytes) -> bytes:
+	compressed = zlib.compress(payload)
+	return b'slcb' + struct.pack('<II', len(payload), len(compressed)) + compressed
+
+
+@pytest.fixture
+def decompressor() -> SaveFileDecompressor:
+	return SaveFileDecompressor()
+
+
+@pytest.fixture
+def save_archive(tmp_path: Path) -> Path:
+	path = tmp_path / "quick1.sav"
+	with zipfile.ZipFile(path, 'w') as zip_file:
+		zip_file.writestr("data", _slcb(PAYLOAD))
+		zip_file.writestr("info", INFO)
+	return path
+
+
+class TestSaveFileDecompressor:
+
+	def test_decompress_directory(self, decompressor, tmp_path):
+		"""
+		Test that data and info files are read from a save directory
+		"""
+		(tmp_path / "savedata").write_bytes(_slcb(PAYLOAD))
+		(tmp_path / "saveinfo").write_bytes(INFO)
+
+		data = decompressor.decompress(tmp_path)
+
+		assert type(data) is bytes
+		assert data == PAYLOAD
+		assert decompressor.decompress(tmp_path, DataFileType.INFO) == INFO
+
+	def test_decompress_archive_without_extracting(self, decompressor, save_archive, monkeypatch):
+		"""
+		Test that .sav members are streamed without touching a temp directory
+		"""
+		def fail(*args, **kwargs):
+			raise AssertionError("Archive must not be extracted to disk")
+
+		monkeypatch.setattr(tempfile, "mkdtemp", fail)
+		monkeypatch.setattr(zipfile.ZipFile, "extractall", fail)
+
+		assert decompressor.decompress(save_archive) == PAYLOAD
+		assert decompressor.decompress(save_archive, DataFileType.INFO) == INFO
+
+	def test_decompress_rejects_size_mismatch(self, decompressor, tmp_path):
+		"""
+		Test that output larger than the header size is rejected
+		"""
+		data = bytearray(_slcb(PAYLOAD))
+		data[4:8] = struct.pack('<I', len(PAYLOAD) - 1)
+		(tmp_path / "data").write_bytes(bytes(data))
+
+		with pytest.raises(ValueError, match="Size mismatch"):
+			decompressor.decompress(tmp_path)
+
+	def test_decompress_rejects_oversized_header(self, decompressor, tmp_path):
+		"""
+		Test that a declared size above the limit is rejected before allocating the output
+		"""
+		data = bytearray(_slcb(PAYLOAD))
+		data[4:8] = struct.pack('<I', SaveFileDecompressor.MAX_DECOMPRESSED_SIZE + 1)
+		(tmp_path / "data").write_bytes(bytes(data))
+
+		with pytest.raises(ValueError, match="Decompressed data too large"):
+			decompressor.decompress(tmp_path)
+
+	def test_decompress_rejects_invalid_archive(self, decompressor, tmp_path):
+		"""
+		Test that a corrupt .sav archive raises ValueError
+		"""
+		path = tmp_path / "broken.sav"
+		path.write_bytes(b'not a zip')
+
+		with pytest.raises(ValueError, match="Invalid ZIP archive"):
+			decompressor.decompress(path)
@@ -0,0 +1,52 @@
+import struct
+
+from src.utils.parsers.save_data.SaveRecordScanner import SaveRecordScanner
+
+
+def _lp(value: bytes) -> bytes:
+	return struct.pack('<I', len(value)) + value
+
+
+class TestSaveRecordScanner:
+
+	def test_scan_records_skips_rejected_keys(self):
+		"""
+		Test that records are found and rejected keys are skipped
+		"""
+		data = (
+			b'.items' + _lp(b'moon_sword') + _lp(b'count') + _lp(b'\x01\x00\x00\x00')
+			+ b'\xff\x07\x00\x00\x00ab' + _lp(b'snake_ring') + b'\x00' * 24
+		)
+		scanner = SaveRecordScanner(data)
+
+		records = list(scanner.scan_records(6, len(data), lambda key: key != 'count'))
+
+		assert [r.key for r in records] == ['moon_sword', 'snake_ring']
+		assert records[0].pos == 6
+		assert records[0].end == 6 + 4 + len('moon_sword')
+
+	def test_scan_records_reads_validated_value(self):
+		"""
+		Test that fixed-size values are read and validated
+		"""
+		data = _lp(b'spell_slow') + struct.pack('<I', 3) + _lp(b'spell_haste') + struct.pack('<I', 0) + b'\x00' * 24
+		scanner = SaveRecordScanner(data)
+
+		records = list(scanner.scan_records(
+			0, len(data), lambda key: True, value=scanner.U32, is_valid_value=lambda q: q > 0
+		))
+
+		assert [(r.key, r.value) for r in records] == [('spell_slow', 3)]
+
+	def test_read_string_field(self):
+		"""
+		Test reading a length-prefixed field value
+		"""
+		data = b'\x00\x00' + _lp(b'slruck') + _lp(b'197,6')
+		scanner = SaveRecordScanner(data)
+
+		value_pos = scanner.find_field(b'slruck', 0, len(data))
+
+		assert scanner.read_string(value_pos, 1, 20) == '197,6'
+		assert scanner.read_string(value_pos, 1, 4) is None
+		assert scanner.find_field(b'strg', 0, len(data)) is None
@@ -0,0 +1,53 @@
+from src.utils.parsers.save_data.SaveSectionIndex import SaveSectionIndex
+
+
+class TestSaveSectionIndex:
+
+	def test_positions_recorded_for_every_marker(self):
+		"""
+		Test that a single pass records all marker occurrences in order
+		"""
+		data = b'.items..temp.items' + 'itext_loc_1'.encode('utf-16-le') + b'building_trader@5lt'
+		index = SaveSectionIndex(data)
+
+		assert index.positions(index.ITEMS) == [0, 12]
+		assert index.positions(index.TEMP) == [7]
+		assert index.positions(index.SHOP_ITEXT) == [18]
+		assert index.positions(index.BUILDING_TRADER) == [40]
+		assert index.positions(index.LT) == [57]
+		assert index.positions(index.GARRISON) == []
+
+	def test_find_preceding_respects_range(self):
+		"""
+		Test that find_preceding only returns markers fully inside the window
+		"""
+		data = b'.items' + b'\x00' * 20 + b'.items' + b'\x00' * 10
+		index = SaveSectionIndex(data)
+
+		assert index.find_preceding(index.ITEMS, len(data), 5000) == 26
+		assert index.find_preceding(index.ITEMS, 30, 5000) == 0
+		assert index.find_preceding(index.ITEMS, 30, 10) is None
+
+	def test_find_next_respects_range(self):
+		"""
+		Test that find_next only returns markers fully inside the window
+		"""
+		data = b'\x00' * 4 + b'.spells' + b'\x00' * 4
+		index = SaveSectionIndex(data)
+
+		assert index.find_next(index.SPELLS, 0, len(data)) == 4
+		assert index.find_next(index.SPELLS, 0, 10) is None
+		assert index.find_next(index.SPELLS, 5, len(data)) is None
+
+	def test_contains_shop_itext_requires_complete_shop_id(self):
+		"""
+		Test that only complete itext_{location}_{id} shop IDs are detected
+		"""
+		shop = 'itext_m_portland_8671'.encode('utf-16-le')
+		data = b'\x00' + shop + b'\x00' + 'itext_broken'.encode('utf-16-le')
+		index = SaveSectionIndex(data)
+
+		assert index.contains_shop_itext(0, len(data))
+		assert index.contains_shop_itext(1, 1 + len('itext_m_portland_8'.encode('utf-16-le')))
+		assert not index.contains_shop_itext(1, 1 + len('itext_m_portland_'.encode('utf-16-le')))
+		assert not index.contains_shop_itext(2, len(data))
@@ -0,0 +1,122 @@
+import sqlite3
+
+import pytest
+from sqlalchemy import inspect, text
+
+import src.core.DefaultInstaller  # noqa: F401 - imports repositories, registering all tables in metadata
+from src.domain.exceptions import InvalidRegexException
+from src.domain.game.entities.Propbit import Propbit
+from src.domain.game.repositories.mappers.ItemMapper import PROPBIT_BITS
+from src.utils.db import GameDatabaseRegistry, _compile_regexp, validate_regexp
+
+
+class TestGameDatabaseRegistry:
+
+	def test_added_columns_are_backfilled_and_indexed(self, tmp_path):
+		"""Test that item texts and propbit masks are computed for databases created before the columns existed"""
+		with sqlite3.connect(tmp_path / "game_1.db") as connection:
+			connection.executescript("""
+				CREATE TABLE localization (
+					id INTEGER PRIMARY KEY, kb_id VARCHAR(255) NOT NULL UNIQUE,
+					text TEXT NOT NULL, source VARCHAR(255), tag VARCHAR(255)
+				);
+				CREATE TABLE item_set (id INTEGER PRIMARY KEY, kb_id VARCHAR NOT NULL UNIQUE);
+				CREATE TABLE item (
+					id INTEGER PRIMARY KEY, kb_id VARCHAR NOT NULL UNIQUE, price INTEGER NOT NULL,
+					propbits JSON, tiers JSON, item_set_id INTEGER, level INTEGER NOT NULL
+				);
+				INSERT INTO localization (kb_id, text) VALUES
+					('itm_sword_name', 'Sword'), ('itm_sword_hint', 'Sharp'), ('itm_set_name', 'Set');
+				INSERT INTO item_set (kb_id) VALUES ('set');
+				INSERT INTO item (kb_id, price, level, propbits) VALUES
+					('sword', 1, 1, '["weapon", "rare"]'), ('junk', 1, 1, NULL);
+			""")
+		connection.close()
+
+		registry = GameDatabaseRegistry(str(tmp_path))
+		session_factory = registry.get_session_factory("game_1")
+
+		with session_factory() as session:
+			items = session.execute(text("SELECT kb_id, name, hint, propbit_mask FROM item ORDER BY id")).all()
+			item_sets = session.execute(text("SELECT kb_id, name, hint FROM item_set")).all()
+			indexes = {index["name"] for index in inspect(session.get_bind()).get_indexes("item")}
+
+		registry.drop("game_1")
+
+		assert items == [
+			("sword", "Sword", "Sharp", PROPBIT_BITS[Propbit.WEAPON] | PROPBIT_BITS[Propbit.RARE]),
+			("junk", None, None, 0)
+		]
+		assert item_sets == [("set", "Set", None)]
+		assert "ix_item_name" in indexes
+
+	def test_unit_resistances_are_backfilled(self, tmp_path):
+		"""Test that resistance columns are extracted from the resistance JSON of existing units"""
+		with sqlite3.connect(tmp_path / "game_1.db") as connection:
+			connection.executescript("""
+				CREATE TABLE unit (
+					id INTEGER PRIMARY KEY, kb_id VARCHAR(255) NOT NULL UNIQUE, name VARCHAR(255) NOT NULL,
+					unit_class VARCHAR(50) NOT NULL, params JSON NOT NULL, main JSON NOT NULL, resistance JSON
+				);
+				INSERT INTO unit (kb_id, name, unit_class, params, main, resistance) VALUES
+					('dragon', 'Dragon', 'chesspiece', '{}', '{}', '{"fire": 80, "physical": 30.5}'),
+					('ghost', 'Ghost', 'chesspiece', '{}', '{}', NULL);
+			""")
+		connection.close()
+
+		registry = GameDatabaseRegistry(str(tmp_path))
+		with registry.get_session_factory("game_1")() as session:
+			units = session.execute(text(
+				"SELECT kb_id, resistance_fire, resistance_physical, resistance_magic FROM unit ORDER BY id"
+			)).all()
+			indexes = {index["name"] for index in inspect(session.get_bind()).get_indexes("unit")}
+
+		registry.drop("game_1")
+
+		assert units == [("dragon", 80, 30.5, None), ("ghost", None, None, None)]
+		assert "ix_unit_resistance_fire" in indexes
+
+	def test_search_text_is_filled_for_scanned_databases(self, tmp_path):
+		"""Test that databases created before the full-text index get it built from their rows"""
+		GameDatabaseRegistry(str(tmp_path)).ensure_database("game_1")
+		with sqlite3.connect(tmp_path / "game_1.db") as connection:
+			connection.executescript("""
+				DROP TABLE search_text;
+				INSERT INTO item (kb_id, price, level, name, hint) VALUES ('sword', 1, 1, 'Ёлочный меч', 'Острый');
+			""")
+		connection.close()
+
+		registry = GameDatabaseRegistry(str(tmp_path))
+		with registry.get_session_factory("game_1")() as session:
+			rows = session.execute(text(
+				"SELECT entity_type, entity_id, name FROM search_text WHERE search_text MATCH 'меч*'"
+			)).all()
+
+		registry.drop("game_1")
+
+		assert rows == [("item", 1, "Елочный меч")]
+
+	def test_regexp_patterns_are_compiled_once(self, tmp_path):
+		"""Test that the REGEXP callback matches case-insensitively without recompiling per row"""
+		registry = GameDatabaseRegistry(str(tmp_path))
+		_compile_regexp.cache_clear()
+
+		with registry.get_session_factory("game_1")() as session:
+			session.execute(text(
+				"INSERT INTO item (kb_id, price, level, name, hint) VALUES "
+				"('a', 1, 1, 'A', 'Fire damage'), ('b', 1, 1, 'B', 'FIRE resistance'), ('c', 1, 1, 'C', NULL)"
+			))
+			kb_ids = session.execute(text("SELECT kb_id FROM item WHERE hint REGEXP 'fire' ORDER BY kb_id")).scalars().all()
+
+		registry.drop("game_1")
+
+		assert kb_ids == ["a", "b"]
+		assert _compile_regexp.cache_info().misses == 1
+
+	def test_invalid_regexp_is_rejected_before_query(self):
+		"""Test that invalid patterns raise the domain exception"""
+		validate_regexp("fire|ice")
+		with pytest.raises(InvalidRegexException) as exc_info:
+			validate_regexp("fire(")
+
+		assert exc_info.value.pattern == "fire("